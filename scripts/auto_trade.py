@@ -283,157 +283,163 @@ async def run_auto_trade(args: argparse.Namespace):
     kis_config = load_kis_config()
     kis_client = KISAPIClient(kis_config)
 
-    # AutoTrader 초기화 (--live 미사용 시 dry_run=True)
-    trader = AutoTrader(
-        kis_client=kis_client,
-        dry_run=not args.live,
-        max_order_amount=args.max_amount,
-        kill_switch=kill_switch,
-        vi_cb_detector=vi_cb_detector,
-    )
-
-    # 데이터 페처
-    data_fetcher = DataFetcher()
-
-    # 대상 종목 결정
-    symbols = args.symbols if args.symbols else get_default_symbols()
-
-    # 대상 시스템 결정
-    systems = [args.system] if args.system else [1, 2]
+    try:
+        # AutoTrader 초기화 (--live 미사용 시 dry_run=True)
+        trader = AutoTrader(
+            kis_client=kis_client,
+            dry_run=not args.live,
+            max_order_amount=args.max_amount,
+            kill_switch=kill_switch,
+            vi_cb_detector=vi_cb_detector,
+        )
 
-    logger.info(f"자동매매 시작: {len(symbols)}개 종목, System {systems}")
-    logger.info(f"모드: {'LIVE' if args.live else 'DRY-RUN'}")
+        # 데이터 페처
+        data_fetcher = DataFetcher()
+
+        # 대상 종목 결정
+        symbols = args.symbols if args.symbols else get_default_symbols()
+
+        # 대상 시스템 결정
+        systems = [args.system] if args.system else [1, 2]
+
+        logger.info(f"자동매매 시작: {len(symbols)}개 종목, System {systems}")
+        logger.info(f"모드: {'LIVE' if args.live else 'DRY-RUN'}")
+
+        # 계좌 요약 조회
+        account = await trader.get_account_summary()
+        account_balance = account.get("total_equity")
+        if account_balance is None or account_balance <= 0:
+            if not trader.dry_run:
+                logger.error("계좌 잔고 조회 실패 - 실거래 중단")
+                sys.exit(1)
+            account_balance = 10_000_000
+            logger.warning(f"Dry-run 계좌 잔고 (가정): {account_balance:,.0f} KRW")
+        elif account.get("dry_run"):
+            logger.info(f"Dry-run 계좌 잔고 (가정): {account_balance:,.0f} KRW")
+        else:
+            logger.info(f"계좌 잔고: {account_balance:,.0f} KRW")
+
+        # 주문 결과 집계
+        placed_orders = []
+        skipped_signals = []
+
+        # 각 종목별 시그널 체크 및 주문 실행
+        for symbol in symbols:
+            try:
+                logger.info(f"종목 처리 중: {symbol}")
+
+                # VI/CB 상태 조회 (KR 종목만)
+                if symbol.endswith((".KS", ".KQ")):
+                    try:
+                        raw = symbol.replace(".KS", "").replace(".KQ", "")
+                        price_data = await kis_client.get_korea_price(raw)
+                        if price_data:
+                            vi_cb_detector.update_from_spot(symbol, price_data)
+                    except Exception as e:
+                        logger.debug(f"VI 상태 조회 실패: {symbol} - {e}")
+
+                # 데이터 페칭 (6개월)
+                df = data_fetcher.fetch(symbol, period="6mo")
+                if df is None or df.empty:
+                    logger.warning(f"데이터 없음: {symbol}")
+                    continue
 
-    # 계좌 요약 조회
-    account = await trader.get_account_summary()
-    account_balance = account.get("total_equity")
-    if account_balance is None or account_balance <= 0:
-        if not trader.dry_run:
-            logger.error("계좌 잔고 조회 실패 - 실거래 중단")
-            sys.exit(1)
-        account_balance = 10_000_000
-        logger.warning(f"Dry-run 계좌 잔고 (가정): {account_balance:,.0f} KRW")
-    elif account.get("dry_run"):
-        logger.info(f"Dry-run 계좌 잔고 (가정): {account_balance:,.0f} KRW")
-    else:
-        logger.info(f"계좌 잔고: {account_balance:,.0f} KRW")
-
-    # 주문 결과 집계
-    placed_orders = []
-    skipped_signals = []
-
-    # 각 종목별 시그널 체크 및 주문 실행
-    for symbol in symbols:
-        try:
-            logger.info(f"종목 처리 중: {symbol}")
-
-            # VI/CB 상태 조회 (KR 종목만)
-            if symbol.endswith((".KS", ".KQ")):
-                try:
-                    raw = symbol.replace(".KS", "").replace(".KQ", "")
-                    price_data = await kis_client.get_korea_price(raw)
-                    if price_data:
-                        vi_cb_detector.update_from_spot(symbol, price_data)
-                except Exception as e:
-                    logger.debug(f"VI 상태 조회 실패: {symbol} - {e}")
-
-            # 데이터 페칭 (6개월)
-            df = data_fetcher.fetch(symbol, period="6mo")
-            if df is None or df.empty:
-                logger.warning(f"데이터 없음: {symbol}")
-                continue
-
-            # 터틀 지표 계산
-            df = add_turtle_indicators(df)
-            if len(df) < 2:
-                logger.warning(f"데이터 부족: {symbol}")
-                continue
-
-            # 각 시스템별 시그널 체크
-            for system in systems:
-                signal = check_entry_signal(df, symbol, system)
-
-                if signal is None:
-                    logger.debug(f"시그널 없음: {symbol} System {system}")
+                # 터틀 지표 계산
+                df = add_turtle_indicators(df)
+                if len(df) < 2:
+                    logger.warning(f"데이터 부족: {symbol}")
                     continue
 
-                logger.info(f"시그널 감지: {signal['message']}")
+                # 각 시스템별 시그널 체크
+                for system in systems:
+                    signal = check_entry_signal(df, symbol, system)
 
-                # 주문 수량 계산
-                quantity = calculate_order_quantity(signal, account_balance)
-                if quantity <= 0:
-                    logger.warning(f"주문 수량 0: {symbol} - 스킵")
-                    skipped_signals.append({**signal, "skip_reason": "수량 0"})
-                    continue
+                    if signal is None:
+                        logger.debug(f"시그널 없음: {symbol} System {system}")
+                        continue
+
+                    logger.info(f"시그널 감지: {signal['message']}")
 
-                # 주문 금액 사전 체크 (AutoTrader 내부에서도 체크하지만 로그 목적)
-                order_amount = quantity * signal["entry_price"]
-                if order_amount > args.max_amount:
-                    # 금액 초과 시 수량 축소
-                    quantity = int(args.max_amount / signal["entry_price"])
+                    # 주문 수량 계산
+                    quantity = calculate_order_quantity(signal, account_balance)
                     if quantity <= 0:
-                        logger.warning(f"금액 제한으로 주문 불가: {symbol}")
-                        skipped_signals.append({**signal, "skip_reason": "금액 한도 초과"})
+                        logger.warning(f"주문 수량 0: {symbol} - 스킵")
+                        skipped_signals.append({**signal, "skip_reason": "수량 0"})
                         continue
-                    logger.info(f"금액 제한으로 수량 축소: {quantity}주")
-
-                # 주문 실행
-                order_record = await trader.place_order(
-                    symbol=symbol,
-                    side=OrderSide.BUY,
-                    quantity=quantity,
-                    price=signal["entry_price"],
-                    order_type=OrderType.LIMIT,
-                    reason=signal["message"],
-                )
 
-                placed_orders.append(order_record)
-                status_str = (
-                    "완료" if order_record.status in (OrderStatus.FILLED.value, OrderStatus.DRY_RUN.value) else "실패"
-                )
-                logger.info(
-                    f"주문 {status_str}: {order_record.order_id} | {symbol} {quantity}주 @ {signal['entry_price']:,.2f}"
+                    # 주문 금액 사전 체크 (AutoTrader 내부에서도 체크하지만 로그 목적)
+                    order_amount = quantity * signal["entry_price"]
+                    if order_amount > args.max_amount:
+                        # 금액 초과 시 수량 축소
+                        quantity = int(args.max_amount / signal["entry_price"])
+                        if quantity <= 0:
+                            logger.warning(f"금액 제한으로 주문 불가: {symbol}")
+                            skipped_signals.append({**signal, "skip_reason": "금액 한도 초과"})
+                            continue
+                        logger.info(f"금액 제한으로 수량 축소: {quantity}주")
+
+                    # 주문 실행
+                    order_record = await trader.place_order(
+                        symbol=symbol,
+                        side=OrderSide.BUY,
+                        quantity=quantity,
+                        price=signal["entry_price"],
+                        order_type=OrderType.LIMIT,
+                        reason=signal["message"],
+                    )
+
+                    placed_orders.append(order_record)
+                    status_str = (
+                        "완료"
+                        if order_record.status in (OrderStatus.FILLED.value, OrderStatus.DRY_RUN.value)
+                        else "실패"
+                    )
+                    logger.info(
+                        f"주문 {status_str}: {order_record.order_id} | "
+                        f"{symbol} {quantity}주 @ {signal['entry_price']:,.2f}"
+                    )
+
+            except Exception as e:
+                logger.error(f"{symbol} 처리 오류: {e}")
+
+        # 일별 통계
+        stats = trader.get_daily_stats()
+
+        # 결과 요약 출력
+        print("\n" + "=" * 60)
+        print(f"자동매매 실행 완료 - {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+        print(f"모드: {'LIVE' if args.live else 'DRY-RUN'}")
+        print("=" * 60)
+        print(f"처리 종목: {len(symbols)}개")
+        print(f"시그널 감지: {len(placed_orders) + len(skipped_signals)}개")
+        print(f"주문 실행: {len(placed_orders)}개")
+        print(f"스킵: {len(skipped_signals)}개")
+        print("-" * 60)
+        print(f"오늘 통계: {stats}")
+        print("=" * 60)
+
+        # 주문 상세 내역 출력
+        if placed_orders:
+            print("\n주문 내역:")
+            for order in placed_orders:
+                status_label = {
+                    OrderStatus.FILLED.value: "체결",
+                    OrderStatus.DRY_RUN.value: "시뮬레이션",
+                    OrderStatus.FAILED.value: "실패",
+                    OrderStatus.PENDING.value: "대기",
+                    OrderStatus.CANCELLED.value: "취소",
+                    OrderStatus.REJECTED.value: "차단(VI/CB)",
+                }.get(order.status, order.status)
+
+                print(
+                    f"  [{status_label}] {order.symbol} "
+                    f"{order.side.upper()} {order.quantity}주 "
+                    f"@ {order.price:,.2f} | {order.reason or ''}"
                 )
 
-        except Exception as e:
-            logger.error(f"{symbol} 처리 오류: {e}")
-
-    # 일별 통계
-    stats = trader.get_daily_stats()
-
-    # 결과 요약 출력
-    print("\n" + "=" * 60)
-    print(f"자동매매 실행 완료 - {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-    print(f"모드: {'LIVE' if args.live else 'DRY-RUN'}")
-    print("=" * 60)
-    print(f"처리 종목: {len(symbols)}개")
-    print(f"시그널 감지: {len(placed_orders) + len(skipped_signals)}개")
-    print(f"주문 실행: {len(placed_orders)}개")
-    print(f"스킵: {len(skipped_signals)}개")
-    print("-" * 60)
-    print(f"오늘 통계: {stats}")
-    print("=" * 60)
-
-    # 주문 상세 내역 출력
-    if placed_orders:
-        print("\n주문 내역:")
-        for order in placed_orders:
-            status_label = {
-                OrderStatus.FILLED.value: "체결",
-                OrderStatus.DRY_RUN.value: "시뮬레이션",
-                OrderStatus.FAILED.value: "실패",
-                OrderStatus.PENDING.value: "대기",
-                OrderStatus.CANCELLED.value: "취소",
-                OrderStatus.REJECTED.value: "차단(VI/CB)",
-            }.get(order.status, order.status)
-
-            print(
-                f"  [{status_label}] {order.symbol} "
-                f"{order.side.upper()} {order.quantity}주 "
-                f"@ {order.price:,.2f} | {order.reason or ''}"
-            )
-
-    return placed_orders
+        return placed_orders
+    finally:
+        await kis_client.close()
 
 
 def main():
@@ -311,6 +311,15 @@ async def _run_checks():
 
     config = load_config()
     notifier = setup_notifier(config)
+    # 중간 예외에도 알림 채널 세션(HTTP/SMTP)이 닫히도록 보장
+    try:
+        await _check_positions_and_signals(config, notifier)
+    finally:
+        await notifier.close()
+    logger.info("=== 체크 완료 ===")
+
+
+async def _check_positions_and_signals(config, notifier):
     data_fetcher = DataFetcher()
     data_store = ParquetDataStore()
     tracker = PositionTracker()
@@ -656,8 +665,6 @@ async def _run_checks():
     risk_summary = risk_manager.get_risk_summary()
     logger.info(f"리스크 요약: {risk_summary}")
 
-    logger.info("=== 체크 완료 ===")
-
 
 if __name__ == "__main__":
     asyncio.run(main())
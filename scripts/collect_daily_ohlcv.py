@@ -436,20 +436,21 @@ async def main():
 
         fetcher = DataFetcher()
         data_store = ParquetDataStore()
-        notifier = setup_notifier(app_config)
 
-        result = await run_collection(
-            symbols=symbols,
-            fetcher=fetcher,
-            data_store=data_store,
-            rate_limit=rate_limit,
-            max_retries=max_retries,
-            initial_lookback_days=initial_lookback,
-            dry_run=args.dry_run,
-            target_date=args.date,
-        )
-
-        await send_collection_summary(notifier, result, args.dry_run)
+        # 수집/요약 전송 중 예외가 나도 알림 채널 세션(HTTP/SMTP)이 닫히도록 보장
+        async with setup_notifier(app_config) as notifier:
+            result = await run_collection(
+                symbols=symbols,
+                fetcher=fetcher,
+                data_store=data_store,
+                rate_limit=rate_limit,
+                max_retries=max_retries,
+                initial_lookback_days=initial_lookback,
+                dry_run=args.dry_run,
+                target_date=args.date,
+            )
+
+            await send_collection_summary(notifier, result, args.dry_run)
 
         # 수집 성공 시 인텔리전스 파이프라인 트리거 (별도 프로세스)
         if not args.dry_run and result.success_count > 0:
@@ -209,35 +209,38 @@ async def main():
 
     config = load_config()
     notifier = setup_notifier(config)
-    data_store = ParquetDataStore()
-
-    # 추가 모듈 인스턴스화
-    tracker = PositionTracker()
-    risk_manager = PortfolioRiskManager()
+    # 중간 예외/조기 반환에도 알림 채널 세션(HTTP/SMTP)이 닫히도록 보장
+    try:
+        data_store = ParquetDataStore()
 
-    # 유니버스 매니저
-    from pathlib import Path
+        # 추가 모듈 인스턴스화
+        tracker = PositionTracker()
+        risk_manager = PortfolioRiskManager()
 
-    universe_yaml = Path(__file__).parent.parent / "config" / "universe.yaml"
-    if universe_yaml.exists():
-        universe = UniverseManager(yaml_path=str(universe_yaml))
-    else:
-        universe = UniverseManager()
+        # 유니버스 매니저
+        from pathlib import Path
 
-    # 리포트 생성
-    report_data = await generate_report(data_store, tracker, risk_manager, universe)
-    logger.info(f"리포트 데이터: {report_data}")
+        universe_yaml = Path(__file__).parent.parent / "config" / "universe.yaml"
+        if universe_yaml.exists():
+            universe = UniverseManager(yaml_path=str(universe_yaml))
+        else:
+            universe = UniverseManager()
 
-    # 알림 전송
-    await notifier.send_daily_report(report_data)
+        # 리포트 생성
+        report_data = await generate_report(data_store, tracker, risk_manager, universe)
+        logger.info(f"리포트 데이터: {report_data}")
 
-    # PnL 요약 알림
-    if "pnl_summary" in report_data:
-        await notifier.send_pnl_summary(report_data["pnl_summary"])
+        # 알림 전송
+        await notifier.send_daily_report(report_data)
 
-    # 오래된 캐시 정리
-    data_store.cleanup_old_cache(max_age_days=7)
+        # PnL 요약 알림
+        if "pnl_summary" in report_data:
+            await notifier.send_pnl_summary(report_data["pnl_summary"])
 
+        # 오래된 캐시 정리
+        data_store.cleanup_old_cache(max_age_days=7)
+    finally:
+        await notifier.close()
     logger.info("=== 일일 리포트 완료 ===")
 
 
@@ -30,6 +30,11 @@ logging.basicConfig(
 logger = logging.getLogger("ChartBatch")
 
 
+async def _send_and_close(notifier, msg: NotificationMessage) -> None:
+    async with notifier:
+        await notifier.send_message(msg)
+
+
 def _send_notification(title: str, body: str, level: NotificationLevel):
     """설정된 채널(Telegram/Discord/Email)로 알림을 발송한다."""
     try:
@@ -39,7 +44,7 @@ def _send_notification(title: str, body: str, level: NotificationLevel):
             logger.info("알림 채널 미설정, 알림 스킵")
             return
         msg = NotificationMessage(title=title, body=body, level=level)
-        asyncio.run(notifier.send_message(msg))
+        asyncio.run(_send_and_close(notifier, msg))
     except Exception as e:
         logger.warning(f"알림 발송 실패: {e}")
 
@@ -249,8 +249,8 @@ async def run_pipeline(
             # 알림 전송
             if not dry_run:
                 config = load_config()
-                notifier = setup_notifier(config)
-                await notifier.send_market_intelligence(report)
+                async with setup_notifier(config) as notifier:
+                    await notifier.send_market_intelligence(report)
                 logger.info("인텔리전스 리포트 전송 완료")
             else:
                 logger.info("[DRY-RUN] 전송 생략")
@@ -153,6 +153,7 @@ def _build_pnl_warning(position, spot: SpotData, pnl_dollar: float, pnl_pct: flo
 async def monitor_positions(args):
     """장중 포지션 모니터링 메인 루프."""
     lock_fd = acquire_lock()
+    notifier = None
 
     try:
         async with asyncio.timeout(SCRIPT_TIMEOUT):
@@ -228,10 +229,12 @@ async def monitor_positions(args):
                 )
             )
         except Exception:
-            pass  # notifier 미초기화(NameError) 또는 전송 실패
+            pass  # notifier 미초기화 또는 전송 실패
     except Exception as e:
         logger.error(f"모니터링 오류: {e}", exc_info=True)
     finally:
+        if notifier is not None:
+            await notifier.close()
         fcntl.flock(lock_fd, fcntl.LOCK_UN)
         lock_fd.close()
 
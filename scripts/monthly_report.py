@@ -320,30 +320,33 @@ async def main():
 
     config = load_config()
     notifier = setup_notifier(config)
-    tracker = PositionTracker()
-    data_store = ParquetDataStore()
+    # 중간 예외/조기 반환에도 알림 채널 세션(HTTP/SMTP)이 닫히도록 보장
+    try:
+        tracker = PositionTracker()
+        data_store = ParquetDataStore()
 
-    report_data = generate_report(month_str, tracker, data_store)
-    report_text = format_report(report_data)
+        report_data = generate_report(month_str, tracker, data_store)
+        report_text = format_report(report_data)
 
-    if args.verbose:
-        print(report_text)
+        if args.verbose:
+            print(report_text)
 
-    logger.info(f"리포트 완료: {report_data['trade_count']}건 거래, 총 손익 ${report_data['total_pnl']:,.2f}")
+        logger.info(f"리포트 완료: {report_data['trade_count']}건 거래, 총 손익 ${report_data['total_pnl']:,.2f}")
 
-    if args.send:
-        logger.info("알림 채널로 월간 리포트 전송 중...")
-        await notifier.send_message(
-            NotificationMessage(
-                title=f"월간 성과 리포트 — {month_str}",
-                body=report_text,
-                level=NotificationLevel.INFO,
+        if args.send:
+            logger.info("알림 채널로 월간 리포트 전송 중...")
+            await notifier.send_message(
+                NotificationMessage(
+                    title=f"월간 성과 리포트 — {month_str}",
+                    body=report_text,
+                    level=NotificationLevel.INFO,
+                )
             )
-        )
-        logger.info("월간 리포트 전송 완료")
-    else:
-        logger.info("--send 플래그가 없어서 알림 전송을 건너뜁니다")
-
+            logger.info("월간 리포트 전송 완료")
+        else:
+            logger.info("--send 플래그가 없어서 알림 전송을 건너뜁니다")
+    finally:
+        await notifier.close()
     logger.info("=== 월간 리포트 완료 ===")
 
 
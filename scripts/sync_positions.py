@@ -50,7 +50,7 @@ async def main(args: argparse.Namespace) -> None:
 
     kis_ctx = KISAPIClient(kis_config)
 
-    async with kis_ctx as kis_client:
+    async with kis_ctx as kis_client, notifier:
         verifier = PositionSyncVerifier(kis_client=kis_client, tracker=tracker)
 
         try:
@@ -226,12 +226,21 @@ async def main(args):
     """메인 함수"""
     logger.info("=== 주간 리포트 생성 ===")
 
-    # 필수 컴포넌트 로드
     config = load_config()
+    notifier = setup_notifier(config)
+    # 중간 예외/조기 반환에도 알림 채널 세션(HTTP/SMTP)이 닫히도록 보장
+    try:
+        await _build_and_send_report(args, notifier)
+    finally:
+        await notifier.close()
+
+
+async def _build_and_send_report(args, notifier):
+    """주간 리포트 생성 및 (--send 시) 전송"""
+    # 필수 컴포넌트 로드
     tracker = PositionTracker()
     data_store = ParquetDataStore()
     risk_manager = setup_risk_manager()
-    notifier = setup_notifier(config)
 
     # 유니버스 매니저
     universe_yaml = Path(__file__).parent.parent / "config" / "universe.yaml"
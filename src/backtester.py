@@ -174,8 +174,7 @@ class TurtleBacktester:
         return None
 
     def _check_pyramid_signal(self, row: pd.Series, position: Any, n_value: float) -> Optional[SignalType]:
-        can_pyramid, _ = position.can_pyramid(row["close"], n_value)
-        if can_pyramid:
+        if position.pyramid_ready(row["close"], n_value):
             if position.direction == Direction.LONG:
                 return SignalType.PYRAMID_LONG
             return SignalType.PYRAMID_SHORT
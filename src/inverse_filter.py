@@ -42,18 +42,20 @@ class InverseETFFilter:
         "SQQQ": InverseETFConfig("SQQQ", -3, "QQQ", 10, 3.0),
         "SPXU": InverseETFConfig("SPXU", -3, "SPY", 10, 3.0),
     }
+    # 멤버십 검사 전용 (백테스트 대량 체결 시 비 Inverse 경로를 최소화)
+    _KNOWN_SYMS: frozenset[str] = frozenset(KNOWN_INVERSE_ETFS)
 
     def __init__(self):
         self.holdings: Dict[str, InverseHolding] = {}
 
     def is_inverse_etf(self, symbol: str) -> bool:
-        return symbol in self.KNOWN_INVERSE_ETFS
+        return symbol in self._KNOWN_SYMS
 
     def get_config(self, symbol: str) -> Optional[InverseETFConfig]:
         return self.KNOWN_INVERSE_ETFS.get(symbol)
 
     def on_entry(self, symbol: str, entry_date: datetime, inverse_price: float, underlying_price: float):
-        if not self.is_inverse_etf(symbol):
+        if self.KNOWN_INVERSE_ETFS.get(symbol) is None:
             return
         self.holdings[symbol] = InverseHolding(
             symbol=symbol,
@@ -91,8 +93,13 @@ class InverseETFFilter:
         return (actual_return - theoretical_return) * 100
 
     def should_force_exit(
-        self, symbol: str, curr_inv: float, curr_und: float
+        self, symbol: str, curr_inv: float, curr_und: float, recompute: bool = False
     ) -> Tuple[bool, Optional[ExitReason], str]:
+        """강제 청산 여부 판단.
+
+        기본은 직전 on_daily_update()가 저장한 current_decay_pct를 재사용한다.
+        on_daily_update 없이 최신 가격으로 판단하려면 recompute=True.
+        """
         if symbol not in self.holdings:
             return False, None, ""
 
@@ -106,9 +113,12 @@ class InverseETFFilter:
         if actual_holding_days >= config.max_holding_days:
             return True, ExitReason.MAX_HOLDING_DAYS, f"최대 보유일 초과: {actual_holding_days}일"
 
-        decay = self._calculate_decay(
-            config.leverage, holding.entry_inverse_price, curr_inv, holding.entry_underlying_price, curr_und
-        )
+        if recompute:
+            decay = self._calculate_decay(
+                config.leverage, holding.entry_inverse_price, curr_inv, holding.entry_underlying_price, curr_und
+            )
+        else:
+            decay = holding.current_decay_pct
         if abs(decay) >= config.decay_threshold_pct:
             return True, ExitReason.DECAY_THRESHOLD, f"괴리율 초과: {decay:.2f}%"
 
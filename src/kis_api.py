@@ -2,22 +2,61 @@
 한국투자증권 KIS API 클라이언트
 - 국내주식 조회/주문
 - 해외주식 조회/주문
-- 재시도 (지수 백오프), 레이트 리밋, 세션 재사용
+- 재시도 (지수 백오프), 레이트 리밋, 세션 재사용 (단일 장기 세션)
+- 접근 토큰 디스크 캐시 (프로세스 재시작 시 재발급 방지)
 """
 
 import asyncio
+import contextlib
+import hashlib
 import logging
-from dataclasses import dataclass
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from enum import Enum
-from typing import Any, Dict, Optional
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, List, Mapping, Optional, Tuple, TypeVar, cast
 
 import aiohttp
-
-from src.utils import retry_async, validate_symbol
+import numpy as np
+
+try:
+    import aiodns  # noqa: F401
+except ImportError:  # 선택 의존성 — 미설치 시 aiohttp 기본(스레드풀 getaddrinfo) 리졸버 사용
+    aiodns = None
+
+from src.utils import (
+    AsyncTokenBucket,
+    atomic_write_json,
+    json_dumps,
+    json_loads,
+    parse_retry_after,
+    retry_async,
+    validate_symbol,
+)
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
+# KIS 초당 요청 한도 (토큰 버킷 보충 속도)
+_RATE_LIMIT_PER_SEC = 20.0
+# 커넥터 소켓 풀 상한 — KIS 초당 20건 예산과 일치
+_CONNECTOR_LIMIT = 20
+# 일괄 가격 조회 시 동시 요청 상한
+_BATCH_CONCURRENCY = 10
+_KEEPALIVE_TIMEOUT = 30.0
+# DNS 조회 결과 캐시 (초) — aiohttp 기본 10초는 커넥션 풀 확장 때마다 재조회
+_DNS_CACHE_TTL = 300
+# 재시도 백오프 상한/지터 (gather 동시 실패 시 재시도 시각 분산)
+_RETRY_MAX_DELAY = 30.0
+_RETRY_JITTER = 0.5
+# 현재가 캐시 유효 시간 (초) — 동일 폴링 주기 내 중복 조회 흡수
+_PRICE_CACHE_TTL = 0.5
+# 현재가 캐시 최대 항목 수 (LRU 축출)
+_PRICE_CACHE_MAX = 512
+
 
 # ---------------------------------------------------------------------------
 # Custom Exceptions
@@ -48,12 +87,37 @@ class TokenExpiredError(KISAPIError):
     pass
 
 
-class RateLimitError(KISAPIError):
-    """429 -- wait and retry"""
+class OrderSubmissionUnknownError(KISAPIError):
+    """주문 전송 후 5xx/응답 파싱 실패 -- 접수 여부 불명, 재시도 금지
+
+    호출측은 재주문하지 말고 당일 체결 내역(get_daily_fills) 또는
+    주문번호가 있으면 get_order_status로 실제 접수/체결 여부를 대사해야 한다.
+    """
 
     pass
 
 
+class RateLimitError(KISAPIError):
+    """429 -- wait and retry (retry_after: 서버가 지정한 대기 초, 없으면 None)"""
+
+    def __init__(self, *args: Any, retry_after: Optional[float] = None):
+        super().__init__(*args)
+        self.retry_after = retry_after
+
+
+class KISResponseError(FatalError):
+    """rt_cd != "0" 응답 -- 메시지는 str() 시점에만 조립"""
+
+    def __init__(self, context: str, rt_cd: Any, msg1: Any):
+        super().__init__(context, rt_cd, msg1)
+        self.context = context
+        self.rt_cd = rt_cd
+        self.msg1 = msg1
+
+    def __str__(self) -> str:
+        return f"{self.context}: rt_cd={self.rt_cd}, msg={self.msg1}"
+
+
 def _sanitize_error(data) -> str:
     """예외 메시지용 안전한 요약 생성 (민감 데이터 제외)"""
     if not isinstance(data, dict):
@@ -73,7 +137,7 @@ def _sanitize_response_for_log(data: dict) -> dict:
     return {k: v for k, v in data.items() if k in _SAFE_LOG_KEYS}
 
 
-def _classify_response(status: int, data: dict) -> None:
+def _classify_response(status: int, data: dict, headers: Optional[Mapping[str, str]] = None) -> None:
     """HTTP 응답 코드 기반 예외 분류 (성공 시 None 반환)"""
     if 200 <= status < 300:
         return  # 성공
@@ -82,7 +146,8 @@ def _classify_response(status: int, data: dict) -> None:
     logger.debug("API error response (status=%d): %s", status, _sanitize_response_for_log(data))
 
     if status == 429:
-        raise RateLimitError(f"Rate limit exceeded: {safe_msg}")
+        retry_after = parse_retry_after(headers.get("Retry-After")) if headers else None
+        raise RateLimitError(f"Rate limit exceeded: {safe_msg}", retry_after=retry_after)
     if status == 401:
         raise TokenExpiredError(f"Token expired (401): {safe_msg}")
     if status in (400, 403):
@@ -92,6 +157,41 @@ def _classify_response(status: int, data: dict) -> None:
     raise KISAPIError(f"Unexpected status {status}: {safe_msg}")
 
 
+def _balance_columns(holdings: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """잔고 output1 보유 행 → 열 단위 배열 (SoA)"""
+    n = len(holdings)
+
+    def floats(key: str) -> np.ndarray:
+        return np.fromiter((float(item.get(key, 0)) for item in holdings), dtype=np.float64, count=n)
+
+    return {
+        "symbols": [item.get("pdno") for item in holdings],
+        "names": [item.get("prdt_name") for item in holdings],
+        "quantities": np.fromiter((int(item.get("hldg_qty", 0)) for item in holdings), dtype=np.int64, count=n),
+        "avg_prices": floats("pchs_avg_pric"),
+        "current_prices": floats("prpr"),
+        "pnl": floats("evlu_pfls_amt"),
+        "pnl_pct": floats("evlu_pfls_rt"),
+    }
+
+
+# 조회(멱등) 요청 공통 재시도 정책 — 주문 메서드에는 적용 금지
+_retry_read = retry_async(
+    max_retries=3,
+    base_delay=1.0,
+    max_delay=_RETRY_MAX_DELAY,
+    jitter=_RETRY_JITTER,
+    exceptions=(
+        RetryableError,
+        RateLimitError,
+        TokenExpiredError,
+        ConnectionError,
+        TimeoutError,
+        aiohttp.ClientError,
+    ),
+)
+
+
 class KISMarket(Enum):
     KOREA = "KOR"
     USA = "USA"
@@ -112,93 +212,301 @@ class OrderSide(Enum):
     SELL = "sell"
 
 
-@dataclass
+_REAL_BASE_URL = "https://openapi.koreainvestment.com:9443"
+_VIRTUAL_BASE_URL = "https://openapivts.koreainvestment.com:29443"
+
+_ENDPOINT_PATHS: Dict[str, str] = {
+    "token": "/oauth2/tokenP",
+    "korea_price": "/uapi/domestic-stock/v1/quotations/inquire-price",
+    "overseas_price": "/uapi/overseas-price/v1/quotations/price",
+    "balance": "/uapi/domestic-stock/v1/trading/inquire-balance",
+    "order": "/uapi/domestic-stock/v1/trading/order-cash",
+    "overseas_order": "/uapi/overseas-stock/v1/trading/order",
+    "daily_ccld": "/uapi/domestic-stock/v1/trading/inquire-daily-ccld",
+}
+
+# 시세 조회 tr_id는 실전/모의 동일
+_TR_KOREA_PRICE = "FHKST01010100"
+_TR_OVERSEAS_PRICE = "HHDFS00000300"
+
+# (실전, 모의) tr_id
+_TR_ID_TABLE: Dict[str, Tuple[str, str]] = {
+    "balance": ("TTTC8434R", "VTTC8434R"),
+    "order_buy": ("TTTC0802U", "VTTC0802U"),
+    "order_sell": ("TTTC0801U", "VTTC0801U"),
+    "overseas_order_buy": ("JTTT1002U", "VTTT1002U"),
+    "overseas_order_sell": ("JTTT1006U", "VTTT1006U"),
+    "daily_ccld": ("TTTC8001R", "VTTC8001R"),
+}
+
+# 해외 거래소 코드 (시세 조회 EXCD / 주문 OVRS_EXCG_CD 체계가 다름)
+_OVERSEAS_PRICE_EXCD: Dict[KISMarket, str] = {
+    KISMarket.USA: "NAS",
+    KISMarket.JAPAN: "TSE",
+    KISMarket.HONGKONG: "HKS",
+}
+_OVERSEAS_ORDER_EXCD: Dict[KISMarket, str] = {
+    KISMarket.USA: "NASD",
+    KISMarket.JAPAN: "TKSE",
+    KISMarket.HONGKONG: "SEHK",
+}
+
+
+@dataclass(frozen=True)
 class KISConfig:
     app_key: str
     app_secret: str
     account_no: str
     account_suffix: str = "01"
     is_real: bool = False
+    # 생성 시 확정되는 파생 값 (요청마다 분기/문자열 조립 방지)
+    base_url: str = field(init=False, repr=False, compare=False)
+    endpoints: Dict[str, str] = field(init=False, repr=False, compare=False)
+    tr_ids: Dict[str, str] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        base_url = _REAL_BASE_URL if self.is_real else _VIRTUAL_BASE_URL
+        idx = 0 if self.is_real else 1
+        object.__setattr__(self, "base_url", base_url)
+        object.__setattr__(self, "endpoints", {k: base_url + path for k, path in _ENDPOINT_PATHS.items()})
+        object.__setattr__(self, "tr_ids", {k: pair[idx] for k, pair in _TR_ID_TABLE.items()})
+
 
-    @property
-    def base_url(self) -> str:
-        if self.is_real:
-            return "https://openapi.koreainvestment.com:9443"
-        return "https://openapivts.koreainvestment.com:29443"
+_TOKEN_LIFETIME = timedelta(hours=23)
+# 만료 전 이 구간(초)에 들어서면 백그라운드에서 선제 갱신
+_TOKEN_STALE_SECONDS = 600.0
+# 토큰 디스크 캐시 위치 / 재사용 최소 잔여 시간 (초)
+_TOKEN_CACHE_DIR = Path("data/tokens")
+_TOKEN_CACHE_MIN_REMAINING = 300.0
 
 
 @dataclass
 class KISToken:
     access_token: str
-    expires_at: datetime
+    expires_at: datetime  # 로그/표시용 벽시계 시각
+    expires_at_monotonic: float = 0.0  # 만료 판정용 (NTP/DST 시각 변경 영향 없음)
+
+    @classmethod
+    def issue(cls, access_token: str, lifetime: timedelta = _TOKEN_LIFETIME) -> "KISToken":
+        """지금 발급된 토큰 (벽시계/monotonic 만료 시각 동시 기록)"""
+        return cls(
+            access_token=access_token,
+            expires_at=datetime.now() + lifetime,
+            expires_at_monotonic=time.monotonic() + lifetime.total_seconds(),
+        )
+
+    @classmethod
+    def restore(cls, access_token: str, expires_at: datetime) -> "KISToken":
+        """디스크에 저장된 토큰 복원 (재시작 후에는 벽시계 만료 시각만 유효한 기준)"""
+        remaining = (expires_at - datetime.now()).total_seconds()
+        return cls(access_token=access_token, expires_at=expires_at, expires_at_monotonic=time.monotonic() + remaining)
+
+    def seconds_left(self) -> float:
+        """만료까지 남은 초 (monotonic 기준, 만료 시 0 이하)"""
+        return self.expires_at_monotonic - time.monotonic()
 
 
 class KISAPIClient:
-    def __init__(self, config: KISConfig):
+    def __init__(self, config: KISConfig, token_cache_dir: Optional[Path] = _TOKEN_CACHE_DIR):
+        """token_cache_dir=None 이면 토큰 디스크 캐시를 사용하지 않는다."""
         self.config = config
         self.token: Optional[KISToken] = None
+        self._token_cache_path: Optional[Path] = None
+        if token_cache_dir is not None:
+            # 계정(app_key)·환경별 파일 분리, 파일명에 키 원문 노출 금지
+            digest = hashlib.sha256(f"{config.base_url}|{config.app_key}".encode()).hexdigest()[:16]
+            self._token_cache_path = Path(token_cache_dir) / f"kis_token_{digest}.json"
+        self._token_cache_checked = False  # 디스크 캐시는 최초 발급 시점에 1회만 확인
         self._session: Optional[aiohttp.ClientSession] = None
-        self._semaphore = asyncio.Semaphore(18)  # KIS 20 req/sec, 2 buffer
+        self._rate_limiter = AsyncTokenBucket(rate=_RATE_LIMIT_PER_SEC)  # KIS 초당 20건
         self._token_lock = asyncio.Lock()  # 토큰 갱신 직렬화
+        self._session_lock = asyncio.Lock()  # 세션 지연 생성 직렬화
+        self._refresh_task: Optional[asyncio.Task] = None  # 토큰 선제 갱신 태스크
+        self._price_cache: OrderedDict[Tuple[str, KISMarket], Tuple[float, Dict[str, Any]]] = OrderedDict()
+        self._inflight: Dict[Tuple[Any, ...], asyncio.Future[Any]] = {}  # 진행 중 읽기 요청 (중복 호출 합침)
+
+        # 클라이언트 단위로 불변인 요청 필드 (호출마다 재조립하지 않음)
+        self._base_headers: Dict[str, str] = {
+            "Content-Type": "application/json; charset=utf-8",
+            "Accept-Encoding": "gzip, deflate",  # aiohttp가 자동 해제 (auto_decompress)
+            "appkey": config.app_key,
+            "appsecret": config.app_secret,
+            "custtype": "P",
+        }
+        self._bearer: Tuple[str, str] = ("", "")  # (access_token, "Bearer ...") — 토큰 교체 시 갱신
+        self._account_base: Dict[str, str] = {
+            "CANO": config.account_no,
+            "ACNT_PRDT_CD": config.account_suffix,
+        }
+        self._balance_params: Dict[str, str] = {
+            **self._account_base,
+            "AFHR_FLPR_YN": "N",
+            "OFL_YN": "",
+            "INQR_DVSN": "02",
+            "UNPR_DVSN": "01",
+            "FUND_STTL_ICLD_YN": "N",
+            "FNCG_AMT_AUTO_RDPT_YN": "N",
+            "PRCS_DVSN": "00",
+            "CTX_AREA_FK100": "",
+            "CTX_AREA_NK100": "",
+        }
+        self._overseas_order_base: Dict[str, str] = {
+            **self._account_base,
+            "ORD_SVR_DVSN_CD": "0",
+            "ORD_DVSN": "00",
+        }
+        self._daily_ccld_base: Dict[str, str] = {
+            **self._account_base,
+            "SLL_BUY_DVSN_CD": "00",  # 전체 (매수+매도)
+            "INQR_DVSN": "00",
+            "PDNO": "",
+            "CCLD_DVSN": "00",
+            "ORD_GNO_BRNO": "",
+            "INQR_DVSN_3": "00",
+            "INQR_DVSN_1": "",
+            "CTX_AREA_FK100": "",
+            "CTX_AREA_NK100": "",
+        }
 
     # --- Context manager for session reuse ---
 
     async def __aenter__(self):
-        self._session = aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=30))
+        await self._get_session()
         return self
 
     async def __aexit__(self, *args):
+        await self.close()
+
+    async def close(self) -> None:
+        """관리 세션 종료 (async with 미사용 시 호출측에서 직접 호출)"""
+        if self._refresh_task is not None and not self._refresh_task.done():
+            self._refresh_task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._refresh_task
+        self._refresh_task = None
         if self._session and not self._session.closed:
             await self._session.close()
-            self._session = None
-
-    def _get_session(self) -> Optional[aiohttp.ClientSession]:
-        """관리 세션 반환, 없으면 임시 세션은 호출측에서 생성"""
-        if self._session and not self._session.closed:
+        self._session = None
+
+    @staticmethod
+    def _new_session() -> aiohttp.ClientSession:
+        """keep-alive 커넥터 풀을 갖는 세션 생성 (동시 요청이 TCP/TLS 연결을 재사용)"""
+        connector = aiohttp.TCPConnector(
+            limit=_CONNECTOR_LIMIT,
+            limit_per_host=_CONNECTOR_LIMIT,
+            keepalive_timeout=_KEEPALIVE_TIMEOUT,
+            ttl_dns_cache=_DNS_CACHE_TTL,
+            resolver=aiohttp.AsyncResolver() if aiodns is not None else None,
+        )
+        return aiohttp.ClientSession(
+            timeout=aiohttp.ClientTimeout(total=30), connector=connector, json_serialize=json_dumps
+        )
+
+    async def _get_session(self) -> aiohttp.ClientSession:
+        """장기 관리 세션 반환 (최초 사용 시 1회 생성 후 재사용)"""
+        if self._session is not None and not self._session.closed:
+            return self._session
+        async with self._session_lock:
+            if self._session is None or self._session.closed:
+                self._session = self._new_session()
             return self._session
-        return None
+
+    async def _get_token(self) -> str:
+        """유효 토큰 반환
+
+        - fresh: 락 없이 즉시 반환
+        - stale (만료 10분 전 구간): 기존 토큰 반환 + 백그라운드 갱신 1건 예약
+        - expired/없음: 락 안에서 재확인 후 동기 발급
+        """
+        token = self.token
+        if token is not None:
+            remaining = token.seconds_left()
+            if remaining > _TOKEN_STALE_SECONDS:
+                return token.access_token
+            if remaining > 0:
+                if self._refresh_task is None or self._refresh_task.done():
+                    self._refresh_task = asyncio.create_task(self._background_refresh())
+                return token.access_token
+
+        async with self._token_lock:
+            # 락 대기 중 다른 태스크가 이미 발급했으면 재사용
+            if self.token is not None and self.token.seconds_left() > 0:
+                return self.token.access_token
+            if not self._token_cache_checked:
+                self._token_cache_checked = True
+                cached = self._load_cached_token()
+                if cached is not None:
+                    self.token = cached
+                    return cached.access_token
+            return await self._issue_token()
+
+    def _load_cached_token(self) -> Optional[KISToken]:
+        """디스크 캐시 토큰 로드 (잔여 시간 부족/손상 시 None)"""
+        path = self._token_cache_path
+        if path is None or not path.exists():
+            return None
+        try:
+            data = json_loads(path.read_bytes())
+            token = KISToken.restore(data["access_token"], datetime.fromisoformat(data["expires_at"]))
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            logger.warning(f"토큰 캐시 로드 실패 (재발급): {e}")
+            return None
+        if token.seconds_left() <= _TOKEN_CACHE_MIN_REMAINING:
+            return None
+        logger.info("KIS 토큰 디스크 캐시 재사용")
+        return token
+
+    def _save_cached_token(self, token: KISToken) -> None:
+        """발급 토큰 디스크 저장 (mkstemp 기반 atomic write → 파일 권한 0600)"""
+        if self._token_cache_path is None:
+            return
+        try:
+            atomic_write_json(
+                self._token_cache_path,
+                {"access_token": token.access_token, "expires_at": token.expires_at.isoformat()},
+            )
+        except OSError as e:
+            logger.warning(f"토큰 캐시 저장 실패: {e}")
+
+    async def _background_refresh(self) -> None:
+        """stale 구간 토큰 선제 갱신 (실패해도 기존 토큰은 만료 전까지 계속 사용)"""
+        try:
+            async with self._token_lock:
+                token = self.token
+                if token is not None and token.seconds_left() > _TOKEN_STALE_SECONDS:
+                    return  # 이미 갱신됨
+                await self._issue_token()
+        except Exception as e:
+            logger.warning(f"KIS 토큰 백그라운드 갱신 실패 (만료 시 재시도): {type(e).__name__}")
 
     @retry_async(
         max_retries=3,
         base_delay=1.0,
+        max_delay=_RETRY_MAX_DELAY,
+        jitter=_RETRY_JITTER,
         exceptions=(RetryableError, RateLimitError, ConnectionError, TimeoutError, aiohttp.ClientError),
     )
-    async def _get_token(self) -> str:
-        async with self._token_lock:
-            if self.token and datetime.now() < self.token.expires_at:
-                return self.token.access_token
-
-            url = f"{self.config.base_url}/oauth2/tokenP"
-            payload = {
-                "grant_type": "client_credentials",
-                "appkey": self.config.app_key,
-                "appsecret": self.config.app_secret,
-            }
-
-            managed = self._get_session()
-            session_to_close = None
-            if managed is None:
-                managed = aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=30))
-                session_to_close = managed
+    async def _issue_token(self) -> str:
+        """토큰 발급 HTTP 호출 (_token_lock 보유 상태에서 호출)"""
+        url = self.config.endpoints["token"]
+        payload = {
+            "grant_type": "client_credentials",
+            "appkey": self.config.app_key,
+            "appsecret": self.config.app_secret,
+        }
 
-            try:
-                async with self._semaphore:
-                    async with managed.post(url, json=payload) as resp:
-                        data = await resp.json()
-                        _classify_response(resp.status, data)
-                        if "access_token" in data:
-                            self.token = KISToken(
-                                access_token=data["access_token"], expires_at=datetime.now() + timedelta(hours=23)
-                            )
-                            logger.info("KIS 토큰 발급 성공")
-                            return self.token.access_token
-                        else:
-                            raise FatalError(
-                                f"토큰 발급 실패: rt_cd={data.get('rt_cd', 'UNKNOWN')}, msg={data.get('msg1', '')}"
-                            )
-            finally:
-                if session_to_close:
-                    await session_to_close.close()
+        session = await self._get_session()
+        await self._rate_limiter.acquire()
+        async with session.post(url, json=payload) as resp:
+            data = await resp.json(loads=json_loads)
+            _classify_response(resp.status, data, resp.headers)
+            if "access_token" in data:
+                self.token = KISToken.issue(data["access_token"])
+                logger.info("KIS 토큰 발급 성공")
+                self._save_cached_token(self.token)
+                return self.token.access_token
+            else:
+                raise KISResponseError("토큰 발급 실패", data.get("rt_cd", "UNKNOWN"), data.get("msg1", ""))
 
     async def _invalidate_and_refresh_token(self) -> str:
         """토큰 무효화 후 재발급 (401 응답 시 사용)"""
@@ -207,273 +515,277 @@ class KISAPIClient:
         result: str = await self._get_token()
         return result
 
-    def _classify_and_handle(self, status: int, data: dict) -> None:
-        """응답 분류 + 401 시 캐시된 토큰 무효화 (retry_async가 재시도 시 새 토큰 사용)"""
+    def _classify_and_handle(
+        self, status: int, data: dict, headers: Optional[Mapping[str, str]] = None, idempotent: bool = True
+    ) -> None:
+        """응답 분류 + 401 시 캐시된 토큰 무효화 (retry_async가 재시도 시 새 토큰 사용)
+
+        idempotent=False(주문)에서 5xx는 서버가 주문을 이미 처리했을 수 있으므로
+        RetryableError 대신 OrderSubmissionUnknownError로 올린다.
+        """
+        if not idempotent and status >= 500:
+            raise OrderSubmissionUnknownError(f"Order submission state unknown ({status}): {_sanitize_error(data)}")
         try:
-            _classify_response(status, data)
+            _classify_response(status, data, headers)
         except TokenExpiredError:
             self.token = None  # 캐시 무효화 → 재시도 시 _get_token()이 새 토큰 발급
             raise
 
     def _get_headers(self, token: str, tr_id: str) -> Dict[str, str]:
         # WARNING: 반환값에 appsecret 포함 — 절대 로그에 출력하지 말 것
-        return {
-            "Content-Type": "application/json; charset=utf-8",
-            "authorization": f"Bearer {token}",
-            "appkey": self.config.app_key,
-            "appsecret": self.config.app_secret,
-            "tr_id": tr_id,
-            "custtype": "P",
-        }
+        if self._bearer[0] != token:
+            self._bearer = (token, f"Bearer {token}")
+        return {**self._base_headers, "authorization": self._bearer[1], "tr_id": tr_id}
+
+    async def _request(
+        self,
+        method: str,
+        endpoint: str,
+        tr_id: str,
+        *,
+        params: Optional[Dict[str, str]] = None,
+        json: Optional[Dict[str, Any]] = None,
+        idempotent: bool = True,
+    ) -> Dict[str, Any]:
+        """공통 요청 처리: 토큰/헤더 → 레이트 리밋 → 요청 → JSON 파싱 → 상태 분류
 
-    @retry_async(
-        max_retries=3,
-        base_delay=1.0,
-        exceptions=(
-            RetryableError,
-            RateLimitError,
-            TokenExpiredError,
-            ConnectionError,
-            TimeoutError,
-            aiohttp.ClientError,
-        ),
-    )
-    async def get_korea_price(self, symbol: str) -> Dict[str, Any]:
-        """국내 주식 현재가 조회"""
-        symbol = validate_symbol(symbol)
+        rt_cd 판정은 엔드포인트마다 실패 처리가 다르므로 호출측에서 수행한다.
+        idempotent=False(주문)이면 JSON 파싱 실패/5xx를 OrderSubmissionUnknownError로 올린다.
+        """
         token = await self._get_token()
-        tr_id = "FHKST01010100" if self.config.is_real else "FHKST01010100"
-
-        url = f"{self.config.base_url}/uapi/domestic-stock/v1/quotations/inquire-price"
         headers = self._get_headers(token, tr_id)
-        params = {"FID_COND_MRKT_DIV_CODE": "J", "FID_INPUT_ISCD": symbol}
-
-        managed = self._get_session()
-        session_to_close = None
-        if managed is None:
-            managed = aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=30))
-            session_to_close = managed
-
+        session = await self._get_session()
+        await self._rate_limiter.acquire()
+        async with session.request(
+            method, self.config.endpoints[endpoint], headers=headers, params=params, json=json
+        ) as resp:
+            try:
+                data: Dict[str, Any] = await resp.json(loads=json_loads)
+            except (aiohttp.ContentTypeError, ValueError) as e:
+                if idempotent:
+                    raise RetryableError(f"JSON 파싱 실패 (status={resp.status}): {e}")
+                raise OrderSubmissionUnknownError(f"주문 응답 JSON 파싱 실패 (status={resp.status}): {e}")
+            self._classify_and_handle(resp.status, data, resp.headers, idempotent)
+            return data
+
+    async def _coalesce(self, key: Tuple[Any, ...], fetch: Callable[[], Awaitable[T]]) -> T:
+        """동일 key 읽기 요청이 진행 중이면 새로 호출하지 않고 그 결과를 공유"""
+        inflight = self._inflight.get(key)
+        if inflight is not None:
+            # shield: 후속 호출자가 취소되어도 공유 요청은 유지
+            try:
+                return cast(T, await asyncio.shield(inflight))
+            except asyncio.CancelledError:
+                task = asyncio.current_task()
+                if not inflight.cancelled() or (task is not None and task.cancelling()):
+                    raise
+                # 선행 호출자만 취소된 경우: 취소를 전파하지 않고 다시 합쳐서 조회
+                return await self._coalesce(key, fetch)
+
+        fut: asyncio.Future[Any] = asyncio.get_running_loop().create_future()
+        self._inflight[key] = fut
         try:
-            async with self._semaphore:
-                async with managed.get(url, headers=headers, params=params) as resp:
-                    try:
-                        data = await resp.json()
-                    except (aiohttp.ContentTypeError, ValueError) as e:
-                        raise RetryableError(f"JSON 파싱 실패 (status={resp.status}): {e}")
-                    self._classify_and_handle(resp.status, data)
-                    if data.get("rt_cd") == "0":
-                        output = data.get("output", {})
-                        return {
-                            "symbol": symbol,
-                            "price": float(output.get("stck_prpr", 0)),
-                            "change": float(output.get("prdy_vrss", 0)),
-                            "change_pct": float(output.get("prdy_ctrt", 0)),
-                            "volume": int(output.get("acml_vol", 0)),
-                            "high": float(output.get("stck_hgpr", 0)),
-                            "low": float(output.get("stck_lwpr", 0)),
-                            "open": float(output.get("stck_oprc", 0)),
-                            "vi_cls_code": output.get("vi_cls_code", "0"),
-                        }
-                    else:
-                        logger.error(
-                            f"가격 조회 실패: rt_cd={data.get('rt_cd', 'UNKNOWN')}, msg={data.get('msg1', '')}"
-                        )
-                        return {}
+            result = await fetch()
+        except asyncio.CancelledError:
+            fut.cancel()
+            raise
+        except BaseException as e:
+            fut.set_exception(e)
+            fut.exception()  # 대기자가 없을 때 "never retrieved" 경고 방지
+            raise
+        else:
+            fut.set_result(result)
+            return result
         finally:
-            if session_to_close:
-                await session_to_close.close()
-
-    @retry_async(
-        max_retries=3,
-        base_delay=1.0,
-        exceptions=(
-            RetryableError,
-            RateLimitError,
-            TokenExpiredError,
-            ConnectionError,
-            TimeoutError,
-            aiohttp.ClientError,
-        ),
-    )
-    async def get_overseas_price(self, symbol: str, market: KISMarket = KISMarket.USA) -> Dict[str, Any]:
-        """해외 주식 현재가 조회"""
-        symbol = validate_symbol(symbol)
-        token = await self._get_token()
-        tr_id = "HHDFS00000300" if self.config.is_real else "HHDFS00000300"
+            del self._inflight[key]
 
-        url = f"{self.config.base_url}/uapi/overseas-price/v1/quotations/price"
-        headers = self._get_headers(token, tr_id)
-
-        excd_map = {KISMarket.USA: "NAS", KISMarket.JAPAN: "TSE", KISMarket.HONGKONG: "HKS"}
-
-        params = {"AUTH": "", "EXCD": excd_map.get(market, "NAS"), "SYMB": symbol}
-
-        managed = self._get_session()
-        session_to_close = None
-        if managed is None:
-            managed = aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=30))
-            session_to_close = managed
+    async def _get_cached_price(
+        self,
+        key: Tuple[str, KISMarket],
+        fetch: Callable[[], Awaitable[Dict[str, Any]]],
+        ttl_seconds: Optional[float] = None,
+    ) -> Dict[str, Any]:
+        """TTL 내 동일 (symbol, market) 조회는 캐시 반환, 동시 호출은 진행 중 요청 1건으로 합침
 
-        try:
-            async with self._semaphore:
-                async with managed.get(url, headers=headers, params=params) as resp:
-                    try:
-                        data = await resp.json()
-                    except (aiohttp.ContentTypeError, ValueError) as e:
-                        raise RetryableError(f"JSON 파싱 실패 (status={resp.status}): {e}")
-                    self._classify_and_handle(resp.status, data)
-                    if data.get("rt_cd") == "0":
-                        output = data.get("output", {})
-                        return {
-                            "symbol": symbol,
-                            "price": float(output.get("last", 0)),
-                            "change": float(output.get("diff", 0)),
-                            "change_pct": float(output.get("rate", 0)),
-                            "volume": int(output.get("tvol", 0)),
-                            "high": float(output.get("high", 0)),
-                            "low": float(output.get("low", 0)),
-                            "open": float(output.get("open", 0)),
-                        }
-                    else:
-                        logger.error(
-                            f"해외 가격 조회 실패: rt_cd={data.get('rt_cd', 'UNKNOWN')}, msg={data.get('msg1', '')}"
-                        )
-                        return {}
-        finally:
-            if session_to_close:
-                await session_to_close.close()
+        ttl_seconds <= 0 이면 캐시를 거치지 않는다 (주문 직전 시세 등).
+        """
+        ttl = _PRICE_CACHE_TTL if ttl_seconds is None else ttl_seconds
+        if ttl <= 0:
+            return await fetch()
+
+        cached = self._lookup_price_cache(key, ttl)
+        if cached is not None:
+            return cached
+
+        async def fetch_and_store() -> Dict[str, Any]:
+            result = await fetch()
+            if result:  # 실패 응답({})은 캐시하지 않음
+                self._price_cache[key] = (time.monotonic(), result)
+                self._price_cache.move_to_end(key)
+                while len(self._price_cache) > _PRICE_CACHE_MAX:
+                    self._price_cache.popitem(last=False)
+            return result
+
+        return await self._coalesce(("price", *key), fetch_and_store)
+
+    def _lookup_price_cache(self, key: Tuple[str, KISMarket], ttl: float) -> Optional[Dict[str, Any]]:
+        cached = self._price_cache.get(key)
+        if cached is None or time.monotonic() - cached[0] >= ttl:
+            return None
+        self._price_cache.move_to_end(key)
+        return cached[1]
+
+    async def get_korea_price(self, symbol: str, ttl_seconds: Optional[float] = None) -> Dict[str, Any]:
+        """국내 주식 현재가 조회 (짧은 TTL 캐시 적용, ttl_seconds=0 이면 항상 새로 조회)"""
+        symbol = validate_symbol(symbol)
+        return await self._get_cached_price(
+            (symbol, KISMarket.KOREA), lambda: self._fetch_korea_price(symbol), ttl_seconds
+        )
 
-    @retry_async(
-        max_retries=3,
-        base_delay=1.0,
-        exceptions=(
-            RetryableError,
-            RateLimitError,
-            TokenExpiredError,
-            ConnectionError,
-            TimeoutError,
-            aiohttp.ClientError,
-        ),
-    )
-    async def get_balance(self) -> Dict[str, Any]:
-        """계좌 잔고 조회"""
-        token = await self._get_token()
-        tr_id = "TTTC8434R" if self.config.is_real else "VTTC8434R"
+    @_retry_read
+    async def _fetch_korea_price(self, symbol: str) -> Dict[str, Any]:
+        params = {"FID_COND_MRKT_DIV_CODE": "J", "FID_INPUT_ISCD": symbol}
+        data = await self._request("GET", "korea_price", _TR_KOREA_PRICE, params=params)
+        if data.get("rt_cd") == "0":
+            output = data.get("output", {})
+            return {
+                "symbol": symbol,
+                "price": float(output.get("stck_prpr", 0)),
+                "change": float(output.get("prdy_vrss", 0)),
+                "change_pct": float(output.get("prdy_ctrt", 0)),
+                "volume": int(output.get("acml_vol", 0)),
+                "high": float(output.get("stck_hgpr", 0)),
+                "low": float(output.get("stck_lwpr", 0)),
+                "open": float(output.get("stck_oprc", 0)),
+                "vi_cls_code": output.get("vi_cls_code", "0"),
+            }
+        else:
+            logger.error("가격 조회 실패: rt_cd=%s, msg=%s", data.get("rt_cd", "UNKNOWN"), data.get("msg1", ""))
+            return {}
 
-        url = f"{self.config.base_url}/uapi/domestic-stock/v1/trading/inquire-balance"
-        headers = self._get_headers(token, tr_id)
-        params = {
-            "CANO": self.config.account_no,
-            "ACNT_PRDT_CD": self.config.account_suffix,
-            "AFHR_FLPR_YN": "N",
-            "OFL_YN": "",
-            "INQR_DVSN": "02",
-            "UNPR_DVSN": "01",
-            "FUND_STTL_ICLD_YN": "N",
-            "FNCG_AMT_AUTO_RDPT_YN": "N",
-            "PRCS_DVSN": "00",
-            "CTX_AREA_FK100": "",
-            "CTX_AREA_NK100": "",
+    async def get_overseas_price(
+        self, symbol: str, market: KISMarket = KISMarket.USA, ttl_seconds: Optional[float] = None
+    ) -> Dict[str, Any]:
+        """해외 주식 현재가 조회 (짧은 TTL 캐시 적용, ttl_seconds=0 이면 항상 새로 조회)"""
+        symbol = validate_symbol(symbol)
+        return await self._get_cached_price(
+            (symbol, market), lambda: self._fetch_overseas_price(symbol, market), ttl_seconds
+        )
+
+    @_retry_read
+    async def _fetch_overseas_price(self, symbol: str, market: KISMarket) -> Dict[str, Any]:
+        params = {"AUTH": "", "EXCD": _OVERSEAS_PRICE_EXCD.get(market, "NAS"), "SYMB": symbol}
+        data = await self._request("GET", "overseas_price", _TR_OVERSEAS_PRICE, params=params)
+        if data.get("rt_cd") == "0":
+            output = data.get("output", {})
+            return {
+                "symbol": symbol,
+                "price": float(output.get("last", 0)),
+                "change": float(output.get("diff", 0)),
+                "change_pct": float(output.get("rate", 0)),
+                "volume": int(output.get("tvol", 0)),
+                "high": float(output.get("high", 0)),
+                "low": float(output.get("low", 0)),
+                "open": float(output.get("open", 0)),
+            }
+        else:
+            logger.error("해외 가격 조회 실패: rt_cd=%s, msg=%s", data.get("rt_cd", "UNKNOWN"), data.get("msg1", ""))
+            return {}
+
+    async def get_korea_prices(self, symbols: List[str]) -> Dict[str, Dict[str, Any]]:
+        """국내 주식 현재가 일괄 조회 (동시 요청, 실패 종목은 빈 dict)"""
+        return await self._gather_prices(symbols, self.get_korea_price)
+
+    async def get_overseas_prices(
+        self, symbols: List[str], market: KISMarket = KISMarket.USA
+    ) -> Dict[str, Dict[str, Any]]:
+        """해외 주식 현재가 일괄 조회 (동시 요청, 실패 종목은 빈 dict)"""
+        return await self._gather_prices(symbols, lambda s: self.get_overseas_price(s, market))
+
+    async def _gather_prices(
+        self, symbols: List[str], fetch: Callable[[str], Awaitable[Dict[str, Any]]]
+    ) -> Dict[str, Dict[str, Any]]:
+        sem = asyncio.Semaphore(_BATCH_CONCURRENCY)
+
+        async def _one(symbol: str) -> Dict[str, Any]:
+            async with sem:
+                return await fetch(symbol)
+
+        results = await asyncio.gather(*(_one(s) for s in symbols), return_exceptions=True)
+
+        prices: Dict[str, Dict[str, Any]] = {}
+        for symbol, result in zip(symbols, results):
+            if isinstance(result, BaseException):
+                logger.error(f"가격 일괄 조회 실패: {symbol} - {type(result).__name__}: {result}")
+                prices[symbol] = {}
+            else:
+                prices[symbol] = result
+        return prices
+
+    async def get_balance(self, columnar: bool = False) -> Dict[str, Any]:
+        """계좌 잔고 조회 (동시 호출은 1회 요청으로 합침)
+
+        기본은 positions (종목별 dict 리스트). columnar=True 이면 positions 대신
+        열 단위 배열 (symbols, names, quantities, avg_prices, current_prices, pnl, pnl_pct)을
+        반환한다 — 포트폴리오 전체를 벡터 연산하는 호출자용.
+        """
+        data = await self._coalesce(("balance",), self._fetch_balance)
+        if data.get("rt_cd") != "0":
+            logger.error("잔고 조회 실패: rt_cd=%s, msg=%s", data.get("rt_cd", "UNKNOWN"), data.get("msg1", ""))
+            return {}
+
+        output2 = data.get("output2", [{}])[0]
+        holdings = [item for item in data.get("output1", []) if int(item.get("hldg_qty", 0)) > 0]
+        result: Dict[str, Any] = {
+            "total_equity": float(output2.get("tot_evlu_amt", 0)),
+            "cash": float(output2.get("dnca_tot_amt", 0)),
         }
+        if columnar:
+            result.update(_balance_columns(holdings))
+        else:
+            result["positions"] = [
+                {
+                    "symbol": item.get("pdno"),
+                    "name": item.get("prdt_name"),
+                    "quantity": int(item.get("hldg_qty", 0)),
+                    "avg_price": float(item.get("pchs_avg_pric", 0)),
+                    "current_price": float(item.get("prpr", 0)),
+                    "pnl": float(item.get("evlu_pfls_amt", 0)),
+                    "pnl_pct": float(item.get("evlu_pfls_rt", 0)),
+                }
+                for item in holdings
+            ]
+        return result
 
-        managed = self._get_session()
-        session_to_close = None
-        if managed is None:
-            managed = aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=30))
-            session_to_close = managed
-
-        try:
-            async with self._semaphore:
-                async with managed.get(url, headers=headers, params=params) as resp:
-                    try:
-                        data = await resp.json()
-                    except (aiohttp.ContentTypeError, ValueError) as e:
-                        raise RetryableError(f"JSON 파싱 실패 (status={resp.status}): {e}")
-                    self._classify_and_handle(resp.status, data)
-                    if data.get("rt_cd") == "0":
-                        output1 = data.get("output1", [])
-                        output2 = data.get("output2", [{}])[0]
-
-                        positions = []
-                        for item in output1:
-                            if int(item.get("hldg_qty", 0)) > 0:
-                                positions.append(
-                                    {
-                                        "symbol": item.get("pdno"),
-                                        "name": item.get("prdt_name"),
-                                        "quantity": int(item.get("hldg_qty", 0)),
-                                        "avg_price": float(item.get("pchs_avg_pric", 0)),
-                                        "current_price": float(item.get("prpr", 0)),
-                                        "pnl": float(item.get("evlu_pfls_amt", 0)),
-                                        "pnl_pct": float(item.get("evlu_pfls_rt", 0)),
-                                    }
-                                )
-
-                        return {
-                            "total_equity": float(output2.get("tot_evlu_amt", 0)),
-                            "cash": float(output2.get("dnca_tot_amt", 0)),
-                            "positions": positions,
-                        }
-                    else:
-                        logger.error(
-                            f"잔고 조회 실패: rt_cd={data.get('rt_cd', 'UNKNOWN')}, msg={data.get('msg1', '')}"
-                        )
-                        return {}
-        finally:
-            if session_to_close:
-                await session_to_close.close()
+    @_retry_read
+    async def _fetch_balance(self) -> Dict[str, Any]:
+        return await self._request("GET", "balance", self.config.tr_ids["balance"], params=self._balance_params)
 
     # 주문 메서드는 멱등성 미보장이므로 @retry_async 적용하지 않음
-    # 5xx 후 재시도 시 중복 주문 위험
+    # 5xx 후 재시도 시 중복 주문 위험 → OrderSubmissionUnknownError로 대사 경로 유도
     async def place_order(
         self, symbol: str, side: OrderSide, quantity: int, price: float = 0, order_type: OrderType = OrderType.MARKET
     ) -> Dict[str, Any]:
         """국내 주식 주문"""
         symbol = validate_symbol(symbol)
-        token = await self._get_token()
-
-        if side == OrderSide.BUY:
-            tr_id = "TTTC0802U" if self.config.is_real else "VTTC0802U"
-        else:
-            tr_id = "TTTC0801U" if self.config.is_real else "VTTC0801U"
-
-        url = f"{self.config.base_url}/uapi/domestic-stock/v1/trading/order-cash"
-        headers = self._get_headers(token, tr_id)
+        tr_id = self.config.tr_ids["order_buy" if side == OrderSide.BUY else "order_sell"]
 
         payload = {
-            "CANO": self.config.account_no,
-            "ACNT_PRDT_CD": self.config.account_suffix,
+            **self._account_base,
             "PDNO": symbol,
             "ORD_DVSN": order_type.value,
             "ORD_QTY": str(quantity),
             "ORD_UNPR": str(int(price)) if order_type == OrderType.LIMIT else "0",
         }
 
-        managed = self._get_session()
-        session_to_close = None
-        if managed is None:
-            managed = aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=30))
-            session_to_close = managed
-
-        try:
-            async with self._semaphore:
-                async with managed.post(url, headers=headers, json=payload) as resp:
-                    try:
-                        data = await resp.json()
-                    except (aiohttp.ContentTypeError, ValueError) as e:
-                        raise KISAPIError(f"주문 응답 JSON 파싱 실패 (status={resp.status}): {e}")
-                    self._classify_and_handle(resp.status, data)
-                    if data.get("rt_cd") == "0":
-                        output = data.get("output", {})
-                        logger.info(f"주문 성공: {symbol} {side.value} {quantity}")
-                        return {"success": True, "order_no": output.get("ODNO"), "order_time": output.get("ORD_TMD")}
-                    else:
-                        logger.error(f"주문 실패: rt_cd={data.get('rt_cd', 'UNKNOWN')}, msg={data.get('msg1', '')}")
-                        return {"success": False, "message": data.get("msg1", "Unknown error")}
-        finally:
-            if session_to_close:
-                await session_to_close.close()
+        data = await self._request("POST", "order", tr_id, json=payload, idempotent=False)
+        if data.get("rt_cd") == "0":
+            output = data.get("output", {})
+            logger.info(f"주문 성공: {symbol} {side.value} {quantity}")
+            return {"success": True, "order_no": output.get("ODNO"), "order_time": output.get("ORD_TMD")}
+        else:
+            logger.error("주문 실패: rt_cd=%s, msg=%s", data.get("rt_cd", "UNKNOWN"), data.get("msg1", ""))
+            return {"success": False, "message": data.get("msg1", "Unknown error")}
 
     # 주문 메서드는 멱등성 미보장이므로 @retry_async 적용하지 않음
     async def place_overseas_order(
@@ -481,68 +793,25 @@ class KISAPIClient:
     ) -> Dict[str, Any]:
         """해외 주식 주문"""
         symbol = validate_symbol(symbol)
-        token = await self._get_token()
-
-        if side == OrderSide.BUY:
-            tr_id = "JTTT1002U" if self.config.is_real else "VTTT1002U"
-        else:
-            tr_id = "JTTT1006U" if self.config.is_real else "VTTT1006U"
-
-        url = f"{self.config.base_url}/uapi/overseas-stock/v1/trading/order"
-        headers = self._get_headers(token, tr_id)
-
-        excd_map = {KISMarket.USA: "NASD", KISMarket.JAPAN: "TKSE", KISMarket.HONGKONG: "SEHK"}
+        tr_id = self.config.tr_ids["overseas_order_buy" if side == OrderSide.BUY else "overseas_order_sell"]
 
         payload = {
-            "CANO": self.config.account_no,
-            "ACNT_PRDT_CD": self.config.account_suffix,
-            "OVRS_EXCG_CD": excd_map.get(market, "NASD"),
+            **self._overseas_order_base,
+            "OVRS_EXCG_CD": _OVERSEAS_ORDER_EXCD.get(market, "NASD"),
             "PDNO": symbol,
             "ORD_QTY": str(quantity),
             "OVRS_ORD_UNPR": str(price),
-            "ORD_SVR_DVSN_CD": "0",
-            "ORD_DVSN": "00",
         }
 
-        managed = self._get_session()
-        session_to_close = None
-        if managed is None:
-            managed = aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=30))
-            session_to_close = managed
-
-        try:
-            async with self._semaphore:
-                async with managed.post(url, headers=headers, json=payload) as resp:
-                    try:
-                        data = await resp.json()
-                    except (aiohttp.ContentTypeError, ValueError) as e:
-                        raise KISAPIError(f"해외 주문 응답 JSON 파싱 실패 (status={resp.status}): {e}")
-                    self._classify_and_handle(resp.status, data)
-                    if data.get("rt_cd") == "0":
-                        output = data.get("output", {})
-                        logger.info(f"해외 주문 성공: {symbol} {side.value} {quantity}")
-                        return {"success": True, "order_no": output.get("ODNO"), "order_time": output.get("ORD_TMD")}
-                    else:
-                        logger.error(
-                            f"해외 주문 실패: rt_cd={data.get('rt_cd', 'UNKNOWN')}, msg={data.get('msg1', '')}"
-                        )
-                        return {"success": False, "message": data.get("msg1", "Unknown error")}
-        finally:
-            if session_to_close:
-                await session_to_close.close()
+        data = await self._request("POST", "overseas_order", tr_id, json=payload, idempotent=False)
+        if data.get("rt_cd") == "0":
+            output = data.get("output", {})
+            logger.info(f"해외 주문 성공: {symbol} {side.value} {quantity}")
+            return {"success": True, "order_no": output.get("ODNO"), "order_time": output.get("ORD_TMD")}
+        else:
+            logger.error("해외 주문 실패: rt_cd=%s, msg=%s", data.get("rt_cd", "UNKNOWN"), data.get("msg1", ""))
+            return {"success": False, "message": data.get("msg1", "Unknown error")}
 
-    @retry_async(
-        max_retries=3,
-        base_delay=1.0,
-        exceptions=(
-            RetryableError,
-            RateLimitError,
-            TokenExpiredError,
-            ConnectionError,
-            TimeoutError,
-            aiohttp.ClientError,
-        ),
-    )
     async def get_daily_fills(self) -> list:
         """당일 전체 체결 내역 조회 (주문번호 필터 없음)
 
@@ -557,64 +826,24 @@ class KISAPIClient:
         Raises:
             KISAPIError: API 응답 rt_cd != "0" 또는 HTTP 오류 시
         """
-        token = await self._get_token()
-        tr_id = "TTTC8001R" if self.config.is_real else "VTTC8001R"
-
-        url = f"{self.config.base_url}/uapi/domestic-stock/v1/trading/inquire-daily-ccld"
-        headers = self._get_headers(token, tr_id)
-        params = {
-            "CANO": self.config.account_no,
-            "ACNT_PRDT_CD": self.config.account_suffix,
-            "INQR_STRT_DT": datetime.now().strftime("%Y%m%d"),
-            "INQR_END_DT": datetime.now().strftime("%Y%m%d"),
-            "SLL_BUY_DVSN_CD": "00",  # 전체 (매수+매도)
-            "INQR_DVSN": "00",
-            "PDNO": "",
-            "CCLD_DVSN": "00",
-            "ORD_GNO_BRNO": "",
-            "ODNO": "",  # 주문번호 필터 없음 — 전체 조회
-            "INQR_DVSN_3": "00",
-            "INQR_DVSN_1": "",
-            "CTX_AREA_FK100": "",
-            "CTX_AREA_NK100": "",
-        }
-
-        managed = self._get_session()
-        session_to_close = None
-        if managed is None:
-            managed = aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=30))
-            session_to_close = managed
-
-        try:
-            async with self._semaphore:
-                async with managed.get(url, headers=headers, params=params) as resp:
-                    try:
-                        data = await resp.json()
-                    except (aiohttp.ContentTypeError, ValueError) as e:
-                        raise RetryableError(f"JSON 파싱 실패 (status={resp.status}): {e}")
-                    self._classify_and_handle(resp.status, data)
-                    if data.get("rt_cd") == "0":
-                        fills: list[Any] = data.get("output1", [])
-                        return fills
-                    else:
-                        safe_msg = _sanitize_error(data)
-                        raise KISAPIError(f"당일 체결 조회 실패: {safe_msg}")
-        finally:
-            if session_to_close:
-                await session_to_close.close()
+        return await self._coalesce(("daily_fills",), self._fetch_daily_fills)
+
+    def _daily_ccld_params(self, order_no: str = "") -> Dict[str, str]:
+        """일별 주문체결조회 파라미터 (조회 시작/종료일은 같은 시각의 오늘 날짜)"""
+        today = datetime.now().strftime("%Y%m%d")
+        return {**self._daily_ccld_base, "INQR_STRT_DT": today, "INQR_END_DT": today, "ODNO": order_no}
+
+    @_retry_read
+    async def _fetch_daily_fills(self) -> list:
+        params = self._daily_ccld_params()  # 주문번호 필터 없음 — 전체 조회
+        data = await self._request("GET", "daily_ccld", self.config.tr_ids["daily_ccld"], params=params)
+        if data.get("rt_cd") == "0":
+            fills: list[Any] = data.get("output1", [])
+            return fills
+        else:
+            raise KISResponseError("당일 체결 조회 실패", data.get("rt_cd", "N/A"), data.get("msg1", "N/A"))
 
-    @retry_async(
-        max_retries=3,
-        base_delay=1.0,
-        exceptions=(
-            RetryableError,
-            RateLimitError,
-            TokenExpiredError,
-            ConnectionError,
-            TimeoutError,
-            aiohttp.ClientError,
-        ),
-    )
+    @_retry_read
     async def get_order_status(self, order_no: str) -> dict:
         """KIS 주문체결조회 API
 
@@ -626,64 +855,23 @@ class KISAPIClient:
         Returns:
             주문 상태 딕셔너리
         """
-        token = await self._get_token()
-        tr_id = "TTTC8001R" if self.config.is_real else "VTTC8001R"
-
-        url = f"{self.config.base_url}/uapi/domestic-stock/v1/trading/inquire-daily-ccld"
-        headers = self._get_headers(token, tr_id)
-        params = {
-            "CANO": self.config.account_no,
-            "ACNT_PRDT_CD": self.config.account_suffix,
-            "INQR_STRT_DT": datetime.now().strftime("%Y%m%d"),
-            "INQR_END_DT": datetime.now().strftime("%Y%m%d"),
-            "SLL_BUY_DVSN_CD": "00",  # 전체 (매수+매도)
-            "INQR_DVSN": "00",
-            "PDNO": "",
-            "CCLD_DVSN": "00",
-            "ORD_GNO_BRNO": "",
-            "ODNO": order_no,
-            "INQR_DVSN_3": "00",
-            "INQR_DVSN_1": "",
-            "CTX_AREA_FK100": "",
-            "CTX_AREA_NK100": "",
-        }
-
-        managed = self._get_session()
-        session_to_close = None
-        if managed is None:
-            managed = aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=30))
-            session_to_close = managed
-
-        try:
-            async with self._semaphore:
-                async with managed.get(url, headers=headers, params=params) as resp:
-                    try:
-                        data = await resp.json()
-                    except (aiohttp.ContentTypeError, ValueError) as e:
-                        raise RetryableError(f"JSON 파싱 실패 (status={resp.status}): {e}")
-                    self._classify_and_handle(resp.status, data)
-                    if data.get("rt_cd") == "0":
-                        output_list = data.get("output1", [])
-                        # 해당 주문번호에 대한 체결 내역 필터
-                        matched = [o for o in output_list if o.get("odno") == order_no]
-                        if matched:
-                            item = matched[0]
-                            return {
-                                "order_no": order_no,
-                                "status": "filled" if float(item.get("tot_ccld_qty", 0)) > 0 else "pending",
-                                "symbol": item.get("pdno", ""),
-                                "side": "buy" if item.get("sll_buy_dvsn_cd") == "02" else "sell",
-                                "order_qty": int(item.get("ord_qty", 0)),
-                                "filled_qty": int(item.get("tot_ccld_qty", 0)),
-                                "filled_price": float(item.get("avg_prvs", 0)),
-                                "order_time": item.get("ord_tmd", ""),
-                            }
-                        return {"order_no": order_no, "status": "not_found", "message": "주문 내역을 찾을 수 없음"}
-                    else:
-                        logger.error(
-                            f"주문 조회 실패: rt_cd={data.get('rt_cd', 'UNKNOWN')}, msg={data.get('msg1', '')}"
-                        )
-                        return {"order_no": order_no, "status": "error", "message": data.get("msg1", "Unknown error")}
-        finally:
-            if session_to_close:
-                await session_to_close.close()
+        params = self._daily_ccld_params(order_no)
+        data = await self._request("GET", "daily_ccld", self.config.tr_ids["daily_ccld"], params=params)
+        if data.get("rt_cd") == "0":
+            # ODNO 파라미터로 서버측 필터되지만, 응답 보장이 없으므로 첫 일치 항목에서 중단
+            item = next((o for o in data.get("output1", []) if o.get("odno") == order_no), None)
+            if item is not None:
+                return {
+                    "order_no": order_no,
+                    "status": "filled" if float(item.get("tot_ccld_qty", 0)) > 0 else "pending",
+                    "symbol": item.get("pdno", ""),
+                    "side": "buy" if item.get("sll_buy_dvsn_cd") == "02" else "sell",
+                    "order_qty": int(item.get("ord_qty", 0)),
+                    "filled_qty": int(item.get("tot_ccld_qty", 0)),
+                    "filled_price": float(item.get("avg_prvs", 0)),
+                    "order_time": item.get("ord_tmd", ""),
+                }
+            return {"order_no": order_no, "status": "not_found", "message": "주문 내역을 찾을 수 없음"}
+        else:
+            logger.error("주문 조회 실패: rt_cd=%s, msg=%s", data.get("rt_cd", "UNKNOWN"), data.get("msg1", ""))
+            return {"order_no": order_no, "status": "error", "message": data.get("msg1", "Unknown error")}
@@ -1,8 +1,9 @@
 """
 마켓 캘린더 및 시간대 관리 모듈
 - 한국/미국 시장 시간 확인
-- 주말/공휴일 체크
+- 주말/공휴일 체크 (종목·날짜 배열 일괄 판정 포함)
 - 시간대 변환
+- 장 상태 판정 (MarketState)
 
 ============================
 미국 일광절약시간(DST) 규칙
@@ -24,18 +25,32 @@ zoneinfo 라이브러리가 DST 변환을 자동으로 처리합니다.
 """
 
 import logging
+import time as _time
+from dataclasses import dataclass, field
 from datetime import date, datetime, time, timedelta
-from typing import Dict, Optional, TypedDict
+from enum import IntEnum
+from functools import lru_cache
+from typing import Dict, FrozenSet, Iterable, Optional, Set, Tuple, Union
 from zoneinfo import ZoneInfo
 
+import numpy as np
+
 logger = logging.getLogger(__name__)
 
 
-class MarketConfig(TypedDict):
+@dataclass(frozen=True, slots=True)
+class MarketConfig:
     open: time
     close: time
     tz: ZoneInfo
     name: str
+    # 개장/마감 시각 (자정 기준 분) — 장시간 판정용 정수 비교, open/close에서 파생
+    open_min: int = field(init=False)
+    close_min: int = field(init=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "open_min", self.open.hour * 60 + self.open.minute)
+        object.__setattr__(self, "close_min", self.close.hour * 60 + self.close.minute)
 
 
 KST: ZoneInfo = ZoneInfo("Asia/Seoul")
@@ -43,6 +58,15 @@ EST: ZoneInfo = ZoneInfo("US/Eastern")
 UTC: ZoneInfo = ZoneInfo("UTC")
 
 
+@lru_cache(maxsize=32)
+def _dst_bounds(year: int) -> Tuple[date, date]:
+    """(DST 시작일, 종료일) — 요일 오프셋을 정수 연산으로 계산, 연도별 캐시"""
+    # n번째 일요일 = 1일 + (6 - 1일 요일) % 7 + 7 * (n - 1)
+    start_day = 8 + (6 - date(year, 3, 1).weekday()) % 7  # 3월 두 번째 일요일
+    end_day = 1 + (6 - date(year, 11, 1).weekday()) % 7  # 11월 첫 번째 일요일
+    return date(year, 3, start_day), date(year, 11, end_day)
+
+
 def dst_start(year: int) -> date:
     """미국 DST 시작일: 3월 두 번째 일요일 반환
 
@@ -52,11 +76,7 @@ def dst_start(year: int) -> date:
     Returns:
         DST 시작 날짜 (02:00 AM EST에 EDT로 전환)
     """
-    # 3월 1일부터 첫 번째 일요일 찾기
-    march_1 = date(year, 3, 1)
-    days_until_sunday = (6 - march_1.weekday()) % 7
-    first_sunday = march_1 + timedelta(days=days_until_sunday)
-    return first_sunday + timedelta(weeks=1)  # 두 번째 일요일
+    return _dst_bounds(year)[0]
 
 
 def dst_end(year: int) -> date:
@@ -68,9 +88,7 @@ def dst_end(year: int) -> date:
     Returns:
         DST 종료 날짜 (02:00 AM EDT에 EST로 전환)
     """
-    november_1 = date(year, 11, 1)
-    days_until_sunday = (6 - november_1.weekday()) % 7
-    return november_1 + timedelta(days=days_until_sunday)  # 첫 번째 일요일
+    return _dst_bounds(year)[1]
 
 
 def is_dst(dt: date, year: Optional[int] = None) -> bool:
@@ -83,69 +101,58 @@ def is_dst(dt: date, year: Optional[int] = None) -> bool:
     Returns:
         DST 기간이면 True
     """
-    y = dt.year if year is None else year
-    return dst_start(y) <= dt < dst_end(y)
+    start, end = _dst_bounds(dt.year if year is None else year)
+    return start <= dt < end
 
 
 MARKET_HOURS: Dict[str, MarketConfig] = {
-    "KR": {
-        "open": time(9, 0),
-        "close": time(15, 30),
-        "tz": KST,
-        "name": "한국거래소 (KRX)",
-    },
-    "US": {
-        "open": time(9, 30),
-        "close": time(16, 0),
-        "tz": EST,
-        "name": "NYSE/NASDAQ",
-    },
-    "CRYPTO": {
-        "open": time(0, 0),
-        "close": time(23, 59),
-        "tz": UTC,
-        "name": "Crypto (24/7)",
-    },
+    "KR": MarketConfig(open=time(9, 0), close=time(15, 30), tz=KST, name="한국거래소 (KRX)"),
+    "US": MarketConfig(open=time(9, 30), close=time(16, 0), tz=EST, name="NYSE/NASDAQ"),
+    "CRYPTO": MarketConfig(open=time(0, 0), close=time(23, 59), tz=UTC, name="Crypto (24/7)"),
 }
 
 # 한국 공휴일 (2026년) - 수동 관리 필요 (대체공휴일 포함)
-KR_HOLIDAYS_2026 = {
-    date(2026, 1, 1),  # 신정
-    date(2026, 2, 16),  # 설날 연휴
-    date(2026, 2, 17),  # 설날
-    date(2026, 2, 18),  # 설날 연휴
-    date(2026, 3, 1),  # 삼일절 (일요일)
-    date(2026, 3, 2),  # 삼일절 대체공휴일
-    date(2026, 5, 5),  # 어린이날
-    date(2026, 5, 24),  # 부처님오신날 (일요일)
-    date(2026, 5, 25),  # 부처님오신날 대체공휴일
-    date(2026, 6, 6),  # 현충일 (토요일)
-    date(2026, 6, 8),  # 현충일 대체공휴일
-    date(2026, 8, 15),  # 광복절 (토요일)
-    date(2026, 8, 17),  # 광복절 대체공휴일
-    date(2026, 9, 24),  # 추석 연휴
-    date(2026, 9, 25),  # 추석
-    date(2026, 9, 26),  # 추석 연휴 (토요일)
-    date(2026, 9, 28),  # 추석 대체공휴일
-    date(2026, 10, 3),  # 개천절 (토요일)
-    date(2026, 10, 5),  # 개천절 대체공휴일
-    date(2026, 10, 9),  # 한글날
-    date(2026, 12, 25),  # 크리스마스
-}
+KR_HOLIDAYS_2026 = frozenset(
+    {
+        date(2026, 1, 1),  # 신정
+        date(2026, 2, 16),  # 설날 연휴
+        date(2026, 2, 17),  # 설날
+        date(2026, 2, 18),  # 설날 연휴
+        date(2026, 3, 1),  # 삼일절 (일요일)
+        date(2026, 3, 2),  # 삼일절 대체공휴일
+        date(2026, 5, 5),  # 어린이날
+        date(2026, 5, 24),  # 부처님오신날 (일요일)
+        date(2026, 5, 25),  # 부처님오신날 대체공휴일
+        date(2026, 6, 6),  # 현충일 (토요일)
+        date(2026, 6, 8),  # 현충일 대체공휴일
+        date(2026, 8, 15),  # 광복절 (토요일)
+        date(2026, 8, 17),  # 광복절 대체공휴일
+        date(2026, 9, 24),  # 추석 연휴
+        date(2026, 9, 25),  # 추석
+        date(2026, 9, 26),  # 추석 연휴 (토요일)
+        date(2026, 9, 28),  # 추석 대체공휴일
+        date(2026, 10, 3),  # 개천절 (토요일)
+        date(2026, 10, 5),  # 개천절 대체공휴일
+        date(2026, 10, 9),  # 한글날
+        date(2026, 12, 25),  # 크리스마스
+    }
+)
 
 # 미국 공휴일 (2026년) - 주요 휴장일
-US_HOLIDAYS_2026 = {
-    date(2026, 1, 1),  # New Year's Day
-    date(2026, 1, 19),  # MLK Day
-    date(2026, 2, 16),  # Presidents' Day
-    date(2026, 4, 3),  # Good Friday
-    date(2026, 5, 25),  # Memorial Day
-    date(2026, 6, 19),  # Juneteenth
-    date(2026, 7, 3),  # Independence Day (observed)
-    date(2026, 9, 7),  # Labor Day
-    date(2026, 11, 26),  # Thanksgiving
-    date(2026, 12, 25),  # Christmas
-}
+US_HOLIDAYS_2026 = frozenset(
+    {
+        date(2026, 1, 1),  # New Year's Day
+        date(2026, 1, 19),  # MLK Day
+        date(2026, 2, 16),  # Presidents' Day
+        date(2026, 4, 3),  # Good Friday
+        date(2026, 5, 25),  # Memorial Day
+        date(2026, 6, 19),  # Juneteenth
+        date(2026, 7, 3),  # Independence Day (observed)
+        date(2026, 9, 7),  # Labor Day
+        date(2026, 11, 26),  # Thanksgiving
+        date(2026, 12, 25),  # Christmas
+    }
+)
 
 # 한국 공휴일 (2027년) - 대체공휴일 포함
 # 설날: 2/6(토)~2/8(월) - 2/6(토)→2/9(화) 대체, 2/7(일)→2/10(수) 대체
@@ -154,174 +161,185 @@ US_HOLIDAYS_2026 = {
 # 개천절: 10/3(일)→10/4(월) 대체
 # 한글날: 10/9(토)→10/11(월) 대체
 # 크리스마스: 12/25(토)→12/27(월) 대체
-KR_HOLIDAYS_2027 = {
-    date(2027, 1, 1),  # 신정
-    date(2027, 2, 6),  # 설날 연휴 (토)
-    date(2027, 2, 7),  # 설날 (일)
-    date(2027, 2, 8),  # 설날 연휴 (월)
-    date(2027, 2, 9),  # 설날 대체공휴일 (토→화)
-    date(2027, 2, 10),  # 설날 대체공휴일 (일→수)
-    date(2027, 3, 1),  # 삼일절 (월)
-    date(2027, 5, 5),  # 어린이날 (수)
-    date(2027, 5, 13),  # 부처님오신날 (목)
-    date(2027, 6, 6),  # 현충일 (일)
-    date(2027, 6, 7),  # 현충일 대체공휴일 (월)
-    date(2027, 8, 15),  # 광복절 (일)
-    date(2027, 8, 16),  # 광복절 대체공휴일 (월)
-    date(2027, 9, 22),  # 추석 연휴 (수)
-    date(2027, 9, 23),  # 추석 (목)
-    date(2027, 9, 24),  # 추석 연휴 (금)
-    date(2027, 10, 3),  # 개천절 (일)
-    date(2027, 10, 4),  # 개천절 대체공휴일 (월)
-    date(2027, 10, 9),  # 한글날 (토)
-    date(2027, 10, 11),  # 한글날 대체공휴일 (월)
-    date(2027, 12, 25),  # 크리스마스 (토)
-    date(2027, 12, 27),  # 크리스마스 대체공휴일 (월)
-}
+KR_HOLIDAYS_2027 = frozenset(
+    {
+        date(2027, 1, 1),  # 신정
+        date(2027, 2, 6),  # 설날 연휴 (토)
+        date(2027, 2, 7),  # 설날 (일)
+        date(2027, 2, 8),  # 설날 연휴 (월)
+        date(2027, 2, 9),  # 설날 대체공휴일 (토→화)
+        date(2027, 2, 10),  # 설날 대체공휴일 (일→수)
+        date(2027, 3, 1),  # 삼일절 (월)
+        date(2027, 5, 5),  # 어린이날 (수)
+        date(2027, 5, 13),  # 부처님오신날 (목)
+        date(2027, 6, 6),  # 현충일 (일)
+        date(2027, 6, 7),  # 현충일 대체공휴일 (월)
+        date(2027, 8, 15),  # 광복절 (일)
+        date(2027, 8, 16),  # 광복절 대체공휴일 (월)
+        date(2027, 9, 22),  # 추석 연휴 (수)
+        date(2027, 9, 23),  # 추석 (목)
+        date(2027, 9, 24),  # 추석 연휴 (금)
+        date(2027, 10, 3),  # 개천절 (일)
+        date(2027, 10, 4),  # 개천절 대체공휴일 (월)
+        date(2027, 10, 9),  # 한글날 (토)
+        date(2027, 10, 11),  # 한글날 대체공휴일 (월)
+        date(2027, 12, 25),  # 크리스마스 (토)
+        date(2027, 12, 27),  # 크리스마스 대체공휴일 (월)
+    }
+)
 
 # 미국 공휴일 (2027년) - NYSE 휴장일
 # Juneteenth: 6/19(토)→6/18(금) 관찰
 # Independence Day: 7/4(일)→7/5(월) 관찰
 # Christmas: 12/25(토)→12/24(금) 관찰
 # New Year's Day 2028: 1/1(토)→12/31(금) 관찰 (2027년 휴장)
-US_HOLIDAYS_2027 = {
-    date(2027, 1, 1),  # New Year's Day (Fri)
-    date(2027, 1, 18),  # MLK Day (3rd Monday January)
-    date(2027, 2, 15),  # Presidents' Day (3rd Monday February)
-    date(2027, 3, 26),  # Good Friday
-    date(2027, 5, 31),  # Memorial Day (last Monday May)
-    date(2027, 6, 18),  # Juneteenth observed (Sat → Fri)
-    date(2027, 7, 5),  # Independence Day observed (Sun → Mon)
-    date(2027, 9, 6),  # Labor Day (1st Monday September)
-    date(2027, 11, 25),  # Thanksgiving (4th Thursday November)
-    date(2027, 12, 24),  # Christmas observed (Sat → Fri)
-    date(2027, 12, 31),  # New Year's Day 2028 observed (Sat → Fri)
-}
+US_HOLIDAYS_2027 = frozenset(
+    {
+        date(2027, 1, 1),  # New Year's Day (Fri)
+        date(2027, 1, 18),  # MLK Day (3rd Monday January)
+        date(2027, 2, 15),  # Presidents' Day (3rd Monday February)
+        date(2027, 3, 26),  # Good Friday
+        date(2027, 5, 31),  # Memorial Day (last Monday May)
+        date(2027, 6, 18),  # Juneteenth observed (Sat → Fri)
+        date(2027, 7, 5),  # Independence Day observed (Sun → Mon)
+        date(2027, 9, 6),  # Labor Day (1st Monday September)
+        date(2027, 11, 25),  # Thanksgiving (4th Thursday November)
+        date(2027, 12, 24),  # Christmas observed (Sat → Fri)
+        date(2027, 12, 31),  # New Year's Day 2028 observed (Sat → Fri)
+    }
+)
 
 # 한국 공휴일 (2028년) - 대체공휴일 없음
 # 설날: 1/26(수)~1/28(금) - 모두 평일
 # 부처님오신날: 5/2(화)
 # 추석: 10/10(화)~10/12(목)
-KR_HOLIDAYS_2028 = {
-    date(2028, 1, 1),  # 신정
-    date(2028, 1, 26),  # 설날 연휴 (수)
-    date(2028, 1, 27),  # 설날 (목)
-    date(2028, 1, 28),  # 설날 연휴 (금)
-    date(2028, 3, 1),  # 삼일절 (수)
-    date(2028, 5, 2),  # 부처님오신날 (화)
-    date(2028, 5, 5),  # 어린이날 (금)
-    date(2028, 6, 6),  # 현충일 (화)
-    date(2028, 8, 15),  # 광복절 (화)
-    date(2028, 10, 3),  # 개천절 (화)
-    date(2028, 10, 9),  # 한글날 (월)
-    date(2028, 10, 10),  # 추석 연휴 (화)
-    date(2028, 10, 11),  # 추석 (수)
-    date(2028, 10, 12),  # 추석 연휴 (목)
-    date(2028, 12, 25),  # 크리스마스 (월)
-}
+KR_HOLIDAYS_2028 = frozenset(
+    {
+        date(2028, 1, 1),  # 신정
+        date(2028, 1, 26),  # 설날 연휴 (수)
+        date(2028, 1, 27),  # 설날 (목)
+        date(2028, 1, 28),  # 설날 연휴 (금)
+        date(2028, 3, 1),  # 삼일절 (수)
+        date(2028, 5, 2),  # 부처님오신날 (화)
+        date(2028, 5, 5),  # 어린이날 (금)
+        date(2028, 6, 6),  # 현충일 (화)
+        date(2028, 8, 15),  # 광복절 (화)
+        date(2028, 10, 3),  # 개천절 (화)
+        date(2028, 10, 9),  # 한글날 (월)
+        date(2028, 10, 10),  # 추석 연휴 (화)
+        date(2028, 10, 11),  # 추석 (수)
+        date(2028, 10, 12),  # 추석 연휴 (목)
+        date(2028, 12, 25),  # 크리스마스 (월)
+    }
+)
 
 # 미국 공휴일 (2028년) - NYSE 휴장일
 # New Year's Day 2028은 토요일이므로 2027-12-31(금)에 관찰 (US_HOLIDAYS_2027에 포함)
-US_HOLIDAYS_2028 = {
-    date(2028, 1, 17),  # MLK Day (3rd Monday January)
-    date(2028, 2, 21),  # Presidents' Day (3rd Monday February)
-    date(2028, 4, 14),  # Good Friday
-    date(2028, 5, 29),  # Memorial Day (last Monday May)
-    date(2028, 6, 19),  # Juneteenth (Mon)
-    date(2028, 7, 4),  # Independence Day (Tue)
-    date(2028, 9, 4),  # Labor Day (1st Monday September)
-    date(2028, 11, 23),  # Thanksgiving (4th Thursday November)
-    date(2028, 12, 25),  # Christmas (Mon)
-}
+US_HOLIDAYS_2028 = frozenset(
+    {
+        date(2028, 1, 17),  # MLK Day (3rd Monday January)
+        date(2028, 2, 21),  # Presidents' Day (3rd Monday February)
+        date(2028, 4, 14),  # Good Friday
+        date(2028, 5, 29),  # Memorial Day (last Monday May)
+        date(2028, 6, 19),  # Juneteenth (Mon)
+        date(2028, 7, 4),  # Independence Day (Tue)
+        date(2028, 9, 4),  # Labor Day (1st Monday September)
+        date(2028, 11, 23),  # Thanksgiving (4th Thursday November)
+        date(2028, 12, 25),  # Christmas (Mon)
+    }
+)
 
 # 한국 공휴일 (2029년) - 대체공휴일 포함
 # 설날: 2/12(월)~2/14(수) - 모두 평일
 # 어린이날: 5/5(토)→5/7(월) 대체
 # 부처님오신날: 5/20(일)→5/21(월) 대체
 # 추석: 9/29(토)~10/1(월) - 9/29(토)→10/2(화) 대체, 9/30(일)→10/4(목) 대체
-KR_HOLIDAYS_2029 = {
-    date(2029, 1, 1),  # 신정
-    date(2029, 2, 12),  # 설날 연휴 (월)
-    date(2029, 2, 13),  # 설날 (화)
-    date(2029, 2, 14),  # 설날 연휴 (수)
-    date(2029, 3, 1),  # 삼일절 (목)
-    date(2029, 5, 5),  # 어린이날 (토)
-    date(2029, 5, 7),  # 어린이날 대체공휴일 (월)
-    date(2029, 5, 20),  # 부처님오신날 (일)
-    date(2029, 5, 21),  # 부처님오신날 대체공휴일 (월)
-    date(2029, 6, 6),  # 현충일 (수)
-    date(2029, 8, 15),  # 광복절 (수)
-    date(2029, 9, 29),  # 추석 연휴 (토)
-    date(2029, 9, 30),  # 추석 (일)
-    date(2029, 10, 1),  # 추석 연휴 (월)
-    date(2029, 10, 2),  # 추석 대체공휴일 (토→화)
-    date(2029, 10, 3),  # 개천절 (수)
-    date(2029, 10, 4),  # 추석 대체공휴일 (일→목)
-    date(2029, 10, 9),  # 한글날 (화)
-    date(2029, 12, 25),  # 크리스마스 (화)
-}
+KR_HOLIDAYS_2029 = frozenset(
+    {
+        date(2029, 1, 1),  # 신정
+        date(2029, 2, 12),  # 설날 연휴 (월)
+        date(2029, 2, 13),  # 설날 (화)
+        date(2029, 2, 14),  # 설날 연휴 (수)
+        date(2029, 3, 1),  # 삼일절 (목)
+        date(2029, 5, 5),  # 어린이날 (토)
+        date(2029, 5, 7),  # 어린이날 대체공휴일 (월)
+        date(2029, 5, 20),  # 부처님오신날 (일)
+        date(2029, 5, 21),  # 부처님오신날 대체공휴일 (월)
+        date(2029, 6, 6),  # 현충일 (수)
+        date(2029, 8, 15),  # 광복절 (수)
+        date(2029, 9, 29),  # 추석 연휴 (토)
+        date(2029, 9, 30),  # 추석 (일)
+        date(2029, 10, 1),  # 추석 연휴 (월)
+        date(2029, 10, 2),  # 추석 대체공휴일 (토→화)
+        date(2029, 10, 3),  # 개천절 (수)
+        date(2029, 10, 4),  # 추석 대체공휴일 (일→목)
+        date(2029, 10, 9),  # 한글날 (화)
+        date(2029, 12, 25),  # 크리스마스 (화)
+    }
+)
 
 # 미국 공휴일 (2029년) - NYSE 휴장일
-US_HOLIDAYS_2029 = {
-    date(2029, 1, 1),  # New Year's Day (Mon)
-    date(2029, 1, 15),  # MLK Day (3rd Monday January)
-    date(2029, 2, 19),  # Presidents' Day (3rd Monday February)
-    date(2029, 3, 30),  # Good Friday
-    date(2029, 5, 28),  # Memorial Day (last Monday May)
-    date(2029, 6, 19),  # Juneteenth (Wed)
-    date(2029, 7, 4),  # Independence Day (Wed)
-    date(2029, 9, 3),  # Labor Day (1st Monday September)
-    date(2029, 11, 22),  # Thanksgiving (4th Thursday November)
-    date(2029, 12, 25),  # Christmas (Tue)
-}
+US_HOLIDAYS_2029 = frozenset(
+    {
+        date(2029, 1, 1),  # New Year's Day (Mon)
+        date(2029, 1, 15),  # MLK Day (3rd Monday January)
+        date(2029, 2, 19),  # Presidents' Day (3rd Monday February)
+        date(2029, 3, 30),  # Good Friday
+        date(2029, 5, 28),  # Memorial Day (last Monday May)
+        date(2029, 6, 19),  # Juneteenth (Wed)
+        date(2029, 7, 4),  # Independence Day (Wed)
+        date(2029, 9, 3),  # Labor Day (1st Monday September)
+        date(2029, 11, 22),  # Thanksgiving (4th Thursday November)
+        date(2029, 12, 25),  # Christmas (Tue)
+    }
+)
 
 # 한국 공휴일 (2030년) - 대체공휴일 포함
 # 설날: 2/2(토)~2/4(월) - 2/2(토)→2/5(화) 대체, 2/3(일)→2/6(수) 대체
 # 어린이날: 5/5(일)→5/6(월) 대체
 # 추석: 9/19(목)~9/21(토) - 9/21(토)→9/23(월) 대체
-KR_HOLIDAYS_2030 = {
-    date(2030, 1, 1),  # 신정
-    date(2030, 2, 2),  # 설날 연휴 (토)
-    date(2030, 2, 3),  # 설날 (일)
-    date(2030, 2, 4),  # 설날 연휴 (월)
-    date(2030, 2, 5),  # 설날 대체공휴일 (토→화)
-    date(2030, 2, 6),  # 설날 대체공휴일 (일→수)
-    date(2030, 3, 1),  # 삼일절 (금)
-    date(2030, 5, 5),  # 어린이날 (일)
-    date(2030, 5, 6),  # 어린이날 대체공휴일 (월)
-    date(2030, 5, 9),  # 부처님오신날 (목)
-    date(2030, 6, 6),  # 현충일 (목)
-    date(2030, 8, 15),  # 광복절 (목)
-    date(2030, 9, 19),  # 추석 연휴 (목)
-    date(2030, 9, 20),  # 추석 (금)
-    date(2030, 9, 21),  # 추석 연휴 (토)
-    date(2030, 9, 23),  # 추석 대체공휴일 (월)
-    date(2030, 10, 3),  # 개천절 (목)
-    date(2030, 10, 9),  # 한글날 (수)
-    date(2030, 12, 25),  # 크리스마스 (수)
-}
+KR_HOLIDAYS_2030 = frozenset(
+    {
+        date(2030, 1, 1),  # 신정
+        date(2030, 2, 2),  # 설날 연휴 (토)
+        date(2030, 2, 3),  # 설날 (일)
+        date(2030, 2, 4),  # 설날 연휴 (월)
+        date(2030, 2, 5),  # 설날 대체공휴일 (토→화)
+        date(2030, 2, 6),  # 설날 대체공휴일 (일→수)
+        date(2030, 3, 1),  # 삼일절 (금)
+        date(2030, 5, 5),  # 어린이날 (일)
+        date(2030, 5, 6),  # 어린이날 대체공휴일 (월)
+        date(2030, 5, 9),  # 부처님오신날 (목)
+        date(2030, 6, 6),  # 현충일 (목)
+        date(2030, 8, 15),  # 광복절 (목)
+        date(2030, 9, 19),  # 추석 연휴 (목)
+        date(2030, 9, 20),  # 추석 (금)
+        date(2030, 9, 21),  # 추석 연휴 (토)
+        date(2030, 9, 23),  # 추석 대체공휴일 (월)
+        date(2030, 10, 3),  # 개천절 (목)
+        date(2030, 10, 9),  # 한글날 (수)
+        date(2030, 12, 25),  # 크리스마스 (수)
+    }
+)
 
 # 미국 공휴일 (2030년) - NYSE 휴장일
-US_HOLIDAYS_2030 = {
-    date(2030, 1, 1),  # New Year's Day (Tue)
-    date(2030, 1, 21),  # MLK Day (3rd Monday January)
-    date(2030, 2, 18),  # Presidents' Day (3rd Monday February)
-    date(2030, 4, 19),  # Good Friday
-    date(2030, 5, 27),  # Memorial Day (last Monday May)
-    date(2030, 6, 19),  # Juneteenth (Wed)
-    date(2030, 7, 4),  # Independence Day (Thu)
-    date(2030, 9, 2),  # Labor Day (1st Monday September)
-    date(2030, 11, 28),  # Thanksgiving (4th Thursday November)
-    date(2030, 12, 25),  # Christmas (Wed)
-}
-
-HOLIDAYS = {
-    "KR": KR_HOLIDAYS_2026 | KR_HOLIDAYS_2027 | KR_HOLIDAYS_2028 | KR_HOLIDAYS_2029 | KR_HOLIDAYS_2030,
-    "US": US_HOLIDAYS_2026 | US_HOLIDAYS_2027 | US_HOLIDAYS_2028 | US_HOLIDAYS_2029 | US_HOLIDAYS_2030,
-}
+US_HOLIDAYS_2030 = frozenset(
+    {
+        date(2030, 1, 1),  # New Year's Day (Tue)
+        date(2030, 1, 21),  # MLK Day (3rd Monday January)
+        date(2030, 2, 18),  # Presidents' Day (3rd Monday February)
+        date(2030, 4, 19),  # Good Friday
+        date(2030, 5, 27),  # Memorial Day (last Monday May)
+        date(2030, 6, 19),  # Juneteenth (Wed)
+        date(2030, 7, 4),  # Independence Day (Thu)
+        date(2030, 9, 2),  # Labor Day (1st Monday September)
+        date(2030, 11, 28),  # Thanksgiving (4th Thursday November)
+        date(2030, 12, 25),  # Christmas (Wed)
+    }
+)
 
 # 연도별 공휴일 조회를 위한 맵
-KR_HOLIDAYS_BY_YEAR = {
+KR_HOLIDAYS_BY_YEAR: Dict[int, FrozenSet[date]] = {
     2026: KR_HOLIDAYS_2026,
     2027: KR_HOLIDAYS_2027,
     2028: KR_HOLIDAYS_2028,
@@ -329,7 +347,7 @@ KR_HOLIDAYS_BY_YEAR = {
     2030: KR_HOLIDAYS_2030,
 }
 
-US_HOLIDAYS_BY_YEAR = {
+US_HOLIDAYS_BY_YEAR: Dict[int, FrozenSet[date]] = {
     2026: US_HOLIDAYS_2026,
     2027: US_HOLIDAYS_2027,
     2028: US_HOLIDAYS_2028,
@@ -337,23 +355,82 @@ US_HOLIDAYS_BY_YEAR = {
     2030: US_HOLIDAYS_2030,
 }
 
+# is_holiday 조회용 마켓 → 연도 → frozenset 인덱스 (연도별 선언 집합을 복사 없이 공유)
+HOLIDAYS_BY_YEAR: Dict[str, Dict[int, FrozenSet[date]]] = {
+    "KR": KR_HOLIDAYS_BY_YEAR,
+    "US": US_HOLIDAYS_BY_YEAR,
+    "CRYPTO": {},
+}
+
+# 전체 기간 합집합 (하위 호환용 — 조회는 HOLIDAYS_BY_YEAR 사용)
+HOLIDAYS = {market: frozenset().union(*years.values()) for market, years in HOLIDAYS_BY_YEAR.items() if years}
+
+
+def _build_nonbiz_bitmap(year: int, holidays: FrozenSet[date]) -> int:
+    """연중 일차(1월 1일=bit 0)별 휴장일(주말 또는 공휴일) 비트맵"""
+    jan1 = date(year, 1, 1)
+    bitmap = 0
+    for offset in range((date(year + 1, 1, 1) - jan1).days):
+        day = jan1 + timedelta(days=offset)
+        if day.weekday() >= 5 or day in holidays:
+            bitmap |= 1 << offset
+    return bitmap
+
+
+# 마켓 → 연도 → 휴장일 비트맵 (영업일 판정을 shift/and 1회로)
+NONBIZ_BITMAP: Dict[str, Dict[int, int]] = {
+    market: {year: _build_nonbiz_bitmap(year, days) for year, days in years.items()}
+    for market, years in HOLIDAYS_BY_YEAR.items()
+}
+
+# 마켓 → 공휴일 proleptic ordinal 정렬 배열 (is_holiday_vec 일괄 판정용)
+_HOLIDAY_ORDINALS: Dict[str, np.ndarray] = {
+    market: np.array(sorted(d.toordinal() for d in days), dtype=np.int64) for market, days in HOLIDAYS.items()
+}
+# date(1970, 1, 1).toordinal() — datetime64[D] 일수 → ordinal 변환 오프셋
+_EPOCH_ORDINAL = 719163
+
+# 공휴일 데이터 보유 연도 범위 (경고 메시지용; 연도 추가 시 자동 반영)
+_MIN_YEAR, _MAX_YEAR = min(KR_HOLIDAYS_BY_YEAR), max(KR_HOLIDAYS_BY_YEAR)
+
+# 공휴일 데이터 범위 밖 연도 경고 이력 (마켓·연도별 1회만 경고)
+_warned_years: Set[Tuple[str, int]] = set()
+
+
+# 마켓별 UTC 오프셋 캐시: market -> (UTC 기준 시간 번호, 오프셋, fold)
+# 시간대 전환(DST 등)은 UTC 정시에 일어나므로 같은 UTC 시간 안에서는 오프셋이 불변
+_tz_offset_cache: Dict[str, Tuple[int, timedelta, int]] = {}
+
+
+def _to_market_time(market: str, tz: ZoneInfo, utc_now: datetime) -> datetime:
+    """UTC 시각 → 마켓 현지 시각 (시간대 변환은 UTC 1시간당 1회)"""
+    hour_key = utc_now.toordinal() * 24 + utc_now.hour
+    cached = _tz_offset_cache.get(market)
+    if cached is not None and cached[0] == hour_key:
+        return (utc_now + cached[1]).replace(tzinfo=tz, fold=cached[2])
+    local = utc_now.astimezone(tz)
+    offset = local.utcoffset()
+    if offset is not None:
+        _tz_offset_cache[market] = (hour_key, offset, local.fold)
+    return local
+
 
 def get_market_time(market: str = "KR") -> datetime:
     """해당 마켓의 현재 시간 반환"""
     config = MARKET_HOURS.get(market)
-    if not config:
+    if config is None:
         raise ValueError(f"Unknown market: {market}")
-    return datetime.now(config["tz"])
+    return _to_market_time(market, config.tz, datetime.now(UTC))
 
 
-def is_weekend(dt: Optional[datetime] = None, market: str = "KR") -> bool:
+def is_weekend(dt: Optional[date] = None, market: str = "KR") -> bool:
     """주말 여부 확인"""
     if dt is None:
         dt = get_market_time(market)
     return dt.weekday() >= 5
 
 
-def is_holiday(dt: Optional[datetime] = None, market: str = "KR") -> bool:
+def is_holiday(dt: Optional[date] = None, market: str = "KR") -> bool:
     """공휴일 여부 확인"""
     if market == "CRYPTO":
         return False  # Crypto markets never have holidays
@@ -361,76 +438,141 @@ def is_holiday(dt: Optional[datetime] = None, market: str = "KR") -> bool:
         dt = get_market_time(market)
 
     check_date = dt.date() if isinstance(dt, datetime) else dt
-    holidays = HOLIDAYS.get(market, set())
-    if holidays and check_date.year not in range(2026, 2031):
-        logger.warning(f"Holiday data only available for 2026-2030, checking year {check_date.year}")
+    year_map = HOLIDAYS_BY_YEAR.get(market)
+    if not year_map:
+        return False
+    holidays = year_map.get(check_date.year)
+    if holidays is None:
+        if (market, check_date.year) not in _warned_years:
+            _warned_years.add((market, check_date.year))
+            logger.warning(f"Holiday data only available for {_MIN_YEAR}-{_MAX_YEAR}, checking year {check_date.year}")
+        return False
     return check_date in holidays
 
 
-def is_market_open(market: str = "KR") -> bool:
-    """해당 마켓이 현재 장중인지 확인"""
+@lru_cache(maxsize=None)
+def _jan1_ordinal(year: int) -> int:
+    return date(year, 1, 1).toordinal()
+
+
+def _snapshot(now: datetime) -> Tuple[date, int, int]:
+    """현지 시각 → (날짜, 요일, 자정 이후 분) — 판정 경로에서 1회만 분해"""
+    day = now.date()
+    return day, day.weekday(), now.hour * 60 + now.minute
+
+
+def is_holiday_vec(dates: Union[np.ndarray, Iterable[date]], market: str = "KR") -> np.ndarray:
+    """날짜 배열의 공휴일 여부를 한 번에 판정 (bool 마스크 반환)
+
+    datetime64 배열은 일 단위로 내림하고, 그 외에는 date/datetime 시퀀스로 취급.
+    공휴일 데이터 범위 밖 연도는 is_holiday와 같이 False (경고 없음).
+    """
+    arr = np.asarray(dates)
+    if np.issubdtype(arr.dtype, np.datetime64):
+        ordinals = arr.astype("datetime64[D]").astype(np.int64) + _EPOCH_ORDINAL
+    else:
+        ordinals = np.fromiter((d.toordinal() for d in arr.ravel()), dtype=np.int64, count=arr.size).reshape(arr.shape)
+    holidays = _HOLIDAY_ORDINALS.get(market)
+    if holidays is None:
+        return np.zeros(ordinals.shape, dtype=bool)
+    return np.isin(ordinals, holidays)
+
+
+def _is_nonbiz(market: str, day: date, weekday: Optional[int] = None) -> bool:
+    """휴장일(주말 또는 공휴일) 여부 — 비트맵이 없는 연도는 개별 판정으로 대체"""
+    bitmap = NONBIZ_BITMAP.get(market, {}).get(day.year)
+    if bitmap is None:
+        if weekday is None:
+            weekday = day.weekday()
+        return weekday >= 5 or is_holiday(day, market)
+    return bool((bitmap >> (day.toordinal() - _jan1_ordinal(day.year))) & 1)
+
+
+class MarketState(IntEnum):
+    WEEKEND = 0
+    HOLIDAY = 1
+    PRE_OPEN = 2
+    OPEN = 3
+    POST_CLOSE = 4
+
+
+def _classify_at(market: str, config: MarketConfig, now: datetime) -> MarketState:
+    """이미 계산된 시장 현지 시각 기준 상태 판정 (문자열 포맷 없음)"""
+    day, weekday, minute = _snapshot(now)
+    if _is_nonbiz(market, day, weekday):
+        return MarketState.WEEKEND if weekday >= 5 else MarketState.HOLIDAY
+    if minute < config.open_min:
+        return MarketState.PRE_OPEN
+    if minute <= config.close_min:
+        return MarketState.OPEN
+    return MarketState.POST_CLOSE
+
+
+def classify_market(market: str = "KR") -> Tuple[MarketState, datetime]:
+    """현재 마켓 상태와 판정 기준 현지 시각 반환 (시계는 1회만 조회)"""
     config = MARKET_HOURS.get(market)
-    if not config:
+    if config is None:
         raise ValueError(f"Unknown market: {market}")
-
     now = get_market_time(market)
+    return _classify_at(market, config, now), now
 
-    # 주말 체크
-    if is_weekend(now, market):
-        return False
-
-    # 공휴일 체크
-    if is_holiday(now, market):
-        return False
 
-    # 장시간 체크
-    return bool(config["open"] <= now.time() <= config["close"])
+def is_market_open(market: str = "KR") -> bool:
+    """해당 마켓이 현재 장중인지 확인"""
+    return classify_market(market)[0] is MarketState.OPEN
 
 
 def get_market_status(market: str = "KR") -> str:
     """마켓 상태 문자열 반환"""
     config = MARKET_HOURS.get(market)
-    if not config:
+    if config is None:
         return f"Unknown market: {market}"
 
-    now = get_market_time(market)
-
-    if is_weekend(now, market):
-        return f"{config['name']}: 휴장 (주말)"
-
-    if is_holiday(now, market):
-        return f"{config['name']}: 휴장 (공휴일)"
+    state, now = classify_market(market)
+    if state is MarketState.WEEKEND:
+        return f"{config.name}: 휴장 (주말)"
+    if state is MarketState.HOLIDAY:
+        return f"{config.name}: 휴장 (공휴일)"
 
-    if is_market_open(market):
-        return f"{config['name']}: 장중 ({now.strftime('%H:%M')})"
+    hhmm = now.strftime("%H:%M")
+    if state is MarketState.OPEN:
+        return f"{config.name}: 장중 ({hhmm})"
+    if state is MarketState.PRE_OPEN:
+        return f"{config.name}: 장전 ({hhmm}, 개장 {config.open.strftime('%H:%M')})"
+    return f"{config.name}: 장후 ({hhmm}, 마감 {config.close.strftime('%H:%M')})"
 
-    if now.time() < config["open"]:
-        return f"{config['name']}: 장전 ({now.strftime('%H:%M')}, 개장 {config['open'].strftime('%H:%M')})"
 
-    return f"{config['name']}: 장후 ({now.strftime('%H:%M')}, 마감 {config['close'].strftime('%H:%M')})"
+_KR_SUFFIXES = (".KS", ".KQ")
+_CRYPTO_SUFFIXES = ("-USD", "USDT")
 
 
+@lru_cache(maxsize=4096)
 def infer_market(symbol: str) -> str:
-    """심볼에서 마켓 추론"""
-    if symbol.endswith(".KS") or symbol.endswith(".KQ"):
+    """심볼에서 마켓 추론 (유니버스가 한정적이므로 결과 캐시)"""
+    if symbol.endswith(_KR_SUFFIXES):
         return "KR"
-    if symbol.endswith("-USD") or symbol.endswith("USDT"):
+    if symbol.endswith(_CRYPTO_SUFFIXES):
         return "CRYPTO"
     return "US"
 
 
+# should_check_signals 결과 캐시: market -> (UNIX 기준 분 번호, 결과)
+_signals_cache: Dict[str, Tuple[int, bool]] = {}
+
+
 def should_check_signals(symbol: str) -> bool:
     """해당 심볼의 시그널 체크가 가능한 시간인지 확인"""
     market = infer_market(symbol)
     if market == "CRYPTO":
         return True  # Crypto: 24/7 trading
 
-    now = get_market_time(market)
-
-    # 주말/공휴일이면 체크 불필요
-    if is_weekend(now, market) or is_holiday(now, market):
-        return False
+    # 결과는 마켓과 현재 분에만 의존 → 심볼 N개 스캔에도 마켓당 분당 1회만 판정
+    minute = int(_time.time() // 60)
+    cached = _signals_cache.get(market)
+    if cached is not None and cached[0] == minute:
+        return cached[1]
 
-    # 장 마감 후 ~ 자정 사이에 일일 데이터 기반 시그널 체크 가능
-    config = MARKET_HOURS[market]
-    return bool(now.time() >= config["close"])
+    # 장 마감 후 ~ 자정 사이에 일일 데이터 기반 시그널 체크 가능 (주말/공휴일 제외)
+    result = classify_market(market)[0] is MarketState.POST_CLOSE
+    _signals_cache[market] = (minute, result)
+    return result
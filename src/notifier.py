@@ -11,26 +11,31 @@ import html as html_lib
 import logging
 import smtplib
 import ssl
+import threading
+import time
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from email.mime.multipart import MIMEMultipart
 from email.mime.text import MIMEText
-from enum import Enum
-from typing import Any, Dict, List, Optional
+from enum import IntEnum
+from typing import Any, Dict, List, Optional, Tuple
 from urllib.parse import urlparse
 
 import aiohttp
 
-from src.utils import retry_async
+from src.utils import AsyncTokenBucket, CircuitBreaker, json_dumps, parse_retry_after, retry_async
 
 logger = logging.getLogger(__name__)
 
 
-class NotificationLevel(Enum):
-    INFO = "info"
-    WARNING = "warning"
-    SIGNAL = "signal"
-    ERROR = "error"
+class NotificationLevel(IntEnum):
+    """알림 레벨 (값 = 레벨별 표시 테이블 인덱스)"""
+
+    INFO = 0
+    WARNING = 1
+    SIGNAL = 2
+    ERROR = 3
 
 
 @dataclass
@@ -42,50 +47,132 @@ class NotificationMessage:
 
 
 class NotificationChannel(ABC):
+    # 일시 실패 후 재시도한 횟수 (최종 실패는 NotificationManager가 failure로 집계)
+    retries: int = 0
+
     @abstractmethod
     async def send(self, message: NotificationMessage) -> bool:
         pass
 
+    async def close(self) -> None:
+        """채널이 보유한 자원 정리 (기본: 없음)"""
+
+
+class NotificationSendError(RuntimeError):
+    """채널 전송 실패 (retry_after: 서버가 지정한 재시도 대기 초, 없으면 None)"""
+
+    def __init__(self, *args: Any, retry_after: Optional[float] = None):
+        super().__init__(*args)
+        self.retry_after = retry_after
+
+
+def _count_retry(args: tuple, error: Exception) -> None:
+    """retry_async on_retry 훅: 채널 인스턴스(args[0])의 재시도 횟수 누적"""
+    args[0].retries += 1
+
+
+async def _retry_after_of(resp: aiohttp.ClientResponse) -> Optional[float]:
+    """429 응답의 대기 초 (Retry-After 헤더 → 본문 retry_after 순, 없으면 None)"""
+    retry_after = parse_retry_after(resp.headers.get("Retry-After"))
+    if retry_after is not None:
+        return retry_after
+    try:
+        body = await resp.json(content_type=None)
+    except (aiohttp.ClientError, ValueError):
+        return None
+    if not isinstance(body, dict):
+        return None
+    # Discord: {"retry_after": 1.5}, Telegram: {"parameters": {"retry_after": 3}}
+    value = body.get("retry_after")
+    if value is None and isinstance(body.get("parameters"), dict):
+        value = body["parameters"].get("retry_after")
+    return float(value) if isinstance(value, (int, float)) else None
+
+
+# HTTP 채널 공용 커넥터 설정 (알림 버스트 시 TCP/TLS 연결 재사용)
+_HTTP_CONNECTOR_LIMIT = 10
+_HTTP_KEEPALIVE_TIMEOUT = 60
+_HTTP_DNS_CACHE_TTL = 300
+_HTTP_TIMEOUT_SECONDS = 10
+_HTTP_CONNECT_TIMEOUT_SECONDS = 3  # 연결 수립 지연은 빠르게 실패시켜 재시도로 넘김
+
+# 채널별 전송 속도 제한 (초당 토큰, 버스트) — 공급자 한도보다 보수적으로 잡아 429 자체를 회피
+# Telegram: 동일 채팅방 초당 ~1건 권장 / Discord 웹훅: 2초당 5건
+_TELEGRAM_RATE = (1.0, 5)
+_DISCORD_RATE = (2.0, 5)
+
 
-class TelegramChannel(NotificationChannel):
+class _HTTPChannel(NotificationChannel):
+    """채널 수명 동안 단일 aiohttp 세션을 재사용하는 HTTP 채널 베이스"""
+
+    _session: Optional[aiohttp.ClientSession] = None
+
+    async def _get_session(self) -> aiohttp.ClientSession:
+        """keep-alive 세션 반환 (최초 사용 시 1회 생성 후 재사용)"""
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=_HTTP_CONNECTOR_LIMIT,
+                ttl_dns_cache=_HTTP_DNS_CACHE_TTL,
+                keepalive_timeout=_HTTP_KEEPALIVE_TIMEOUT,
+            )
+            self._session = aiohttp.ClientSession(
+                connector=connector,
+                timeout=aiohttp.ClientTimeout(total=_HTTP_TIMEOUT_SECONDS, connect=_HTTP_CONNECT_TIMEOUT_SECONDS),
+                json_serialize=json_dumps,
+            )
+        return self._session
+
+    async def close(self) -> None:
+        """세션 종료 (다음 전송 시 새 세션을 생성)"""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+
+
+# 레벨별 표시 (NotificationLevel 값으로 인덱싱: INFO, WARNING, SIGNAL, ERROR 순)
+_TELEGRAM_EMOJI: Tuple[str, ...] = ("ℹ️", "⚠️", "🚨", "❌")
+_DISCORD_COLOR: Tuple[int, ...] = (0x3498DB, 0xF39C12, 0xE74C3C, 0x992D22)
+
+
+class TelegramChannel(_HTTPChannel):
     def __init__(self, bot_token: str, chat_id: str):
         self.bot_token = bot_token
         self.chat_id = chat_id
         self.base_url = f"https://api.telegram.org/bot{bot_token}"
+        self._bucket = AsyncTokenBucket(*_TELEGRAM_RATE)
 
     def _format_message(self, message: NotificationMessage) -> str:
-        emoji_map = {
-            NotificationLevel.INFO: "ℹ️",
-            NotificationLevel.WARNING: "⚠️",
-            NotificationLevel.SIGNAL: "🚨",
-            NotificationLevel.ERROR: "❌",
-        }
-        emoji = emoji_map.get(message.level, "📢")
-        text = f"{emoji} *{message.title}*\n\n{message.body}"
+        emoji = _TELEGRAM_EMOJI[message.level]
+        parts = [f"{emoji} *{message.title}*\n\n{message.body}"]
         if message.data:
-            text += "\n\n```\n"
-            for k, v in message.data.items():
-                text += f"{k}: {v}\n"
-            text += "```"
-        return text
-
-    @retry_async(max_retries=2, base_delay=1.0)
-    async def _send_with_retry(self, message: NotificationMessage) -> bool:
-        """재시도 로직을 포함한 실제 전송 (예외를 그대로 전파하여 retry가 동작)"""
-        text = self._format_message(message)
-        url = f"{self.base_url}/sendMessage"
-        payload = {"chat_id": self.chat_id, "text": text, "parse_mode": "Markdown"}
-        async with aiohttp.ClientSession() as session:
-            async with session.post(url, json=payload) as resp:
-                if resp.status == 200:
-                    logger.info(f"Telegram 전송 성공: {message.title}")
-                    return True
-                else:
-                    raise RuntimeError(f"Telegram 전송 실패: HTTP {resp.status}")
+            parts.append("\n\n```\n")
+            parts.extend(f"{k}: {v}\n" for k, v in message.data.items())
+            parts.append("```")
+        return "".join(parts)
+
+    def _build_payload(self, message: NotificationMessage) -> Dict[str, Any]:
+        return {"chat_id": self.chat_id, "text": self._format_message(message), "parse_mode": "Markdown"}
+
+    @retry_async(max_retries=3, base_delay=1.0, max_delay=30.0, full_jitter=True, on_retry=_count_retry)
+    async def _send_with_retry(self, message: NotificationMessage, payload: Optional[Dict[str, Any]] = None) -> bool:
+        """재시도 로직을 포함한 실제 전송 (예외를 그대로 전파하여 retry가 동작)
+
+        payload는 send()에서 한 번만 만들어 재시도마다 재사용한다.
+        """
+        await self._bucket.acquire()
+        if payload is None:
+            payload = self._build_payload(message)
+        session = await self._get_session()
+        async with session.post(f"{self.base_url}/sendMessage", json=payload) as resp:
+            if resp.status == 200:
+                logger.info(f"Telegram 전송 성공: {message.title}")
+                return True
+            retry_after = await _retry_after_of(resp) if resp.status == 429 else None
+            raise NotificationSendError(f"Telegram 전송 실패: HTTP {resp.status}", retry_after=retry_after)
 
     async def send(self, message: NotificationMessage) -> bool:
         try:
-            return await self._send_with_retry(message)
+            return await self._send_with_retry(message, self._build_payload(message))
         except Exception as e:
             logger.error(f"Telegram 오류 (모든 재시도 소진): {e}")
             return False
@@ -94,7 +181,7 @@ class TelegramChannel(NotificationChannel):
 _DISCORD_ALLOWED_HOSTS = ("discord.com", "discordapp.com")
 
 
-class DiscordChannel(NotificationChannel):
+class DiscordChannel(_HTTPChannel):
     def __init__(self, webhook_url: str):
         parsed = urlparse(webhook_url)
         if parsed.scheme != "https":
@@ -104,39 +191,45 @@ class DiscordChannel(NotificationChannel):
         if not parsed.path.startswith("/api/webhooks/"):
             raise ValueError(f"Invalid Discord webhook path: {parsed.path!r}")
         self.webhook_url = webhook_url
+        self._bucket = AsyncTokenBucket(*_DISCORD_RATE)
 
     def _format_embed(self, message: NotificationMessage) -> Dict:
-        color_map = {
-            NotificationLevel.INFO: 0x3498DB,
-            NotificationLevel.WARNING: 0xF39C12,
-            NotificationLevel.SIGNAL: 0xE74C3C,
-            NotificationLevel.ERROR: 0x992D22,
+        embed = {
+            "title": message.title,
+            "description": message.body,
+            "color": _DISCORD_COLOR[message.level],
         }
-        embed = {"title": message.title, "description": message.body, "color": color_map.get(message.level, 0x95A5A6)}
         if message.data:
             embed["fields"] = [{"name": k, "value": str(v), "inline": True} for k, v in message.data.items()]
         return embed
 
-    @retry_async(max_retries=2, base_delay=1.0)
-    async def _send_with_retry(self, message: NotificationMessage) -> bool:
-        """재시도 로직을 포함한 실제 전송 (예외를 그대로 전파하여 retry가 동작)"""
-        payload = {"embeds": [self._format_embed(message)]}
-        async with aiohttp.ClientSession() as session:
-            async with session.post(self.webhook_url, json=payload) as resp:
-                if resp.status in (200, 204):
-                    logger.info(f"Discord 전송 성공: {message.title}")
-                    return True
-                else:
-                    raise RuntimeError(f"Discord 전송 실패: HTTP {resp.status}")
+    @retry_async(max_retries=3, base_delay=1.0, max_delay=30.0, full_jitter=True, on_retry=_count_retry)
+    async def _send_with_retry(self, message: NotificationMessage, payload: Optional[Dict[str, Any]] = None) -> bool:
+        """재시도 로직을 포함한 실제 전송 (payload는 send()에서 한 번만 생성)"""
+        await self._bucket.acquire()
+        if payload is None:
+            payload = {"embeds": [self._format_embed(message)]}
+        session = await self._get_session()
+        async with session.post(self.webhook_url, json=payload) as resp:
+            if resp.status in (200, 204):
+                logger.info(f"Discord 전송 성공: {message.title}")
+                return True
+            retry_after = await _retry_after_of(resp) if resp.status == 429 else None
+            raise NotificationSendError(f"Discord 전송 실패: HTTP {resp.status}", retry_after=retry_after)
 
     async def send(self, message: NotificationMessage) -> bool:
         try:
-            return await self._send_with_retry(message)
+            return await self._send_with_retry(message, {"embeds": [self._format_embed(message)]})
         except Exception as e:
             logger.error(f"Discord 오류 (모든 재시도 소진): {e}")
             return False
 
 
+_EMAIL_MAX_WORKERS = 2
+# SMTP 연결 재사용 상한 (장기 연결의 서버측 제한·누수 회피를 위해 주기적으로 재연결)
+_SMTP_MAX_SENDS_PER_CONNECTION = 100
+
+
 class EmailChannel(NotificationChannel):
     def __init__(
         self, smtp_host: str, smtp_port: int, username: str, password: str, from_addr: str, to_addrs: List[str]
@@ -147,52 +240,125 @@ class EmailChannel(NotificationChannel):
         self.password = password
         self.from_addr = from_addr
         self.to_addrs = to_addrs
+        # SMTP 전용 스레드 풀 (느린 SMTP가 기본 executor의 다른 작업을 막지 않도록 분리)
+        self._executor: Optional[ThreadPoolExecutor] = None
+        # 인증된 SMTP 연결 재사용 (smtplib.SMTP는 스레드 안전하지 않으므로 락으로 직렬화)
+        self._smtp: Optional[smtplib.SMTP] = None
+        self._smtp_sends = 0
+        self._smtp_lock = threading.Lock()
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=_EMAIL_MAX_WORKERS, thread_name_prefix="email")
+        return self._executor
 
     def _format_html(self, message: NotificationMessage) -> str:
-        html = f"""
+        parts = [
+            f"""
         <html>
         <body>
         <h2>{html_lib.escape(message.title)}</h2>
         <p>{html_lib.escape(message.body)}</p>
         """
+        ]
         if message.data:
-            html += "<table border='1' cellpadding='5'>"
-            for k, v in message.data.items():
-                html += f"<tr><td><b>{html_lib.escape(str(k))}</b></td><td>{html_lib.escape(str(v))}</td></tr>"
-            html += "</table>"
-        html += "</body></html>"
-        return html
-
-    @retry_async(max_retries=2, base_delay=1.0)
-    async def _send_with_retry(self, message: NotificationMessage) -> bool:
-        """재시도 로직을 포함한 실제 전송 (예외를 그대로 전파하여 retry가 동작)"""
+            parts.append("<table border='1' cellpadding='5'>")
+            parts.extend(
+                f"<tr><td><b>{html_lib.escape(str(k))}</b></td><td>{html_lib.escape(str(v))}</td></tr>"
+                for k, v in message.data.items()
+            )
+            parts.append("</table>")
+        parts.append("</body></html>")
+        return "".join(parts)
+
+    def _build_mime(self, message: NotificationMessage) -> MIMEMultipart:
         msg = MIMEMultipart("alternative")
         msg["Subject"] = f"[Turtle] {message.title}"
         msg["From"] = self.from_addr
         msg["To"] = ", ".join(self.to_addrs)
-
-        html_content = self._format_html(message)
         msg.attach(MIMEText(message.body, "plain"))
-        msg.attach(MIMEText(html_content, "html"))
-
+        msg.attach(MIMEText(self._format_html(message), "html"))
+        return msg
+
+    @retry_async(max_retries=2, base_delay=1.0, on_retry=_count_retry)
+    async def _send_with_retry(self, message: NotificationMessage, msg: Optional[MIMEMultipart] = None) -> bool:
+        """재시도 로직을 포함한 실제 전송 (MIME 메시지는 send()에서 한 번만 생성)"""
+        if msg is None:
+            msg = self._build_mime(message)
         loop = asyncio.get_running_loop()
-        await loop.run_in_executor(None, self._send_email, msg)
+        await loop.run_in_executor(self._get_executor(), self._send_email, msg)
         logger.info(f"Email 전송 성공: {message.title}")
         return True
 
     async def send(self, message: NotificationMessage) -> bool:
         try:
-            return await self._send_with_retry(message)
+            return await self._send_with_retry(message, self._build_mime(message))
         except Exception as e:
             logger.error(f"Email 오류 (모든 재시도 소진): {e}")
             return False
 
-    def _send_email(self, msg: MIMEMultipart):
+    async def close(self) -> None:
+        """SMTP 연결과 스레드 풀 종료 (진행 중인 전송은 완료까지 유지)"""
+        if self._executor is not None:
+            if self._smtp is not None:
+                await asyncio.get_running_loop().run_in_executor(self._executor, self._close_smtp)
+            self._executor.shutdown(wait=False)
+        self._executor = None
+
+    def _connect_smtp(self) -> smtplib.SMTP:
         context = ssl.create_default_context()
-        with smtplib.SMTP(self.smtp_host, self.smtp_port, timeout=10) as server:
+        server = smtplib.SMTP(self.smtp_host, self.smtp_port, timeout=10)
+        try:
             server.starttls(context=context)
             server.login(self.username, self.password)
-            server.send_message(msg)
+        except Exception:
+            server.close()
+            raise
+        return server
+
+    def _get_smtp(self) -> smtplib.SMTP:
+        """재사용 가능한 SMTP 연결 반환 (NOOP 실패·재사용 상한 도달 시 재연결; _smtp_lock 보유 상태에서 호출)"""
+        if self._smtp is not None and self._smtp_sends < _SMTP_MAX_SENDS_PER_CONNECTION:
+            try:
+                if self._smtp.noop()[0] == 250:
+                    return self._smtp
+            except (smtplib.SMTPException, OSError):
+                pass
+        self._disconnect_smtp()
+        self._smtp = self._connect_smtp()
+        self._smtp_sends = 0
+        return self._smtp
+
+    def _close_smtp(self) -> None:
+        with self._smtp_lock:
+            self._disconnect_smtp()
+
+    def _disconnect_smtp(self) -> None:
+        if self._smtp is None:
+            return
+        try:
+            self._smtp.quit()
+        except (smtplib.SMTPException, OSError):
+            self._smtp.close()
+        self._smtp = None
+
+    def _send_email(self, msg: MIMEMultipart):
+        with self._smtp_lock:
+            server = self._get_smtp()
+            try:
+                server.send_message(msg)
+            except Exception:
+                # 연결 상태를 알 수 없으므로 폐기 — 재시도 시 새로 연결
+                self._disconnect_smtp()
+                raise
+            self._smtp_sends += 1
+
+
+# 동시 전송 상한 하한값 (채널 수 × 2와 비교해 큰 값 사용)
+_MIN_DISPATCH_CONCURRENCY = 10
+
+# INFO/WARNING: 앞 채널이 이 시간(초) 안에 응답하지 않으면 다음 채널을 병행 시도
+_ESCALATION_HEDGE_DELAY = 2.0
 
 
 class NotificationManager:
@@ -200,12 +366,113 @@ class NotificationManager:
         self.channels: List[NotificationChannel] = []
         # 채널별 성공/실패 카운터
         self._health: Dict[str, Dict[str, int]] = {}
+        # 채널별 전송 지연 [횟수, 합계 초, 최대 초] (서킷 OPEN 생략·취소된 전송 제외)
+        self._latency: Dict[str, List[float]] = {}
+        # 채널별 서킷 브레이커 (장애 채널은 재시도·백오프 없이 즉시 실패 처리)
+        self._breakers: Dict[NotificationChannel, CircuitBreaker] = {}
+        # 동시 전송 수 제한 (여러 심볼이 동시에 send_signal 해도 소켓·태스크 폭증 방지)
+        self._dispatch_limit = _MIN_DISPATCH_CONCURRENCY
+        self._dispatch_sem = asyncio.Semaphore(self._dispatch_limit)
 
     def add_channel(self, channel: NotificationChannel):
         self.channels.append(channel)
         channel_name = channel.__class__.__name__
         if channel_name not in self._health:
             self._health[channel_name] = {"success": 0, "failure": 0}
+        self._breakers[channel] = CircuitBreaker(name=channel_name)
+        limit = max(_MIN_DISPATCH_CONCURRENCY, len(self.channels) * 2)
+        if limit != self._dispatch_limit:
+            self._dispatch_limit = limit
+            self._dispatch_sem = asyncio.Semaphore(limit)
+            logger.debug(f"알림 동시 전송 상한: {limit}")
+
+    async def _send_guarded(self, channel: NotificationChannel, message: NotificationMessage) -> bool:
+        """서킷이 열린 채널은 네트워크 호출 없이 실패로 처리"""
+        breaker = self._breakers.get(channel)
+        if breaker is None:
+            breaker = self._breakers[channel] = CircuitBreaker(name=channel.__class__.__name__)
+        if not breaker.allow():
+            logger.debug(f"서킷 OPEN으로 전송 생략: {breaker.name}")
+            return False
+        start = time.perf_counter()
+        try:
+            async with self._dispatch_sem:
+                start = time.perf_counter()  # 세마포어 대기 시간 제외
+                success = bool(await channel.send(message))
+        except asyncio.CancelledError:
+            # 헤지 패배 등으로 취소: 성공/실패 어느 쪽도 아니므로 시험 호출 슬롯만 반환
+            breaker.release_probe()
+            raise
+        except Exception:
+            self._observe_latency(channel, time.perf_counter() - start)
+            breaker.record_failure()
+            raise
+        self._observe_latency(channel, time.perf_counter() - start)
+        if success:
+            breaker.record_success()
+        else:
+            breaker.record_failure()
+        return success
+
+    def _observe_latency(self, channel: NotificationChannel, elapsed: float) -> None:
+        stats = self._latency.setdefault(channel.__class__.__name__, [0, 0.0, 0.0])
+        stats[0] += 1
+        stats[1] += elapsed
+        if elapsed > stats[2]:
+            stats[2] = elapsed
+
+    def _record_outcome(self, name: str, success: bool) -> None:
+        """건강 지표 갱신 (채널 단위 최종 결과)"""
+        stats = self._health.setdefault(name, {"success": 0, "failure": 0})
+        stats["success" if success else "failure"] += 1
+
+    async def _send_first_available(self, message: NotificationMessage) -> Dict[str, bool]:
+        """채널 순서대로 시도해 첫 성공 채널만 반환 (hedged fallback)
+
+        앞 채널이 실패하면 즉시, 응답이 _ESCALATION_HEDGE_DELAY 이상 지연되면
+        다음 채널을 병행 시작한다. 하나가 성공하면 나머지는 취소하며,
+        취소된 채널은 건강 지표에 반영하지 않는다.
+        """
+        remaining = iter(self.channels)
+        pending: Dict["asyncio.Task[bool]", NotificationChannel] = {}
+
+        def launch_next() -> bool:
+            channel = next(remaining, None)
+            if channel is None:
+                return False
+            pending[asyncio.create_task(self._send_guarded(channel, message))] = channel
+            return True
+
+        has_more = launch_next()
+        try:
+            while pending:
+                done, _ = await asyncio.wait(
+                    pending,
+                    timeout=_ESCALATION_HEDGE_DELAY if has_more else None,
+                    return_when=asyncio.FIRST_COMPLETED,
+                )
+                if not done:
+                    has_more = launch_next()
+                    continue
+                # 시작 순서(채널 우선순위)대로 결과 처리
+                for task in [t for t in pending if t in done]:
+                    channel = pending.pop(task)
+                    name = channel.__class__.__name__
+                    error = task.exception()
+                    if error is None and task.result():
+                        self._record_outcome(name, True)
+                        return {name: True}
+                    if error is not None:
+                        logger.error(f"{name} 전송 예외: {error}")
+                    self._record_outcome(name, False)
+                    if has_more:
+                        has_more = launch_next()
+            return {}
+        finally:
+            for task in pending:
+                task.cancel()
+            if pending:
+                await asyncio.gather(*pending, return_exceptions=True)
 
     async def send_all(self, message: NotificationMessage) -> Dict[str, bool]:
         """모든 채널에 병렬 전송; ERROR 레벨 시 전체 실패 시 CRITICAL 로그"""
@@ -213,7 +480,7 @@ class NotificationManager:
             return {}
 
         channel_names = [ch.__class__.__name__ for ch in self.channels]
-        tasks = [ch.send(message) for ch in self.channels]
+        tasks = [self._send_guarded(ch, message) for ch in self.channels]
 
         # 병렬 전송
         results_list = await asyncio.gather(*tasks, return_exceptions=True)
@@ -225,13 +492,7 @@ class NotificationManager:
             else:
                 success = bool(result)
             results[name] = success
-            # 건강 지표 업데이트
-            if name not in self._health:
-                self._health[name] = {"success": 0, "failure": 0}
-            if success:
-                self._health[name]["success"] += 1
-            else:
-                self._health[name]["failure"] += 1
+            self._record_outcome(name, success)
 
         # ERROR 레벨이고 모든 채널이 실패하면 CRITICAL 로그
         if message.level == NotificationLevel.ERROR and not any(results.values()):
@@ -239,10 +500,38 @@ class NotificationManager:
 
         return results
 
+    async def close(self) -> None:
+        """모든 채널의 자원(HTTP 세션 등) 정리; 프로세스 종료 전 호출"""
+        await asyncio.gather(*(ch.close() for ch in self.channels), return_exceptions=True)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *args):
+        await self.close()
+
     def get_channel_health(self) -> Dict[str, Dict[str, int]]:
         """채널별 성공/실패 횟수 반환"""
         return dict(self._health)
 
+    def get_channel_metrics(self) -> Dict[str, Dict[str, float]]:
+        """채널별 성공/최종 실패/재시도 횟수와 전송 지연(평균·최대 초)"""
+        metrics: Dict[str, Dict[str, float]] = {}
+        for name, health in self._health.items():
+            count, total, peak = self._latency.get(name, (0, 0.0, 0.0))
+            metrics[name] = {
+                "success": health.get("success", 0),
+                "failure": health.get("failure", 0),
+                "retries": 0,
+                "avg_latency": total / count if count else 0.0,
+                "max_latency": peak,
+            }
+        for ch in self.channels:
+            entry = metrics.get(ch.__class__.__name__)
+            if entry is not None:
+                entry["retries"] += ch.retries
+        return metrics
+
     async def send_with_escalation(self, message: NotificationMessage) -> Dict[str, bool]:
         """
         레벨에 따른 에스컬레이션 전송:
@@ -254,18 +543,7 @@ class NotificationManager:
             return {}
 
         if message.level in (NotificationLevel.INFO, NotificationLevel.WARNING):
-            # 첫 번째 채널에만 시도
-            for channel in self.channels:
-                name = channel.__class__.__name__
-                success = await channel.send(message)
-                if name not in self._health:
-                    self._health[name] = {"success": 0, "failure": 0}
-                if success:
-                    self._health[name]["success"] += 1
-                    return {name: True}
-                else:
-                    self._health[name]["failure"] += 1
-            return {}
+            return await self._send_first_available(message)
 
         if message.level == NotificationLevel.SIGNAL:
             return await self.send_all(message)
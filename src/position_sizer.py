@@ -9,7 +9,7 @@ from typing import Dict, Optional
 from src.types import Direction
 
 
-@dataclass
+@dataclass(slots=True)
 class LivePosition:
     symbol: str
     direction: Direction
@@ -31,7 +31,7 @@ class LivePosition:
         return (self.entry_price - self.current_price) * self.quantity
 
 
-@dataclass
+@dataclass(slots=True)
 class AccountState:
     initial_capital: float
     currency: str = "USD"
@@ -53,12 +53,14 @@ class AccountState:
             self.peak_equity = self.initial_capital
 
     def update_equity(self, prices: Optional[Dict[str, float]] = None):
-        if prices:
-            for symbol, pos in self.positions.items():
-                if symbol in prices:
-                    pos.current_price = prices[symbol]
-
-        position_value = sum(pos.market_value for pos in self.positions.values())
+        # 가격 반영과 평가액 합산을 한 번의 순회로 처리 (market_value 프로퍼티 호출 생략)
+        prices = prices or {}
+        position_value = 0.0
+        for symbol, pos in self.positions.items():
+            price = prices.get(symbol)
+            if price is not None:
+                pos.current_price = price
+            position_value += pos.quantity * pos.current_price
         self.current_equity = self.cash + position_value
 
         if self.current_equity > self.peak_equity:
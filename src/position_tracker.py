@@ -7,11 +7,12 @@
 """
 
 import logging
-from dataclasses import asdict, dataclass
+from collections import defaultdict
+from dataclasses import dataclass, replace
 from datetime import datetime
 from enum import Enum
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 from .types import Direction
 from .utils import atomic_write_json, backup_file, safe_load_json, validate_position_schema
@@ -25,7 +26,7 @@ class PositionStatus(Enum):
     PARTIAL = "partial"  # 부분 청산
 
 
-@dataclass
+@dataclass(slots=True)
 class Position:
     """포지션 데이터 클래스"""
 
@@ -71,17 +72,19 @@ class Position:
     pnl_pct: Optional[float] = None
     r_multiple: Optional[float] = None  # N의 배수로 수익 표현
 
+    # 마지막 진입 (피라미딩 판단용, 구버전 데이터는 None)
+    last_entry_price: Optional[float] = None
+    last_entry_n: Optional[float] = None
+
     def to_dict(self) -> Dict[str, Any]:
-        d = asdict(self)
+        # 모든 필드가 원시 타입이므로 asdict()의 재귀 deepcopy 대신 슬롯을 직접 읽음
+        d = {name: getattr(self, name) for name in self.__slots__}
         d["direction"] = self.direction.value
         return d
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "Position":
-        from dataclasses import fields
-
-        known_keys = {f.name for f in fields(cls)}
-        filtered = {k: v for k, v in data.items() if k in known_keys}
+        filtered = {k: v for k, v in data.items() if k in _POSITION_FIELDS}
         return cls(**filtered)
 
     def calculate_pnl(self, exit_price: float) -> float:
@@ -101,7 +104,10 @@ class Position:
         return pnl_per_share / risk_per_share if risk_per_share > 0 else 0
 
 
-@dataclass
+_POSITION_FIELDS = frozenset(Position.__slots__)
+
+
+@dataclass(slots=True)
 class PositionEntry:
     """개별 진입 기록 (피라미딩 추적용)"""
 
@@ -128,8 +134,25 @@ class PositionTracker:
         self.positions_file = self.positions_dir / "positions.json"
         self.entries_file = self.entries_dir / "entries.json"
 
+        # 파싱 결과 캐시: 파일 stat 시그니처가 같으면 JSON 재파싱 생략
+        self._positions_cache: List[Position] = []
+        self._positions_sig: Optional[Tuple[int, int, int]] = None
+        self._by_id: Dict[str, int] = {}  # position_id -> 캐시 리스트 인덱스
+        self._entries_cache: List[PositionEntry] = []
+        self._entries_sig: Optional[Tuple[int, int, int]] = None
+        self._entries_by_pos: Dict[str, List[PositionEntry]] = {}
+
         self._init_files()
 
+    @staticmethod
+    def _file_sig(path: Path) -> Optional[Tuple[int, int, int]]:
+        """(inode, mtime_ns, size) — atomic write(rename) 또는 외부 수정 시 변경됨"""
+        try:
+            st = path.stat()
+        except OSError:
+            return None
+        return (st.st_ino, st.st_mtime_ns, st.st_size)
+
     def _init_files(self):
         """파일 초기화"""
         if not self.positions_file.exists():
@@ -137,33 +160,71 @@ class PositionTracker:
         if not self.entries_file.exists():
             self._save_entries([])
 
+    def _set_positions_cache(self, positions: List[Position], sig: Optional[Tuple[int, int, int]]):
+        """포지션 캐시와 id 인덱스 갱신 (중복 id는 첫 항목 기준)"""
+        self._positions_cache = positions
+        self._positions_sig = sig
+        by_id: Dict[str, int] = {}
+        for i, p in enumerate(positions):
+            by_id.setdefault(p.position_id, i)
+        self._by_id = by_id
+
+    def _refresh_positions(self) -> List[Position]:
+        """파일이 마지막 로드/저장 이후 바뀌었으면 다시 파싱 (스키마 검증 포함)
+
+        positions.json은 다른 프로세스·스크립트도 읽고 쓰므로 매 호출마다 stat으로 확인.
+        반환값은 캐시 자체이므로 호출자는 수정하지 말 것.
+        """
+        sig = self._file_sig(self.positions_file)
+        if sig is None or sig != self._positions_sig:
+            data = safe_load_json(self.positions_file, default=[])
+            valid_positions = []
+            for p in data:
+                if validate_position_schema(p):
+                    valid_positions.append(Position.from_dict(p))
+                else:
+                    logger.warning(f"잘못된 포지션 데이터 스킵: {p.get('position_id', 'unknown')}")
+            self._set_positions_cache(valid_positions, sig)
+        return self._positions_cache
+
     def _load_positions(self) -> List[Position]:
-        """모든 포지션 로드 (스키마 검증 포함)"""
-        data = safe_load_json(self.positions_file, default=[])
-        valid_positions = []
-        for p in data:
-            if validate_position_schema(p):
-                valid_positions.append(Position.from_dict(p))
-            else:
-                logger.warning(f"잘못된 포지션 데이터 스킵: {p.get('position_id', 'unknown')}")
-        return valid_positions
+        """모든 포지션 로드 (캐시 사본)"""
+        return [replace(p) for p in self._refresh_positions()]
 
     def _save_positions(self, positions: List[Position]):
         """포지션 저장 (atomic write + 백업)"""
         backup_file(self.positions_file)
         data = [p.to_dict() for p in positions]
         atomic_write_json(self.positions_file, data)
+        self._set_positions_cache([replace(p) for p in positions], self._file_sig(self.positions_file))
+
+    def _set_entries_cache(self, entries: List[PositionEntry], sig: Optional[Tuple[int, int, int]]):
+        """진입 기록 캐시와 position_id별 인덱스 갱신"""
+        self._entries_cache = entries
+        self._entries_sig = sig
+        by_pos: Dict[str, List[PositionEntry]] = defaultdict(list)
+        for e in entries:
+            by_pos[e.position_id].append(e)
+        self._entries_by_pos = dict(by_pos)
+
+    def _refresh_entries(self) -> List[PositionEntry]:
+        """파일이 바뀌었으면 진입 기록 재파싱 (반환값은 캐시 자체)"""
+        sig = self._file_sig(self.entries_file)
+        if sig is None or sig != self._entries_sig:
+            data = safe_load_json(self.entries_file, default=[])
+            self._set_entries_cache([PositionEntry(**e) for e in data], sig)
+        return self._entries_cache
 
     def _load_entries(self) -> List[PositionEntry]:
-        """모든 진입 기록 로드"""
-        data = safe_load_json(self.entries_file, default=[])
-        return [PositionEntry(**e) for e in data]
+        """모든 진입 기록 로드 (캐시 사본)"""
+        return [replace(e) for e in self._refresh_entries()]
 
     def _save_entries(self, entries: List[PositionEntry]):
         """진입 기록 저장 (atomic write + 백업)"""
         backup_file(self.entries_file)
-        data = [asdict(e) for e in entries]
+        data = [{name: getattr(e, name) for name in PositionEntry.__slots__} for e in entries]
         atomic_write_json(self.entries_file, data)
+        self._set_entries_cache([replace(e) for e in entries], self._file_sig(self.entries_file))
 
     def open_position(
         self,
@@ -180,7 +241,8 @@ class PositionTracker:
         """새 포지션 생성"""
         if isinstance(direction, str):
             direction = Direction(direction)
-        position_id = f"{symbol}_{system}_{direction.value}_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+        now = datetime.now()  # 한 번만 캡처해 id/날짜/갱신시각에 공통 사용
+        position_id = f"{symbol}_{system}_{direction.value}_{now.strftime('%Y%m%d_%H%M%S')}"
 
         # 청산 기간 설정
         exit_period = 10 if system == 1 else 20
@@ -196,7 +258,7 @@ class PositionTracker:
             symbol=symbol,
             system=system,
             direction=direction,
-            entry_date=datetime.now().strftime("%Y-%m-%d"),
+            entry_date=now.strftime("%Y-%m-%d"),
             entry_price=entry_price,
             entry_n=n_value,
             units=1,
@@ -207,9 +269,11 @@ class PositionTracker:
             pyramid_level=0,
             exit_period=exit_period,
             status=PositionStatus.OPEN.value,
-            last_update=datetime.now().isoformat(),
+            last_update=now.isoformat(),
             entry_reason=entry_reason,
             er_at_entry=er_at_entry,
+            last_entry_price=entry_price,
+            last_entry_n=n_value,
         )
 
         # 포지션 저장
@@ -237,75 +301,79 @@ class PositionTracker:
     def add_pyramid(self, position_id: str, entry_price: float, n_value: float, shares: int) -> Optional[Position]:
         """피라미딩 추가"""
         positions = self._load_positions()
+        i = self._by_id.get(position_id)
+        if i is None or positions[i].status != PositionStatus.OPEN.value:
+            return None
+
+        pos = positions[i]
+        if pos.units >= pos.max_units:
+            logger.warning(f"최대 유닛 도달: {position_id}")
+            return None
+
+        now = datetime.now()
+
+        # 유닛 추가
+        pos.units += 1
+        pos.total_shares += shares
+        pos.pyramid_level += 1
+        pos.last_entry_price = entry_price
+        pos.last_entry_n = n_value
+        pos.last_update = now.isoformat()
+
+        # 진입 기록 추가
+        entry = PositionEntry(
+            entry_id=f"{position_id}_{pos.pyramid_level}",
+            position_id=position_id,
+            entry_date=now.strftime("%Y-%m-%d"),
+            entry_price=entry_price,
+            shares=shares,
+            pyramid_level=pos.pyramid_level,
+            n_value=n_value,
+        )
+        entries = self._load_entries()
+        entries.append(entry)
+        self._save_entries(entries)
 
-        for i, pos in enumerate(positions):
-            if pos.position_id == position_id and pos.status == PositionStatus.OPEN.value:
-                if pos.units >= pos.max_units:
-                    logger.warning(f"최대 유닛 도달: {position_id}")
-                    return None
-
-                # 유닛 추가
-                pos.units += 1
-                pos.total_shares += shares
-                pos.pyramid_level += 1
-                pos.last_update = datetime.now().isoformat()
-
-                # 진입 기록 추가
-                entry = PositionEntry(
-                    entry_id=f"{position_id}_{pos.pyramid_level}",
-                    position_id=position_id,
-                    entry_date=datetime.now().strftime("%Y-%m-%d"),
-                    entry_price=entry_price,
-                    shares=shares,
-                    pyramid_level=pos.pyramid_level,
-                    n_value=n_value,
-                )
-                entries = self._load_entries()
-                entries.append(entry)
-                self._save_entries(entries)
-
-                positions[i] = pos
-                self._save_positions(positions)
-
-                logger.info(f"피라미딩 추가: {position_id} Level {pos.pyramid_level}")
-                return pos
-
-        return None
+        self._save_positions(positions)
+
+        logger.info(f"피라미딩 추가: {position_id} Level {pos.pyramid_level}")
+        return pos
 
     def close_position(
         self, position_id: str, exit_price: float, exit_reason: str = "Exit Signal"
     ) -> Optional[Position]:
         """포지션 청산"""
         positions = self._load_positions()
+        i = self._by_id.get(position_id)
+        if i is None or positions[i].status != PositionStatus.OPEN.value:
+            return None
+
+        pos = positions[i]
+        now = datetime.now()
+        pos.exit_date = now.strftime("%Y-%m-%d")
+        pos.exit_price = exit_price
+        pos.exit_reason = exit_reason
+        # 가중평균 단가 기반 P&L 계산 (피라미딩 시 정확)
+        self._refresh_entries()
+        entries = self._entries_by_pos.get(position_id)
+        if entries:
+            avg_cost = sum(e.entry_price * e.shares for e in entries) / pos.total_shares
+            if pos.direction == Direction.LONG:
+                pos.pnl = (exit_price - avg_cost) * pos.total_shares
+            else:
+                pos.pnl = (avg_cost - exit_price) * pos.total_shares
+        else:
+            avg_cost = pos.entry_price
+            pos.pnl = pos.calculate_pnl(exit_price)
+        pos.pnl_pct = (pos.pnl / (avg_cost * pos.total_shares)) * 100
+        pos.r_multiple = pos.calculate_r_multiple(exit_price)
+        pos.status = PositionStatus.CLOSED.value
+        pos.last_update = now.isoformat()
 
-        for i, pos in enumerate(positions):
-            if pos.position_id == position_id and pos.status == PositionStatus.OPEN.value:
-                pos.exit_date = datetime.now().strftime("%Y-%m-%d")
-                pos.exit_price = exit_price
-                pos.exit_reason = exit_reason
-                # 가중평균 단가 기반 P&L 계산 (피라미딩 시 정확)
-                entries = self.get_entries(pos.position_id)
-                if entries:
-                    avg_cost = sum(e.entry_price * e.shares for e in entries) / pos.total_shares
-                    if pos.direction == Direction.LONG:
-                        pos.pnl = (exit_price - avg_cost) * pos.total_shares
-                    else:
-                        pos.pnl = (avg_cost - exit_price) * pos.total_shares
-                else:
-                    avg_cost = pos.entry_price
-                    pos.pnl = pos.calculate_pnl(exit_price)
-                pos.pnl_pct = (pos.pnl / (avg_cost * pos.total_shares)) * 100
-                pos.r_multiple = pos.calculate_r_multiple(exit_price)
-                pos.status = PositionStatus.CLOSED.value
-                pos.last_update = datetime.now().isoformat()
-
-                positions[i] = pos
-                self._save_positions(positions)
-
-                logger.info(f"포지션 청산: {position_id} PnL: {pos.pnl:,.0f} ({pos.r_multiple:.2f}R)")
-                return pos
+        self._save_positions(positions)
 
-        return None
+        logger.info(f"포지션 청산: {position_id} PnL: {pos.pnl:,.0f} ({pos.r_multiple:.2f}R)")
+        return pos
 
     def get_all_positions(self) -> List[Position]:
         """모든 포지션 반환 (오픈 + 청산)"""
@@ -323,11 +391,9 @@ class PositionTracker:
 
     def get_position(self, position_id: str) -> Optional[Position]:
         """특정 포지션 조회"""
-        positions = self._load_positions()
-        for pos in positions:
-            if pos.position_id == position_id:
-                return pos
-        return None
+        positions = self._refresh_positions()
+        i = self._by_id.get(position_id)
+        return replace(positions[i]) if i is not None else None
 
     def get_position_history(self, symbol: str) -> List[Position]:
         """종목별 포지션 이력"""
@@ -336,8 +402,8 @@ class PositionTracker:
 
     def get_entries(self, position_id: str) -> List[PositionEntry]:
         """포지션의 모든 진입 기록"""
-        entries = self._load_entries()
-        return [e for e in entries if e.position_id == position_id]
+        self._refresh_entries()
+        return [replace(e) for e in self._entries_by_pos.get(position_id, ())]
 
     def check_stop_loss(self, prices: Dict[str, float]) -> List[Position]:
         """심볼별 현재가로 스톱로스 발동된 포지션 반환.
@@ -350,19 +416,23 @@ class PositionTracker:
             LONG: prices[symbol] <= stop_loss
             SHORT: prices[symbol] >= stop_loss
         """
-        positions = self.get_open_positions()
-        to_close = []
+        open_pos = [p for p in self._refresh_positions() if p.status == PositionStatus.OPEN.value]
+        if not open_pos:
+            return []
 
-        for pos in positions:
-            price = prices.get(pos.symbol)
-            if price is None:
-                continue
-            if pos.direction == Direction.LONG and price <= pos.stop_loss:
-                to_close.append(pos)
-            elif pos.direction == Direction.SHORT and price >= pos.stop_loss:
-                to_close.append(pos)
+        # 지연 import: 조회·기록만 하는 CLI(list_positions 등)의 모듈 로드 비용 절감
+        import numpy as np
+
+        # 가격 없는 심볼은 NaN → 두 비교 모두 False로 자연히 스킵
+        n = len(open_pos)
+        price_arr = np.fromiter(
+            (np.nan if (px := prices.get(p.symbol)) is None else px for p in open_pos), dtype=np.float64, count=n
+        )
+        stops = np.fromiter((p.stop_loss for p in open_pos), dtype=np.float64, count=n)
+        is_long = np.fromiter((p.direction == Direction.LONG for p in open_pos), dtype=bool, count=n)
 
-        return to_close
+        hit = np.where(is_long, price_arr <= stops, price_arr >= stops)
+        return [replace(open_pos[i]) for i in np.flatnonzero(hit)]
 
     def should_pyramid(self, position: Position, current_price: float) -> bool:
         """피라미딩 기회 확인"""
@@ -370,35 +440,48 @@ class PositionTracker:
             return False
 
         # 마지막 진입가 대비 0.5N 상승 확인
-        entries = self.get_entries(position.position_id)
-        if not entries:
-            return False
+        last_price = position.last_entry_price
+        if last_price is None:
+            # 구버전 데이터: 진입 기록에서 마지막 레벨 탐색
+            entries = self.get_entries(position.position_id)
+            if not entries:
+                return False
+            last_price = max(entries, key=lambda e: e.pyramid_level).entry_price
 
-        last_entry = max(entries, key=lambda e: e.pyramid_level)
         threshold = 0.5 * position.entry_n
 
         if position.direction == Direction.LONG:
-            return current_price >= last_entry.entry_price + threshold
+            return current_price >= last_price + threshold
         else:  # SHORT
-            return current_price <= last_entry.entry_price - threshold
+            return current_price <= last_price - threshold
 
     def get_summary(self) -> Dict[str, Any]:
-        """포지션 요약"""
-        positions = self._load_positions()
-        open_pos = [p for p in positions if p.status == PositionStatus.OPEN.value]
-        closed_pos = [p for p in positions if p.status == PositionStatus.CLOSED.value]
-
-        total_pnl = sum(p.pnl for p in closed_pos if p.pnl is not None)
-        winning_trades = [p for p in closed_pos if p.pnl and p.pnl > 0]
+        """포지션 요약 (캐시를 읽기 전용으로 한 번만 순회)"""
+        positions = self._refresh_positions()
+        open_status = PositionStatus.OPEN.value
+        closed_status = PositionStatus.CLOSED.value
+
+        n_open = n_closed = n_wins = n_r = 0
+        total_pnl = total_r = 0.0
+        for p in positions:
+            if p.status == open_status:
+                n_open += 1
+            elif p.status == closed_status:
+                n_closed += 1
+                if p.pnl is not None:
+                    total_pnl += p.pnl
+                    if p.pnl > 0:
+                        n_wins += 1
+                if p.r_multiple is not None:
+                    total_r += p.r_multiple
+                    n_r += 1
 
         return {
             "total_positions": len(positions),
-            "open_positions": len(open_pos),
-            "closed_positions": len(closed_pos),
+            "open_positions": n_open,
+            "closed_positions": n_closed,
             "total_pnl": total_pnl,
-            "winning_trades": len(winning_trades),
-            "win_rate": len(winning_trades) / len(closed_pos) if closed_pos else 0,
-            "avg_r_multiple": (lambda rs: sum(rs) / len(rs) if rs else 0)(
-                [p.r_multiple for p in closed_pos if p.r_multiple is not None]
-            ),
+            "winning_trades": n_wins,
+            "win_rate": n_wins / n_closed if n_closed else 0,
+            "avg_r_multiple": total_r / n_r if n_r else 0,
         }
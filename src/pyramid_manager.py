@@ -7,12 +7,12 @@
 
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Dict, List, Optional, Tuple
+from typing import Callable, Dict, List, Optional, Tuple
 
 from src.types import Direction
 
 
-@dataclass
+@dataclass(slots=True)
 class PyramidEntry:
     entry_number: int
     entry_date: datetime
@@ -22,7 +22,7 @@ class PyramidEntry:
     stop_price: float
 
 
-@dataclass
+@dataclass(slots=True)
 class PyramidPosition:
     symbol: str
     direction: Direction
@@ -31,9 +31,24 @@ class PyramidPosition:
     pyramid_interval_n: float = 0.5
     stop_distance_n: float = 2.0
 
+    # 집계 캐시 (entries는 add_entry로만 추가한다는 전제하에 증분 갱신)
+    _total_units: int = field(default=0, init=False, repr=False, compare=False)
+    _cost_basis: float = field(default=0.0, init=False, repr=False, compare=False)
+    # 방향별 분기 제거용: 스톱 부호(LONG +1, SHORT -1)와 트레일링 비교 함수
+    _dir_sign: int = field(default=1, init=False, repr=False, compare=False)
+    _stop_op: Callable[[float, float], float] = field(default=max, init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        if self.direction != Direction.LONG:
+            self._dir_sign = -1
+            self._stop_op = min
+        for e in self.entries:
+            self._total_units += e.units
+            self._cost_basis += e.entry_price * e.units
+
     @property
     def total_units(self) -> int:
-        return sum(e.units for e in self.entries)
+        return self._total_units
 
     @property
     def entry_count(self) -> int:
@@ -48,14 +63,14 @@ class PyramidPosition:
     def average_entry_price(self) -> float:
         if not self.entries:
             return 0.0
-        total = sum(e.entry_price * e.units for e in self.entries)
-        return total / self.total_units
+        return self._cost_basis / self._total_units
 
     @property
     def current_stop(self) -> float:
         return self.entries[-1].stop_price if self.entries else 0.0
 
     def get_next_pyramid_price(self, current_n: float) -> float:
+        # entries는 add_entry로만 시간순 추가되므로 entries[-1]이 마지막 진입 (O(1))
         if not self.entries:
             return 0.0
         interval = current_n * self.pyramid_interval_n
@@ -63,6 +78,15 @@ class PyramidPosition:
             return self.entries[-1].entry_price + interval
         return self.entries[-1].entry_price - interval
 
+    def pyramid_ready(self, current_price: float, current_n: float) -> bool:
+        """can_pyramid의 판정만 반환 (사유 문자열 생성 없음 — 백테스트 바별 호출용)"""
+        if self.is_full:
+            return False
+        if not self.entries:
+            return True
+        # LONG: price >= last + k·N, SHORT: price <= last - k·N → 부호로 통일
+        return self._dir_sign * (current_price - self.get_next_pyramid_price(current_n)) >= 0
+
     def can_pyramid(self, current_price: float, current_n: float) -> Tuple[bool, str]:
         if self.is_full:
             return False, f"최대 Unit 도달: {self.entry_count}/{self.max_units}"
@@ -80,11 +104,7 @@ class PyramidPosition:
         return False, "피라미딩 대기 중"
 
     def add_entry(self, date: datetime, price: float, units: int, n_value: float):
-        stop_distance = n_value * self.stop_distance_n
-        if self.direction == Direction.LONG:
-            stop_price = price - stop_distance
-        else:
-            stop_price = price + stop_distance
+        stop_price = price - self._dir_sign * (n_value * self.stop_distance_n)
 
         entry = PyramidEntry(
             entry_number=len(self.entries) + 1,
@@ -95,6 +115,8 @@ class PyramidPosition:
             stop_price=stop_price,
         )
         self.entries.append(entry)
+        self._total_units += units
+        self._cost_basis += price * units
         self._update_trailing_stops()
         return entry
 
@@ -102,11 +124,9 @@ class PyramidPosition:
         if len(self.entries) <= 1:
             return
         latest_stop = self.entries[-1].stop_price
+        stop_op = self._stop_op
         for entry in self.entries[:-1]:
-            if self.direction == Direction.LONG:
-                entry.stop_price = max(entry.stop_price, latest_stop)
-            else:
-                entry.stop_price = min(entry.stop_price, latest_stop)
+            entry.stop_price = stop_op(entry.stop_price, latest_stop)
 
     def check_stop_hit(self, current_price: float) -> bool:
         if not self.entries:
@@ -6,13 +6,17 @@
 - 전체 N 노출: ≤ 10
 """
 
+from collections import defaultdict
 from dataclasses import dataclass, field
-from typing import Dict, Optional, Tuple
+from typing import DefaultDict, Dict, Optional, Tuple
 
 from src.types import AssetGroup, Direction
 
+# 그룹 미지정 심볼의 기본 그룹
+_DEFAULT_GROUP = AssetGroup.US_EQUITY
 
-@dataclass
+
+@dataclass(slots=True)
 class RiskLimits:
     max_units_per_market: int = 4
     max_units_correlated: int = 6
@@ -20,10 +24,11 @@ class RiskLimits:
     max_total_n_exposure: float = 10.0
 
 
-@dataclass
+@dataclass(slots=True)
 class PortfolioRiskState:
-    units_by_symbol: Dict[str, int] = field(default_factory=dict)
-    units_by_group: Dict[AssetGroup, int] = field(default_factory=dict)
+    # defaultdict: add 시 get+setitem 대신 단일 += (조회 경로는 키 생성을 피하려 .get 사용)
+    units_by_symbol: DefaultDict[str, int] = field(default_factory=lambda: defaultdict(int))
+    units_by_group: DefaultDict[AssetGroup, int] = field(default_factory=lambda: defaultdict(int))
     long_units: int = 0
     short_units: int = 0
     total_n_exposure: float = 0.0
@@ -36,7 +41,7 @@ class PortfolioRiskManager:
         self.state = PortfolioRiskState()
 
     def get_group(self, symbol: str) -> AssetGroup:
-        return self.symbol_groups.get(symbol, AssetGroup.US_EQUITY)
+        return self.symbol_groups.get(symbol, _DEFAULT_GROUP)
 
     def can_add_position(self, symbol: str, units: int, n_value: float, direction: Direction) -> Tuple[bool, str]:
         if n_value < 0:
@@ -44,29 +49,32 @@ class PortfolioRiskManager:
         if units <= 0:
             return False, f"유닛 수가 0 이하입니다: {units}"
 
-        group = self.get_group(symbol)
+        # 시그널마다 호출되는 경로: get_group 메서드 호출 없이 직접 조회
+        group = self.symbol_groups.get(symbol, _DEFAULT_GROUP)
+        state = self.state
+        limits = self.limits
 
         # 단일 종목 한도
-        current = self.state.units_by_symbol.get(symbol, 0)
-        if current + units > self.limits.max_units_per_market:
+        current = state.units_by_symbol.get(symbol, 0)
+        if current + units > limits.max_units_per_market:
             return False, f"단일종목 한도 초과: {symbol}"
 
         # 그룹 한도
-        group_units = self.state.units_by_group.get(group, 0)
-        if group_units + units > self.limits.max_units_correlated:
+        group_units = state.units_by_group.get(group, 0)
+        if group_units + units > limits.max_units_correlated:
             return False, f"그룹 한도 초과: {group.value}"
 
         # 방향 한도
         if direction == Direction.LONG:
-            if self.state.long_units + units > self.limits.max_units_direction:
+            if state.long_units + units > limits.max_units_direction:
                 return False, "롱 방향 한도 초과"
         else:
-            if self.state.short_units + units > self.limits.max_units_direction:
+            if state.short_units + units > limits.max_units_direction:
                 return False, "숏 방향 한도 초과"
 
         # N 노출 한도
         new_n_exposure = n_value * units
-        if self.state.total_n_exposure + new_n_exposure > self.limits.max_total_n_exposure:
+        if state.total_n_exposure + new_n_exposure > limits.max_total_n_exposure:
             return False, "전체 N 노출 한도 초과"
 
         return True, "OK"
@@ -77,17 +85,18 @@ class PortfolioRiskManager:
         if units <= 0:
             raise ValueError(f"units must be positive, got {units}")
 
-        group = self.get_group(symbol)
+        group = self.symbol_groups.get(symbol, _DEFAULT_GROUP)
+        state = self.state
 
-        self.state.units_by_symbol[symbol] = self.state.units_by_symbol.get(symbol, 0) + units
-        self.state.units_by_group[group] = self.state.units_by_group.get(group, 0) + units
+        state.units_by_symbol[symbol] += units
+        state.units_by_group[group] += units
 
         if direction == Direction.LONG:
-            self.state.long_units += units
+            state.long_units += units
         else:
-            self.state.short_units += units
+            state.short_units += units
 
-        self.state.total_n_exposure += n_value * units
+        state.total_n_exposure += n_value * units
 
     def remove_position(self, symbol: str, units: int, direction: Direction, n_value: float):
         """포지션 제거 시 리스크 상태 갱신.
@@ -100,21 +109,22 @@ class PortfolioRiskManager:
         if units <= 0:
             raise ValueError(f"units must be positive, got {units}")
 
-        group = self.get_group(symbol)
+        group = self.symbol_groups.get(symbol, _DEFAULT_GROUP)
+        state = self.state
 
         # 실제 보유 수량으로 제거량 클램핑 (공유 필드 과다 차감 방지)
-        current_units = self.state.units_by_symbol.get(symbol, 0)
+        current_units = state.units_by_symbol.get(symbol, 0)
         actual_units = min(units, current_units)
 
-        self.state.units_by_symbol[symbol] = current_units - actual_units
-        self.state.units_by_group[group] = max(0, self.state.units_by_group.get(group, 0) - actual_units)
+        state.units_by_symbol[symbol] = current_units - actual_units
+        state.units_by_group[group] = max(0, state.units_by_group.get(group, 0) - actual_units)
 
         if direction == Direction.LONG:
-            self.state.long_units = max(0, self.state.long_units - actual_units)
+            state.long_units = max(0, state.long_units - actual_units)
         else:
-            self.state.short_units = max(0, self.state.short_units - actual_units)
+            state.short_units = max(0, state.short_units - actual_units)
 
-        self.state.total_n_exposure = max(0.0, self.state.total_n_exposure - n_value * actual_units)
+        state.total_n_exposure = max(0.0, state.total_n_exposure - n_value * actual_units)
 
     def get_risk_summary(self) -> Dict:
         return {
@@ -8,12 +8,12 @@
 import logging
 import os
 from pathlib import Path
-from typing import Any, Dict, List, Tuple
+from typing import Any, Dict, List, Mapping, Optional, Tuple
 
 logger = logging.getLogger(__name__)
 
 
-def enforce_dry_run(is_live: bool, env_var: str = "TURTLE_ALLOW_LIVE") -> bool:
+def enforce_dry_run(is_live: bool, env_var: str = "TURTLE_ALLOW_LIVE", env: Optional[Mapping[str, str]] = None) -> bool:
     """
     실거래 여부를 강제 검증
 
@@ -23,6 +23,7 @@ def enforce_dry_run(is_live: bool, env_var: str = "TURTLE_ALLOW_LIVE") -> bool:
     Args:
         is_live: 실거래 여부
         env_var: 확인할 환경변수명 (기본값: "TURTLE_ALLOW_LIVE")
+        env: 환경변수 매핑 (기본값: os.environ)
 
     Returns:
         True if live trading is allowed, False if forced to dry-run
@@ -30,12 +31,13 @@ def enforce_dry_run(is_live: bool, env_var: str = "TURTLE_ALLOW_LIVE") -> bool:
     if not is_live:
         return False
 
-    env_value = os.environ.get(env_var, "").lower()
+    if env is None:
+        env = os.environ
+    raw_value = env.get(env_var)
+    env_value = (raw_value or "").lower()
 
     if env_value != "true":
-        logger.warning(
-            f"실거래 시도가 차단됨. 환경변수 {env_var}=true를 설정하세요. (현재값: {repr(os.environ.get(env_var))})"
-        )
+        logger.warning(f"실거래 시도가 차단됨. 환경변수 {env_var}=true를 설정하세요. (현재값: {repr(raw_value)})")
         return False
 
     logger.info(f"실거래 모드 활성화. {env_var}={env_value}")
@@ -80,7 +82,7 @@ def check_env_file_permissions(env_path: str = ".env") -> Tuple[bool, str]:
         return False, f".env 권한 검사 실패: {e}"
 
 
-def validate_credentials(required_vars: List[str]) -> Tuple[bool, List[str]]:
+def validate_credentials(required_vars: List[str], env: Optional[Mapping[str, str]] = None) -> Tuple[bool, List[str]]:
     """
     필수 환경변수 검증
 
@@ -90,16 +92,19 @@ def validate_credentials(required_vars: List[str]) -> Tuple[bool, List[str]]:
         required_vars: 필수 환경변수명 목록
         예: ["KIS_APP_KEY", "KIS_APP_SECRET", "KIS_ACCOUNT_NO",
              "TELEGRAM_BOT_TOKEN", "TELEGRAM_CHAT_ID"]
+        env: 환경변수 매핑 (기본값: os.environ)
 
     Returns:
         (all_valid: bool, missing_vars: list[str])
         - all_valid: 모든 필수 변수가 설정되었는지 여부
         - missing_vars: 설정되지 않은 변수 목록
     """
+    if env is None:
+        env = os.environ
     missing_vars = []
 
     for var_name in required_vars:
-        value = os.environ.get(var_name, "").strip()
+        value = env.get(var_name, "").strip()
         if not value:
             missing_vars.append(var_name)
 
@@ -131,10 +136,8 @@ def mask_credential(value: str, visible_chars: int = 4) -> str:
     if len(value) <= visible_chars:
         return "*" * len(value)
 
-    visible_part = value[:visible_chars]
-    masked_part = "*" * (len(value) - visible_chars)
-
-    return visible_part + masked_part
+    # 마스킹 부분 문자열을 따로 만들어 이어붙이지 않고 결과를 한 번에 생성
+    return value[:visible_chars].ljust(len(value), "*")
 
 
 def run_security_check() -> Dict[str, Any]:
@@ -168,14 +171,17 @@ def run_security_check() -> Dict[str, Any]:
         "TELEGRAM_CHAT_ID",
     ]
 
+    # 모든 검사가 같은 시점의 환경변수를 보도록 한 번만 스냅샷
+    env = dict(os.environ)
+
     # 환경 파일 권한 검사
     is_safe, perm_message = check_env_file_permissions()
 
     # 필수 자격증명 검사
-    creds_valid, missing_vars = validate_credentials(required_credentials)
+    creds_valid, missing_vars = validate_credentials(required_credentials, env)
 
-    # 실거래 허용 여부 (환경변수에서 직접 읽기)
-    env_value = os.environ.get("TURTLE_ALLOW_LIVE", "").lower()
+    # 실거래 허용 여부
+    env_value = env.get("TURTLE_ALLOW_LIVE", "").lower()
     is_live_allowed = env_value == "true"
 
     return {
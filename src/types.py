@@ -16,6 +16,7 @@ class SerializableEnum(str, Enum):
     - json.dumps / dataclasses.asdict 시 문자열로 직렬화
     - == "LONG" 등 문자열 직접 비교 가능
     - .value 접근도 여전히 동작 (하위 호환)
+    - ==/hash가 str의 C 구현을 그대로 사용 (dict 키·방향 비교 시 Enum 오버헤드 없음)
     """
 
     pass
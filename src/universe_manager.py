@@ -2,17 +2,29 @@
 거래 유니버스 관리 모듈
 """
 
+import csv
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
-import pandas as pd
 import yaml
 
 from src.types import AssetGroup
 
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # libyaml 미설치 환경
+    from yaml import SafeLoader as _YamlLoader  # type: ignore[assignment]
 
-@dataclass
+# 파싱된 유니버스 YAML 캐시: 경로 → ((inode, mtime_ns, size), config)
+# 한 프로세스에서 UniverseManager를 여러 번 생성해도 파일이 그대로면 재파싱하지 않음
+_yaml_cache: Dict[str, Tuple[Tuple[int, int, int], Any]] = {}
+
+# 한국 거래소 심볼 접미사 (str.endswith 튜플 인자로 한 번에 검사)
+_KR_SUFFIXES = (".KS", ".KQ")
+
+
+@dataclass(slots=True)
 class Asset:
     symbol: str
     name: str
@@ -30,11 +42,38 @@ class Asset:
         return self.leverage < 0
 
 
+def _read_yaml(path: Path) -> Any:
+    """YAML 로드 (libyaml 로더 + 파일 시그니처 기반 프로세스 내 캐시)"""
+    st = path.stat()
+    sig = (st.st_ino, st.st_mtime_ns, st.st_size)
+    key = str(path.resolve())
+    cached = _yaml_cache.get(key)
+    if cached is not None and cached[0] == sig:
+        return cached[1]
+    with open(path, "r") as f:
+        config = yaml.load(f, Loader=_YamlLoader)
+    _yaml_cache[key] = (sig, config)
+    return config
+
+
+def _csv_field(row: Dict[str, Optional[str]], key: str, alt_key: str, default: str = "") -> str:
+    """CSV 행에서 key → alt_key 순으로 값 조회 (컬럼이 없으면 default)"""
+    value = row.get(key)
+    if value is None:
+        value = row.get(alt_key)
+    return (default if value is None else value).strip()
+
+
 class UniverseManager:
     def __init__(self, yaml_path: Optional[str] = None, csv_path: Optional[str] = None):
         self.yaml_path = Path(yaml_path) if yaml_path else None
         self.csv_path = Path(csv_path) if csv_path else None
         self.assets: Dict[str, Asset] = {}
+        # 조회용 인덱스 (assets는 로드 후 사실상 불변 — 변경 시 _invalidate_cache 호출)
+        self._enabled_symbols: List[str] = []
+        self._group_index: Dict[AssetGroup, List[str]] = {}
+        self._inverse_etfs: List[str] = []
+        self._group_mapping: Dict[str, AssetGroup] = {}
         self._load()
 
     def _load(self):
@@ -44,11 +83,29 @@ class UniverseManager:
             self._load_from_csv()
         else:
             self._load_defaults()
+        self._invalidate_cache()
+
+    def _invalidate_cache(self) -> None:
+        """assets 기준으로 조회 인덱스 재구성 (한 번의 순회)"""
+        enabled: List[str] = []
+        group_index: Dict[AssetGroup, List[str]] = {}
+        inverse: List[str] = []
+        for s, a in self.assets.items():
+            if not a.enabled:
+                continue
+            enabled.append(s)
+            group_index.setdefault(a.group, []).append(s)
+            if a.is_inverse:
+                inverse.append(s)
+        self._enabled_symbols = enabled
+        self._group_index = group_index
+        self._inverse_etfs = inverse
+        self._group_mapping = {s: a.group for s, a in self.assets.items()}
 
     def _load_from_yaml(self):
         """YAML 파일에서 유니버스 로드"""
-        with open(self.yaml_path, "r") as f:
-            config = yaml.safe_load(f)
+        # config는 캐시와 공유되므로 읽기 전용으로만 사용
+        config = _read_yaml(self.yaml_path)
 
         if not config or "symbols" not in config:
             self._load_defaults()
@@ -89,7 +146,7 @@ class UniverseManager:
                 asset_group = group_mapping.get(group_str, AssetGroup.US_EQUITY)
 
                 # Determine country and currency from symbol
-                if symbol.endswith(".KS") or symbol.endswith(".KQ"):
+                if symbol.endswith(_KR_SUFFIXES):
                     country = "KR"
                     currency = "KRW"
                 else:
@@ -119,23 +176,24 @@ class UniverseManager:
                 self.assets[symbol] = asset
 
     def _load_from_csv(self):
-        df = pd.read_csv(self.csv_path)
-        for _, row in df.iterrows():
-            symbol = str(row.get("Ticker", row.get("symbol", ""))).strip()
-            currency = "KRW" if (symbol.endswith(".KS") or symbol.endswith(".KQ")) else "USD"
-            asset = Asset(
-                symbol=symbol,
-                name=str(row.get("Name", row.get("name", ""))).strip(),
-                country=str(row.get("Country", row.get("country", "US"))).strip(),
-                asset_type=str(row.get("Type", row.get("type", ""))).strip(),
-                group=AssetGroup.US_EQUITY,
-                currency=currency,
-                enabled=True,
-            )
-            self.assets[symbol] = asset
+        # 단순 행 순회이므로 pandas 없이 stdlib csv 사용 (BOM 허용)
+        with open(self.csv_path, newline="", encoding="utf-8-sig") as f:
+            for row in csv.DictReader(f):
+                symbol = _csv_field(row, "Ticker", "symbol")
+                currency = "KRW" if symbol.endswith(_KR_SUFFIXES) else "USD"
+                asset = Asset(
+                    symbol=symbol,
+                    name=_csv_field(row, "Name", "name"),
+                    country=_csv_field(row, "Country", "country", "US"),
+                    asset_type=_csv_field(row, "Type", "type"),
+                    group=AssetGroup.US_EQUITY,
+                    currency=currency,
+                    enabled=True,
+                )
+                self.assets[symbol] = asset
 
     def _load_defaults(self):
-        defaults = [
+        defaults = (
             Asset("SPY", "S&P 500 ETF", "US", "Index ETF", AssetGroup.US_EQUITY, short_restricted=False),
             Asset("QQQ", "Nasdaq 100 ETF", "US", "Index ETF", AssetGroup.US_EQUITY, short_restricted=False),
             Asset("DIA", "Dow Jones ETF", "US", "Index ETF", AssetGroup.US_EQUITY, short_restricted=False),
@@ -162,18 +220,18 @@ class UniverseManager:
                 underlying="QQQ",
                 short_restricted=False,
             ),
-        ]
-        for asset in defaults:
-            self.assets[asset.symbol] = asset
+        )
+        self.assets.update({asset.symbol: asset for asset in defaults})
 
+    # 조회 결과는 호출자가 수정해도 캐시가 오염되지 않도록 사본 반환
     def get_enabled_symbols(self) -> List[str]:
-        return [s for s, a in self.assets.items() if a.enabled]
+        return list(self._enabled_symbols)
 
     def get_symbols_by_group(self, group: AssetGroup) -> List[str]:
-        return [s for s, a in self.assets.items() if a.group == group and a.enabled]
+        return list(self._group_index.get(group, ()))
 
     def get_inverse_etfs(self) -> List[str]:
-        return [s for s, a in self.assets.items() if a.is_inverse and a.enabled]
+        return list(self._inverse_etfs)
 
     def get_all_symbols(self) -> List[str]:
         """활성화된 전체 심볼 리스트 (이름 포함 튜플이 아닌 순수 심볼)"""
@@ -188,12 +246,12 @@ class UniverseManager:
         asset = self.assets.get(symbol)
         if not asset or asset.name == symbol:
             return symbol
-        if symbol.endswith(".KS") or symbol.endswith(".KQ"):
+        if symbol.endswith(_KR_SUFFIXES):
             return f"{asset.name} {symbol}"
         return asset.name
 
     def get_group_mapping(self) -> Dict[str, AssetGroup]:
-        return {s: a.group for s, a in self.assets.items()}
+        return dict(self._group_mapping)
 
     def get_symbols_by_currency(self, currency: str) -> List[str]:
         return [s for s, a in self.assets.items() if a.currency == currency and a.enabled]
@@ -4,22 +4,34 @@
 - 스키마 검증
 - 백업 관리
 - 재시도 데코레이터
+- 비동기 토큰 버킷 레이트 리미터
+- 서킷 브레이커
 - 구조화된 로깅
 - 심볼 입력 검증
+- JSON 인코딩/디코딩 (orjson 선택 사용)
 """
 
 import asyncio
+import fnmatch
 import functools
 import json
 import logging
+import logging.handlers
 import os
+import random
 import re
 import shutil
 import tempfile
 import time
-from datetime import datetime
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
 from pathlib import Path
-from typing import Any, Awaitable, Callable, List, Optional, ParamSpec, TypeVar
+from typing import Any, Awaitable, Callable, List, Optional, ParamSpec, Tuple, TypeVar
+
+try:
+    import orjson
+except ImportError:  # 선택 의존성 — 미설치 시 표준 json 사용
+    orjson = None  # type: ignore[assignment]
 
 P = ParamSpec("P")
 T = TypeVar("T")
@@ -27,13 +39,33 @@ T = TypeVar("T")
 logger = logging.getLogger(__name__)
 
 
+# ---------------------------------------------------------------------------
+# JSON 인코딩/디코딩 (orjson 설치 시 우선 사용)
+# ---------------------------------------------------------------------------
+
+
+def json_loads(data: str | bytes) -> Any:
+    """JSON 디코드 — orjson이 있으면 사용 (2~5배 빠름), 없으면 표준 json"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def json_dumps(obj: Any) -> str:
+    """JSON 인코드 (compact, 비ASCII 그대로) — orjson이 있으면 사용"""
+    if orjson is not None:
+        return str(orjson.dumps(obj), "utf-8")
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":"))
+
+
 # ---------------------------------------------------------------------------
 # 심볼 입력 검증
 # ---------------------------------------------------------------------------
 
 # 허용 패턴: 영문 대소문자, 숫자, 마침표(.), 슬래시(/), 하이픈(-), 밑줄(_)
-# 길이: 1~20자
-_SYMBOL_PATTERN = re.compile(r"^[A-Za-z0-9._/\-]{1,20}$")
+# 길이: 1~20자, 경로 순회 패턴 '..' 불가 (전방 탐색으로 한 번의 매칭에 포함)
+_SYMBOL_PATTERN = re.compile(r"(?!.*\.\.)[A-Za-z0-9._/\-]{1,20}\Z")
+_SYMBOL_MATCH = _SYMBOL_PATTERN.match
 
 
 def validate_symbol(symbol: str) -> str:
@@ -41,7 +73,7 @@ def validate_symbol(symbol: str) -> str:
 
     허용 규칙:
         - 타입: str (None, 빈 문자열 불가)
-        - 정규식: ^[A-Za-z0-9._/-]{1,20}$
+        - 정규식: ^[A-Za-z0-9._/-]{1,20}$ ('..' 포함 불가)
         - 앞뒤 공백은 자동 제거(strip) 후 검증
 
     Args:
@@ -58,6 +90,10 @@ def validate_symbol(symbol: str) -> str:
 
     symbol = symbol.strip()
 
+    # 정상 경로는 정규식 매칭 한 번으로 끝내고, 실패 시에만 원인별 메시지 구분
+    if _SYMBOL_MATCH(symbol) is not None:
+        return symbol
+
     if not symbol:
         raise ValueError("심볼은 빈 문자열일 수 없습니다")
 
@@ -66,25 +102,42 @@ def validate_symbol(symbol: str) -> str:
             f"유효하지 않은 심볼 형식입니다: {repr(symbol[:30])} (경로 순회 패턴 '..'은 허용되지 않습니다)"
         )
 
-    if not _SYMBOL_PATTERN.match(symbol):
-        raise ValueError(
-            f"유효하지 않은 심볼 형식입니다: {repr(symbol[:30])} (허용: 영문, 숫자, '.', '/', '-', '_' / 최대 20자)"
-        )
+    raise ValueError(
+        f"유효하지 않은 심볼 형식입니다: {repr(symbol[:30])} (허용: 영문, 숫자, '.', '/', '-', '_' / 최대 20자)"
+    )
+
 
-    return symbol
+def _as_path(filepath: str | Path) -> Path:
+    """이미 Path면 그대로 사용 (Path 재생성/경로 재파싱 생략)"""
+    return filepath if isinstance(filepath, Path) else Path(filepath)
 
 
-def atomic_write_json(filepath: Path, data: Any):
-    """Atomic JSON write: temp file → rename (POSIX atomic)"""
-    filepath = Path(filepath)
+def atomic_write_json(filepath: str | Path, data: Any):
+    """Atomic JSON write: temp file → fsync → replace
+
+    직렬화를 먼저 끝낸 뒤 한 번에 기록하고, fsync 후 교체하여
+    크래시 시에도 이전 파일 또는 완전한 새 파일만 남도록 한다.
+    """
+    filepath = _as_path(filepath)
     dir_path = filepath.parent
     dir_path.mkdir(parents=True, exist_ok=True)
 
+    # 직렬화 실패 시 임시 파일을 만들지 않도록 먼저 인코딩
+    # 쓰기는 항상 표준 json: orjson은 NaN/Inf를 null로 바꾸고 datetime도 직렬화하므로
+    # 선택 의존성 설치 여부에 따라 저장 내용이 달라지지 않도록 한다 (읽기만 orjson 우선)
+    payload = json.dumps(data, ensure_ascii=False, indent=2).encode("utf-8")
+
     fd, tmp_path = tempfile.mkstemp(dir=str(dir_path), suffix=".tmp")
     try:
-        with os.fdopen(fd, "w", encoding="utf-8") as f:
-            json.dump(data, f, ensure_ascii=False, indent=2)
-        os.rename(tmp_path, str(filepath))
+        try:
+            # 완성된 bytes를 raw fd에 직접 기록 (파일 객체/버퍼 계층 생략)
+            view = memoryview(payload)
+            while view:
+                view = view[os.write(fd, view) :]
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+        os.replace(tmp_path, filepath)
     except Exception:
         try:
             os.unlink(tmp_path)
@@ -93,74 +146,106 @@ def atomic_write_json(filepath: Path, data: Any):
         raise
 
 
-def backup_file(filepath: Path, max_backups: int = 7):
+def backup_file(filepath: str | Path, max_backups: int = 7):
     """일별 백업 생성 (최대 max_backups개 유지)"""
-    filepath = Path(filepath)
+    filepath = _as_path(filepath)
     if not filepath.exists():
         return
 
     backup_dir = filepath.parent / "backups"
     backup_dir.mkdir(parents=True, exist_ok=True)
 
-    date_str = datetime.now().strftime("%Y%m%d")
+    date_str = time.strftime("%Y%m%d")
     backup_path = backup_dir / f"{filepath.stem}_{date_str}{filepath.suffix}"
 
     if not backup_path.exists():
         shutil.copy2(filepath, backup_path)
         logger.info(f"백업 생성: {backup_path}")
 
-    # 오래된 백업 정리
-    backups = sorted(backup_dir.glob(f"{filepath.stem}_*{filepath.suffix}"))
-    while len(backups) > max_backups:
-        oldest = backups.pop(0)
+    # 오래된 백업 정리 (max_backups가 줄어든 경우도 반영되도록 매번 수행)
+    prune_backups(backup_dir, filepath.stem, filepath.suffix, max_backups)
+
+
+def _list_backups(backup_dir: Path, stem: str, suffix: str) -> List[str]:
+    """{stem}_*{suffix} 백업 파일명 목록 (이름=날짜순 오름차순, 디렉터리 없으면 빈 목록)"""
+    pattern = f"{stem}_*{suffix}"
+    try:
+        with os.scandir(backup_dir) as it:
+            return sorted(e.name for e in it if fnmatch.fnmatchcase(e.name, pattern))
+    except FileNotFoundError:
+        return []
+
+
+def prune_backups(backup_dir: str | Path, stem: str, suffix: str, max_backups: int) -> None:
+    """{stem}_*{suffix} 백업 중 오래된 것부터 삭제하여 max_backups개 유지"""
+    backup_dir = _as_path(backup_dir)
+    names = _list_backups(backup_dir, stem, suffix)
+    for name in names[: max(0, len(names) - max_backups)]:
+        oldest = backup_dir / name
         oldest.unlink()
         logger.info(f"오래된 백업 삭제: {oldest}")
 
 
+_POSITION_REQUIRED_FIELDS = frozenset(
+    [
+        "position_id",
+        "symbol",
+        "entry_price",
+        "status",
+        "direction",
+        "system",
+        "entry_date",
+        "entry_n",
+        "units",
+        "total_shares",
+        "stop_loss",
+    ]
+)
+
+
 def validate_position_schema(data: dict, required_fields: Optional[List[str]] = None) -> bool:
     """포지션 데이터 스키마 검증"""
-    if required_fields is None:
-        required_fields = [
-            "position_id",
-            "symbol",
-            "entry_price",
-            "status",
-            "direction",
-            "system",
-            "entry_date",
-            "entry_n",
-            "units",
-            "total_shares",
-            "stop_loss",
-        ]
-    return all(f in data for f in required_fields)
-
-
-def safe_load_json(filepath: Path, default: Any = None) -> Any:
-    """안전한 JSON 로드 (corrupt 파일 대응)"""
-    filepath = Path(filepath)
-    if not filepath.exists():
-        return default if default is not None else []
+    # dict_keys >= set: 필드별 제너레이터 순회 없이 C 레벨 부분집합 검사
+    required = _POSITION_REQUIRED_FIELDS if required_fields is None else frozenset(required_fields)
+    return data.keys() >= required
+
+
+def _read_json_file(filepath: Path) -> Any:
+    """JSON 파일 읽기 — orjson 우선, 실패 시 표준 json으로 재시도
+
+    표준 json이 쓴 NaN/Infinity는 orjson이 거부하므로 손상으로 오판하지 않도록 재시도한다.
+    """
+    raw = filepath.read_bytes()
+    if orjson is not None:
+        try:
+            return orjson.loads(raw)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(raw)
 
+
+def safe_load_json(filepath: str | Path, default: Any = None) -> Any:
+    """안전한 JSON 로드 (corrupt 파일 대응)"""
+    filepath = _as_path(filepath)
     try:
-        with open(filepath, "r", encoding="utf-8") as f:
-            return json.load(f)
+        # exists() 선확인 없이 바로 읽기 (정상 경로의 stat 1회 절약)
+        return _read_json_file(filepath)
+    except FileNotFoundError:
+        return default if default is not None else []
     except json.JSONDecodeError as e:
         logger.critical(f"JSON 파일 손상: {filepath} - {e}")
-        # 백업에서 복원 시도
+        # 백업에서 복원 시도 (최신 날짜부터, 첫 성공에서 중단)
         backup_dir = filepath.parent / "backups"
-        if backup_dir.exists():
-            backups = sorted(backup_dir.glob(f"{filepath.stem}_*{filepath.suffix}"), reverse=True)
-            for backup in backups:
-                try:
-                    with open(backup, "r", encoding="utf-8") as f:
-                        data = json.load(f)
-                    logger.info(f"백업에서 복원: {backup}")
-                    # 복원된 데이터로 원본 덮어쓰기
-                    atomic_write_json(filepath, data)
-                    return data
-                except (json.JSONDecodeError, Exception):
-                    continue
+        for name in reversed(_list_backups(backup_dir, filepath.stem, filepath.suffix)):
+            backup = backup_dir / name
+            try:
+                data = _read_json_file(backup)
+                logger.info(f"백업에서 복원: {backup}")
+                # 복원된 데이터로 원본 덮어쓰기
+                atomic_write_json(filepath, data)
+                return data
+            except (json.JSONDecodeError, Exception):
+                continue
         logger.error(f"복원 실패, 기본값 반환: {filepath}")
         return default if default is not None else []
     except Exception as e:
@@ -173,13 +258,50 @@ def safe_load_json(filepath: Path, default: Any = None) -> Any:
 # ---------------------------------------------------------------------------
 
 
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Retry-After 헤더 파싱 (초 단위 정수 또는 HTTP-date), 해석 불가 시 None"""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+
+def backoff_schedule(max_retries: int, base_delay: float, max_delay: float) -> Tuple[float, ...]:
+    """재시도 회차별 지수 백오프 지연 (min(max_delay, base_delay * 2^attempt))"""
+    return tuple(min(base_delay * (1 << attempt), max_delay) for attempt in range(max_retries))
+
+
 def retry_async(
     max_retries: int = 3,
     base_delay: float = 1.0,
     max_delay: float = 30.0,
     exceptions: tuple = (Exception,),
+    jitter: float = 0.0,
+    full_jitter: bool = False,
+    on_retry: Optional[Callable[[tuple, Exception], None]] = None,
 ) -> Callable[[Callable[P, Awaitable[T]]], Callable[P, Awaitable[T]]]:
-    """비동기 함수용 지수 백오프 재시도 데코레이터"""
+    """비동기 함수용 지수 백오프 재시도 데코레이터
+
+    jitter > 0이면 백오프 지연에 ±jitter 비율의 무작위 편차를 적용해
+    동시 실패한 태스크들이 같은 시각에 재시도하지 않도록 분산한다.
+    full_jitter=True면 0 ~ min(max_delay, base_delay * 2^attempt) 구간에서 균등 추출한다
+    (여러 채널이 동시에 실패해도 재시도 시각이 겹치지 않음; jitter보다 우선).
+    예외에 retry_after 속성(서버 지정 대기 초, 예: HTTP 429 Retry-After)이 있으면
+    계산된 백오프 대신 그 값을 사용한다 (max_delay 상한 적용).
+    on_retry(args, exc)는 재시도 직전마다 호출된다 (최종 실패와 구분한 재시도 집계용).
+    """
+
+    # 지연 테이블은 데코레이터 생성 시 한 번만 계산
+    delays = backoff_schedule(max_retries, base_delay, max_delay)
 
     def decorator(func: Callable[P, Awaitable[T]]) -> Callable[P, Awaitable[T]]:
         @functools.wraps(func)
@@ -191,8 +313,18 @@ def retry_async(
                 except exceptions as e:
                     last_exception = e
                     if attempt < max_retries:
-                        delay = min(base_delay * (2**attempt), max_delay)
+                        retry_after = getattr(e, "retry_after", None)
+                        if retry_after is not None:
+                            delay = min(retry_after, max_delay)
+                        else:
+                            delay = delays[attempt]
+                            if full_jitter:
+                                delay = random.uniform(0, delay)
+                            elif jitter:
+                                delay *= 1 + random.uniform(-jitter, jitter)
                         logger.warning(f"Retry {attempt + 1}/{max_retries}: {func.__name__} - {e}")
+                        if on_retry is not None:
+                            on_retry(args, e)
                         await asyncio.sleep(delay)
             assert last_exception is not None  # loop always runs at least once
             raise last_exception
@@ -209,6 +341,7 @@ def retry_sync(
     exceptions: tuple = (Exception,),
 ):
     """동기 함수용 지수 백오프 재시도 데코레이터"""
+    delays = backoff_schedule(max_retries, base_delay, max_delay)
 
     def decorator(func):
         @functools.wraps(func)
@@ -220,7 +353,7 @@ def retry_sync(
                 except exceptions as e:
                     last_exception = e
                     if attempt < max_retries:
-                        delay = min(base_delay * (2**attempt), max_delay)
+                        delay = delays[attempt]
                         logger.warning(f"Retry {attempt + 1}/{max_retries}: {func.__name__} - {e}")
                         time.sleep(delay)
             raise last_exception
@@ -230,6 +363,102 @@ def retry_sync(
     return decorator
 
 
+# ---------------------------------------------------------------------------
+# 레이트 리미터
+# ---------------------------------------------------------------------------
+
+
+class AsyncTokenBucket:
+    """비동기 토큰 버킷 레이트 리미터
+
+    초당 rate개씩 토큰을 보충하고 최대 capacity개까지 버스트를 허용한다.
+    acquire()는 토큰이 없으면 다음 토큰이 보충될 때까지 대기한다 (동시 개수가 아닌 *속도* 제한).
+    """
+
+    def __init__(self, rate: float, capacity: Optional[float] = None):
+        if rate <= 0:
+            raise ValueError(f"rate는 양수여야 합니다: {rate}")
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else rate
+        self._tokens = self.capacity
+        self._last = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._last) * self.rate)
+                self._last = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+
+
+class CircuitBreaker:
+    """연속 실패 기반 3상태 서킷 브레이커 (closed → open → half_open)
+
+    failure_threshold회 연속 실패하면 open이 되어 open_duration초 동안 호출을 즉시 거부한다.
+    이후 half_open에서 half_open_probes개의 시험 호출만 허용하고, 성공하면 closed, 실패하면 다시 open.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(
+        self, name: str = "", failure_threshold: int = 5, open_duration: float = 60.0, half_open_probes: int = 1
+    ):
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.open_duration = open_duration
+        self.half_open_probes = half_open_probes
+        self._state = self.CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._probes = 0
+
+    @property
+    def state(self) -> str:
+        if self._state == self.OPEN and time.monotonic() - self._opened_at >= self.open_duration:
+            self._state = self.HALF_OPEN
+            self._probes = 0
+            logger.info(f"서킷 HALF_OPEN: {self.name}")
+        return self._state
+
+    def allow(self) -> bool:
+        """호출 허용 여부 (half_open이면 시험 호출 슬롯을 1개 소비)"""
+        state = self.state
+        if state == self.CLOSED:
+            return True
+        if state == self.HALF_OPEN and self._probes < self.half_open_probes:
+            self._probes += 1
+            return True
+        return False
+
+    def release_probe(self) -> None:
+        """결과 없이 끝난(취소된) 시험 호출 슬롯 반환 — 미반환 시 HALF_OPEN에 영구 고착"""
+        if self._state == self.HALF_OPEN and self._probes > 0:
+            self._probes -= 1
+
+    def record_success(self) -> None:
+        if self._state != self.CLOSED:
+            logger.info(f"서킷 CLOSED: {self.name}")
+        self._state = self.CLOSED
+        self._failures = 0
+
+    def record_failure(self) -> None:
+        self._failures += 1
+        if self._state == self.HALF_OPEN or self._failures >= self.failure_threshold:
+            if self._state != self.OPEN:
+                logger.warning(
+                    f"서킷 OPEN: {self.name} (연속 실패 {self._failures}회, {self.open_duration:.0f}초 차단)"
+                )
+            self._state = self.OPEN
+            self._opened_at = time.monotonic()
+
+
 # ---------------------------------------------------------------------------
 # 구조화된 로깅 설정
 # ---------------------------------------------------------------------------
@@ -241,12 +470,16 @@ def setup_structured_logging(
     level: int = logging.INFO,
 ) -> logging.Logger:
     """구조화된 로깅 설정 (파일 + 콘솔)"""
-    log_path = Path(log_dir)
-    log_path.mkdir(parents=True, exist_ok=True)
-
     structured_logger = logging.getLogger(name)
     structured_logger.setLevel(level)
 
+    # 이미 설정된 로거면 핸들러를 새로 만들지 않음 (로그 파일을 다시 열고 버리는 누수 방지)
+    if structured_logger.handlers:
+        return structured_logger
+
+    log_path = Path(log_dir)
+    log_path.mkdir(parents=True, exist_ok=True)
+
     # 콘솔 핸들러
     console = logging.StreamHandler()
     console.setFormatter(
@@ -254,15 +487,14 @@ def setup_structured_logging(
     )
 
     # 파일 핸들러 (일별 로테이션)
-    from logging.handlers import TimedRotatingFileHandler
-
-    file_handler = TimedRotatingFileHandler(log_path / f"{name}.log", when="midnight", backupCount=30, encoding="utf-8")
+    file_handler = logging.handlers.TimedRotatingFileHandler(
+        log_path / f"{name}.log", when="midnight", backupCount=30, encoding="utf-8"
+    )
     file_handler.setFormatter(
         logging.Formatter("%(asctime)s [%(levelname)s] %(name)s:%(funcName)s:%(lineno)d - %(message)s")
     )
 
-    if not structured_logger.handlers:
-        structured_logger.addHandler(console)
-        structured_logger.addHandler(file_handler)
+    structured_logger.addHandler(console)
+    structured_logger.addHandler(file_handler)
 
     return structured_logger
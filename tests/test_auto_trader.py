@@ -20,7 +20,7 @@ import pytest
 from src.auto_trader import AutoTrader, OrderRecord
 from src.kill_switch import KillSwitch
 from src.kis_api import KISAPIClient, KISConfig, OrderSide, OrderType
-from src.notifier import NotificationManager
+from src.notifier import NotificationLevel, NotificationManager
 from src.types import OrderStatus
 
 # ---------------------------------------------------------------------------
@@ -482,7 +482,7 @@ class TestOrderReconfirmation:
             mock_notifier.send_all.assert_called_once()
             # 알림 메시지의 level이 ERROR인지 확인
             sent_message = mock_notifier.send_all.call_args[0][0]
-            assert sent_message.level.value == "error"
+            assert sent_message.level is NotificationLevel.ERROR
             assert "005930" in sent_message.title
             assert "수동 점검" in sent_message.title
         finally:
@@ -1303,6 +1303,7 @@ class TestRunChecks:
         # setup_notifier
         mock_notifier = MagicMock()
         mock_notifier.send_signal = AsyncMock()
+        mock_notifier.close = AsyncMock()
         patches["setup_notifier"] = patch(
             "scripts.check_positions.setup_notifier",
             return_value=mock_notifier,
@@ -1736,6 +1737,7 @@ class TestRunChecksInverseETF:
 
         mock_notifier = MagicMock()
         mock_notifier.send_signal = AsyncMock()
+        mock_notifier.close = AsyncMock()
 
         mock_fetcher = MagicMock()
         mock_fetcher.fetch.return_value = self._make_mock_df(high=100, low=99, close=100)
@@ -1809,6 +1811,7 @@ class TestRunChecksInverseETF:
 
         mock_notifier = MagicMock()
         mock_notifier.send_signal = AsyncMock()
+        mock_notifier.close = AsyncMock()
 
         mock_fetcher = MagicMock()
         mock_fetcher.fetch.return_value = self._make_mock_df(high=100, low=99, close=100)
@@ -1879,6 +1882,7 @@ class TestRunChecksInverseETF:
 
         mock_notifier = MagicMock()
         mock_notifier.send_signal = AsyncMock()
+        mock_notifier.close = AsyncMock()
 
         main_df = self._make_mock_df(high=100, low=99, close=100)
         mock_fetcher = MagicMock()
@@ -2138,6 +2142,7 @@ class TestSaveTradeIntegration:
 
         mock_notifier = MagicMock()
         mock_notifier.send_signal = AsyncMock()
+        mock_notifier.close = AsyncMock()
         patches["setup_notifier"] = patch(
             "scripts.check_positions.setup_notifier",
             return_value=mock_notifier,
@@ -2307,6 +2312,7 @@ class TestSaveTradeIntegration:
 
         mock_notifier = MagicMock()
         mock_notifier.send_signal = AsyncMock()
+        mock_notifier.close = AsyncMock()
 
         mock_fetcher = MagicMock()
         mock_fetcher.fetch.return_value = self._make_mock_df(high=100, low=99, close=100)
@@ -211,11 +211,29 @@ class TestShouldForceExit:
         # Create large decay by having actual diverge from theoretical
         # underlying up 10%: 500 -> 550, theoretical = -10%, actual = -3%
         # decay = (-0.03 - (-0.10)) * 100 = 7% (exceeds 5% threshold)
-        should_exit, reason, msg = f.should_force_exit("SH", 97.0, 550.0)
+        should_exit, reason, msg = f.should_force_exit("SH", 97.0, 550.0, recompute=True)
         assert should_exit
         assert reason == ExitReason.DECAY_THRESHOLD
         assert "괴리율" in msg
 
+    def test_decay_reuses_daily_update_value(self):
+        """기본 경로는 on_daily_update가 저장한 괴리율을 재사용"""
+        f = InverseETFFilter()
+        f.on_entry("SH", datetime.now(), 100.0, 500.0)
+        f.on_daily_update("SH", 97.0, 550.0)  # decay = 7%
+
+        should_exit, reason, _ = f.should_force_exit("SH", 97.0, 550.0)
+        assert should_exit
+        assert reason == ExitReason.DECAY_THRESHOLD
+
+    def test_stale_prices_ignored_without_recompute(self):
+        f = InverseETFFilter()
+        f.on_entry("SH", datetime.now(), 100.0, 500.0)
+        f.on_daily_update("SH", 90.0, 550.0)  # decay = 0%
+
+        should_exit, _, _ = f.should_force_exit("SH", 97.0, 550.0)
+        assert not should_exit
+
     def test_unknown_symbol(self):
         f = InverseETFFilter()
         should_exit, reason, msg = f.should_force_exit("SPY", 500.0, 500.0)
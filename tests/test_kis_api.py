@@ -2,13 +2,30 @@
 KIS API 예외 메시지 보안 테스트
 - _classify_response()가 전체 data dict를 예외 메시지에 포함하지 않는지 검증
 - _sanitize_error()가 rt_cd, msg1만 추출하는지 검증
+- 가격 일괄 조회 (get_korea_prices / get_overseas_prices)
+- 현재가 TTL 캐시, 토큰 만료 판정, 토큰 디스크 캐시
 """
 
+import asyncio
+import time
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import aiohttp
+import numpy as np
 import pytest
 
 from src.kis_api import (
     FatalError,
+    KISAPIClient,
     KISAPIError,
+    KISConfig,
+    KISMarket,
+    KISResponseError,
+    KISToken,
+    OrderSide,
+    OrderSubmissionUnknownError,
     RateLimitError,
     RetryableError,
     TokenExpiredError,
@@ -133,3 +150,612 @@ class TestSanitizeResponseForLog:
 
     def test_empty_dict_returns_empty(self):
         assert _sanitize_response_for_log({}) == {}
+
+
+def _make_client() -> KISAPIClient:
+    return KISAPIClient(KISConfig(app_key="TEST", app_secret="TEST", account_no="12345678"), token_cache_dir=None)
+
+
+class TestBatchPrices:
+    async def test_korea_prices_maps_symbol_to_result(self):
+        client = _make_client()
+
+        async def fake_price(symbol):
+            return {"symbol": symbol, "price": 100.0}
+
+        with patch.object(client, "get_korea_price", side_effect=fake_price):
+            result = await client.get_korea_prices(["005930", "000660"])
+
+        assert result == {
+            "005930": {"symbol": "005930", "price": 100.0},
+            "000660": {"symbol": "000660", "price": 100.0},
+        }
+
+    async def test_failed_symbol_returns_empty_dict(self):
+        client = _make_client()
+
+        async def fake_price(symbol):
+            if symbol == "BAD":
+                raise RetryableError("boom")
+            return {"symbol": symbol, "price": 1.0}
+
+        with patch.object(client, "get_korea_price", side_effect=fake_price):
+            result = await client.get_korea_prices(["005930", "BAD"])
+
+        assert result["BAD"] == {}
+        assert result["005930"]["price"] == 1.0
+
+    async def test_overseas_prices_passes_market(self):
+        client = _make_client()
+        mock = AsyncMock(return_value={"price": 5.0})
+
+        with patch.object(client, "get_overseas_price", mock):
+            result = await client.get_overseas_prices(["7203"], KISMarket.JAPAN)
+
+        mock.assert_awaited_once_with("7203", KISMarket.JAPAN)
+        assert result == {"7203": {"price": 5.0}}
+
+
+class TestKISConfigTables:
+    def test_virtual_endpoints_and_tr_ids(self):
+        config = KISConfig(app_key="k", app_secret="s", account_no="1")
+        assert config.base_url == "https://openapivts.koreainvestment.com:29443"
+        assert config.endpoints["token"] == config.base_url + "/oauth2/tokenP"
+        assert config.tr_ids["balance"] == "VTTC8434R"
+        assert config.tr_ids["order_buy"] == "VTTC0802U"
+
+    def test_real_endpoints_and_tr_ids(self):
+        config = KISConfig(app_key="k", app_secret="s", account_no="1", is_real=True)
+        assert config.base_url == "https://openapi.koreainvestment.com:9443"
+        assert config.endpoints["balance"].startswith(config.base_url)
+        assert config.tr_ids["balance"] == "TTTC8434R"
+        assert config.tr_ids["overseas_order_sell"] == "JTTT1006U"
+
+    def test_config_is_immutable(self):
+        config = KISConfig(app_key="k", app_secret="s", account_no="1")
+        with pytest.raises(AttributeError):
+            config.is_real = True  # type: ignore[misc]
+
+
+class TestPriceCache:
+    async def test_repeated_call_within_ttl_uses_cache(self):
+        client = _make_client()
+        fetch = AsyncMock(return_value={"symbol": "005930", "price": 70000.0})
+
+        with patch.object(client, "_fetch_korea_price", fetch):
+            first = await client.get_korea_price("005930")
+            second = await client.get_korea_price("005930")
+
+        assert first == second
+        fetch.assert_awaited_once()
+
+    async def test_expired_entry_refetches(self):
+        client = _make_client()
+        fetch = AsyncMock(return_value={"price": 1.0})
+
+        with patch.object(client, "_fetch_korea_price", fetch), patch("src.kis_api.time.monotonic") as mono:
+            mono.return_value = 100.0
+            await client.get_korea_price("005930")
+            mono.return_value = 101.0
+            await client.get_korea_price("005930")
+
+        assert fetch.await_count == 2
+
+    async def test_failed_response_not_cached(self):
+        client = _make_client()
+        fetch = AsyncMock(side_effect=[{}, {"price": 2.0}])
+
+        with patch.object(client, "_fetch_overseas_price", fetch):
+            assert await client.get_overseas_price("AAPL") == {}
+            assert await client.get_overseas_price("AAPL") == {"price": 2.0}
+
+    async def test_market_is_part_of_cache_key(self):
+        client = _make_client()
+        fetch = AsyncMock(return_value={"price": 3.0})
+
+        with patch.object(client, "_fetch_overseas_price", fetch):
+            await client.get_overseas_price("ABC", KISMarket.USA)
+            await client.get_overseas_price("ABC", KISMarket.JAPAN)
+
+        assert fetch.await_count == 2
+
+    async def test_concurrent_callers_share_single_request(self):
+        client = _make_client()
+        calls = 0
+
+        async def slow_fetch(symbol):
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            return {"price": 4.0}
+
+        with patch.object(client, "_fetch_korea_price", side_effect=slow_fetch):
+            results = await asyncio.gather(*(client.get_korea_price("005930") for _ in range(5)))
+
+        assert calls == 1
+        assert all(r == {"price": 4.0} for r in results)
+
+    async def test_zero_ttl_bypasses_cache(self):
+        client = _make_client()
+        fetch = AsyncMock(return_value={"price": 5.0})
+
+        with patch.object(client, "_fetch_korea_price", fetch):
+            await client.get_korea_price("005930")
+            await client.get_korea_price("005930", ttl_seconds=0)
+
+        assert fetch.await_count == 2
+
+    async def test_cache_evicts_least_recently_used(self):
+        client = _make_client()
+        fetch = AsyncMock(return_value={"price": 6.0})
+
+        with patch("src.kis_api._PRICE_CACHE_MAX", 2), patch.object(client, "_fetch_korea_price", fetch):
+            await client.get_korea_price("000001")
+            await client.get_korea_price("000002")
+            await client.get_korea_price("000001")  # 000001 최근 사용으로 갱신
+            await client.get_korea_price("000003")  # 000002 축출
+
+        assert list(client._price_cache) == [("000001", KISMarket.KOREA), ("000003", KISMarket.KOREA)]
+
+
+class TestInflightCoalescing:
+    async def test_concurrent_balance_calls_share_one_request(self):
+        client = _make_client()
+        calls = 0
+
+        async def slow_balance():
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            return {"rt_cd": "0", "output1": [], "output2": [{"dnca_tot_amt": "1"}]}
+
+        with patch.object(client, "_fetch_balance", side_effect=slow_balance):
+            results = await asyncio.gather(*(client.get_balance() for _ in range(3)))
+
+        assert calls == 1
+        assert all(r["cash"] == 1.0 for r in results)
+        assert client._inflight == {}
+
+    async def test_error_propagates_to_all_waiters_and_clears_entry(self):
+        client = _make_client()
+
+        async def failing():
+            await asyncio.sleep(0.01)
+            raise KISResponseError("당일 체결 조회 실패", "1", "x")
+
+        with patch.object(client, "_fetch_daily_fills", side_effect=failing):
+            results = await asyncio.gather(*(client.get_daily_fills() for _ in range(2)), return_exceptions=True)
+
+        assert all(isinstance(r, KISResponseError) for r in results)
+        assert client._inflight == {}
+
+    async def test_cancelled_waiter_does_not_cancel_shared_request(self):
+        client = _make_client()
+
+        async def slow_balance():
+            await asyncio.sleep(0.02)
+            return {"rt_cd": "0", "output2": [{"dnca_tot_amt": "2"}]}
+
+        with patch.object(client, "_fetch_balance", side_effect=slow_balance):
+            leader = asyncio.create_task(client.get_balance())
+            await asyncio.sleep(0)
+            follower = asyncio.create_task(client.get_balance())
+            await asyncio.sleep(0)
+            follower.cancel()
+            assert (await leader)["cash"] == 2.0
+
+    async def test_cancelled_leader_does_not_cancel_waiters(self):
+        """선행 호출자가 취소되면 대기자들은 취소 대신 한 번 더 합쳐서 조회"""
+        client = _make_client()
+        calls = 0
+
+        async def slow_balance():
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.02)
+            return {"rt_cd": "0", "output2": [{"dnca_tot_amt": "3"}]}
+
+        with patch.object(client, "_fetch_balance", side_effect=slow_balance):
+            leader = asyncio.create_task(client.get_balance())
+            await asyncio.sleep(0)
+            followers = [asyncio.create_task(client.get_balance()) for _ in range(2)]
+            await asyncio.sleep(0)
+            leader.cancel()
+            results = await asyncio.gather(*followers)
+
+        assert leader.cancelled()
+        assert all(r["cash"] == 3.0 for r in results)
+        assert calls == 2  # 취소된 1건 + 대기자 재조회 1건
+        assert client._inflight == {}
+
+    async def test_cancelled_waiter_still_cancelled_when_leader_cancelled(self):
+        """대기자 자신이 취소되면 재조회 없이 CancelledError"""
+        client = _make_client()
+
+        async def slow_balance():
+            await asyncio.sleep(0.02)
+            return {"rt_cd": "0", "output2": [{"dnca_tot_amt": "3"}]}
+
+        with patch.object(client, "_fetch_balance", side_effect=slow_balance):
+            leader = asyncio.create_task(client.get_balance())
+            await asyncio.sleep(0)
+            follower = asyncio.create_task(client.get_balance())
+            await asyncio.sleep(0)
+            leader.cancel()
+            follower.cancel()
+            results = await asyncio.gather(leader, follower, return_exceptions=True)
+
+        assert all(isinstance(r, asyncio.CancelledError) for r in results)
+        assert client._inflight == {}
+
+
+class TestTokenExpiry:
+    async def test_uses_monotonic_clock_not_wall_clock(self):
+        """벽시계가 만료 시각을 지나도 monotonic 기준 유효하면 캐시된 토큰 사용"""
+        client = _make_client()
+        client.token = KISToken(
+            access_token="cached",
+            expires_at=datetime.now() - timedelta(days=1),
+            expires_at_monotonic=time.monotonic() + 3600,
+        )
+
+        with patch.object(client, "_new_session") as new_session:
+            assert await client._get_token() == "cached"
+
+        new_session.assert_not_called()
+
+    def test_issue_sets_monotonic_expiry(self):
+        token = KISToken.issue("tok", timedelta(hours=1))
+        assert 3590 < token.seconds_left() <= 3600
+        assert token.expires_at > datetime.now()
+
+    def test_seconds_left_ignores_wall_clock(self):
+        token = KISToken.issue("tok", timedelta(hours=1))
+        with patch("src.kis_api.datetime") as mock_dt:
+            mock_dt.now.return_value = datetime.now() + timedelta(days=2)
+            assert token.seconds_left() > 0
+
+    async def test_fresh_token_does_not_wait_for_lock(self):
+        """갱신 락이 잡혀 있어도 유효 토큰 조회는 대기 없이 반환 (락 밖 1차 확인)"""
+        client = _make_client()
+        client.token = KISToken.issue("fresh")
+
+        async with client._token_lock:
+            tokens = await asyncio.wait_for(asyncio.gather(*(client._get_token() for _ in range(5))), timeout=1)
+
+        assert tokens == ["fresh"] * 5
+
+    async def test_stale_token_returned_and_refreshed_in_background(self):
+        client = _make_client()
+        client.token = KISToken("old", datetime.now(), expires_at_monotonic=time.monotonic() + 60)
+
+        async def issue():
+            client.token = KISToken("new", datetime.now(), expires_at_monotonic=time.monotonic() + 3600)
+            return "new"
+
+        with patch.object(client, "_issue_token", side_effect=issue) as mock_issue:
+            assert await client._get_token() == "old"
+            assert client._refresh_task is not None
+            await client._refresh_task
+
+        mock_issue.assert_awaited_once()
+        assert await client._get_token() == "new"
+
+    async def test_expired_token_issued_synchronously_once(self):
+        client = _make_client()
+        client.token = KISToken("old", datetime.now(), expires_at_monotonic=time.monotonic() - 1)
+
+        async def issue():
+            await asyncio.sleep(0.01)
+            client.token = KISToken("new", datetime.now(), expires_at_monotonic=time.monotonic() + 3600)
+            return "new"
+
+        with patch.object(client, "_issue_token", side_effect=issue) as mock_issue:
+            tokens = await asyncio.gather(*(client._get_token() for _ in range(3)))
+
+        assert tokens == ["new", "new", "new"]
+        mock_issue.assert_awaited_once()
+
+    async def test_background_refresh_failure_keeps_old_token(self):
+        client = _make_client()
+        client.token = KISToken("old", datetime.now(), expires_at_monotonic=time.monotonic() + 60)
+
+        with patch.object(client, "_issue_token", AsyncMock(side_effect=RetryableError("down"))):
+            assert await client._get_token() == "old"
+            await client._refresh_task
+
+        assert client.token.access_token == "old"
+
+
+class TestHeaders:
+    def test_requests_compressed_responses(self):
+        headers = _make_client()._get_headers("tok", "VTTC8434R")
+        assert headers["Accept-Encoding"] == "gzip, deflate"
+        assert headers["tr_id"] == "VTTC8434R"
+        assert headers["authorization"] == "Bearer tok"
+
+    def test_base_headers_not_mutated_and_token_change_applied(self):
+        client = _make_client()
+        first = client._get_headers("tok1", "A")
+        first["tr_id"] = "mutated"
+        second = client._get_headers("tok2", "B")
+        assert second["authorization"] == "Bearer tok2"
+        assert second["tr_id"] == "B"
+        assert "tr_id" not in client._base_headers
+        assert second["appkey"] == client.config.app_key
+
+
+class TestKISResponseError:
+    def test_fields_and_lazy_message(self):
+        err = KISResponseError("토큰 발급 실패", "1", "인증 실패")
+        assert err.rt_cd == "1"
+        assert err.msg1 == "인증 실패"
+        assert str(err) == "토큰 발급 실패: rt_cd=1, msg=인증 실패"
+
+    def test_is_fatal_kis_error(self):
+        err = KISResponseError("ctx", "1", "")
+        assert isinstance(err, FatalError)
+        assert isinstance(err, KISAPIError)
+
+
+class TestSessionReuse:
+    async def test_session_created_once_and_reused(self):
+        client = _make_client()
+        first = await client._get_session()
+        second = await client._get_session()
+        assert first is second
+        await client.close()
+        assert first.closed
+        assert client._session is None
+
+    async def test_closed_session_is_recreated(self):
+        client = _make_client()
+        first = await client._get_session()
+        await first.close()
+        second = await client._get_session()
+        assert second is not first
+        await client.close()
+
+    async def test_context_manager_closes_session(self):
+        async with _make_client() as client:
+            session = client._session
+            assert session is not None and not session.closed
+        assert session.closed
+
+    async def test_connector_pool_matches_rate_budget(self):
+        client = _make_client()
+        session = await client._get_session()
+        assert session.connector.limit == 20
+        assert session.connector.limit_per_host == 20
+        await client.close()
+
+    async def test_connector_caches_dns(self):
+        with patch("src.kis_api.aiohttp.TCPConnector", wraps=aiohttp.TCPConnector) as connector_cls:
+            session = KISAPIClient._new_session()
+        await session.close()
+        assert connector_cls.call_args.kwargs["ttl_dns_cache"] == 300
+
+
+class TestRetryAfter:
+    def test_rate_limit_carries_retry_after_seconds(self):
+        with pytest.raises(RateLimitError) as exc_info:
+            _classify_response(429, {}, {"Retry-After": "3"})
+        assert exc_info.value.retry_after == 3.0
+
+    def test_rate_limit_parses_http_date(self):
+        retry_at = format_datetime(datetime.now(timezone.utc) + timedelta(seconds=30), usegmt=True)
+        with pytest.raises(RateLimitError) as exc_info:
+            _classify_response(429, {}, {"Retry-After": retry_at})
+        assert 0 < exc_info.value.retry_after <= 30
+
+    @pytest.mark.parametrize("headers", [None, {}, {"Retry-After": "garbage"}])
+    def test_missing_or_invalid_header_gives_none(self, headers):
+        with pytest.raises(RateLimitError) as exc_info:
+            _classify_response(429, {}, headers)
+        assert exc_info.value.retry_after is None
+
+
+class TestTokenDiskCache:
+    def _client(self, tmp_path, app_key="TEST"):
+        return KISAPIClient(KISConfig(app_key=app_key, app_secret="S", account_no="1"), token_cache_dir=tmp_path)
+
+    async def test_issued_token_reused_by_next_process(self, tmp_path):
+        first = self._client(tmp_path)
+        first._save_cached_token(KISToken.issue("persisted"))
+
+        second = self._client(tmp_path)
+        with patch.object(second, "_issue_token", AsyncMock()) as mock_issue:
+            assert await second._get_token() == "persisted"
+        mock_issue.assert_not_awaited()
+        assert second.token.seconds_left() > 3600
+
+    async def test_nearly_expired_cache_is_ignored(self, tmp_path):
+        self._client(tmp_path)._save_cached_token(KISToken.issue("old", timedelta(minutes=2)))
+
+        client = self._client(tmp_path)
+        with patch.object(client, "_issue_token", AsyncMock(return_value="new")) as mock_issue:
+            assert await client._get_token() == "new"
+        mock_issue.assert_awaited_once()
+
+    async def test_corrupt_cache_falls_back_to_issue(self, tmp_path):
+        client = self._client(tmp_path)
+        client._token_cache_path.write_text("{broken")
+        with patch.object(client, "_issue_token", AsyncMock(return_value="new")):
+            assert await client._get_token() == "new"
+
+    def test_cache_file_is_private_and_keyed_by_account(self, tmp_path):
+        client = self._client(tmp_path)
+        client._save_cached_token(KISToken.issue("tok"))
+
+        assert client._token_cache_path.stat().st_mode & 0o777 == 0o600
+        assert "TEST" not in client._token_cache_path.name
+        assert self._client(tmp_path, app_key="OTHER")._token_cache_path != client._token_cache_path
+
+    def test_disabled_cache_has_no_path(self):
+        assert _make_client()._token_cache_path is None
+
+
+class _FakeResponse:
+    def __init__(self, status=200, data=None, headers=None, json_error=None):
+        self.status = status
+        self.headers = headers or {}
+        self._data = data if data is not None else {}
+        self._json_error = json_error
+
+    async def json(self, **kwargs):
+        if self._json_error:
+            raise self._json_error
+        return self._data
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *args):
+        return False
+
+
+def _client_with_response(response: "_FakeResponse") -> tuple[KISAPIClient, MagicMock]:
+    """_get_token/_get_session을 대체해 고정 응답을 돌려주는 클라이언트"""
+    client = _make_client()
+    session = MagicMock()
+    session.request.return_value = response
+    client._get_token = AsyncMock(return_value="tok")
+    client._get_session = AsyncMock(return_value=session)
+    return client, session
+
+
+class TestRequestHelper:
+    async def test_returns_parsed_json_and_sends_headers(self):
+        client, session = _client_with_response(_FakeResponse(data={"rt_cd": "0"}))
+
+        data = await client._request("GET", "balance", "VTTC8434R", params={"a": "1"})
+
+        assert data == {"rt_cd": "0"}
+        method, url = session.request.call_args.args
+        kwargs = session.request.call_args.kwargs
+        assert method == "GET"
+        assert url == client.config.endpoints["balance"]
+        assert kwargs["headers"]["tr_id"] == "VTTC8434R"
+        assert kwargs["params"] == {"a": "1"}
+
+    async def test_json_error_is_retryable_for_reads(self):
+        client, _ = _client_with_response(_FakeResponse(json_error=ValueError("bad")))
+        with pytest.raises(RetryableError):
+            await client._request("GET", "balance", "VTTC8434R")
+
+    async def test_json_error_is_not_retryable_for_orders(self):
+        client, _ = _client_with_response(_FakeResponse(json_error=ValueError("bad")))
+        with pytest.raises(OrderSubmissionUnknownError) as exc_info:
+            await client._request("POST", "order", "VTTC0802U", json={}, idempotent=False)
+        assert not isinstance(exc_info.value, RetryableError)
+
+    async def test_server_error_on_order_is_unknown_state(self):
+        client, session = _client_with_response(_FakeResponse(status=502, data={"rt_cd": "1", "msg1": "x"}))
+        with pytest.raises(OrderSubmissionUnknownError) as exc_info:
+            await client.place_order("005930", OrderSide.BUY, 1, 70000)
+        assert not isinstance(exc_info.value, RetryableError)
+        session.request.assert_called_once()
+
+    async def test_server_error_on_read_stays_retryable(self):
+        client, _ = _client_with_response(_FakeResponse(status=503, data={}))
+        with pytest.raises(RetryableError):
+            await client._request("GET", "balance", "VTTC8434R")
+
+    async def test_price_tr_ids_same_for_real_and_virtual(self):
+        for is_real in (False, True):
+            client, session = _client_with_response(_FakeResponse(data={"rt_cd": "0", "output": {}}))
+            client.config = KISConfig(app_key="k", app_secret="s", account_no="1", is_real=is_real)
+
+            await client._fetch_korea_price("005930")
+            assert session.request.call_args.kwargs["headers"]["tr_id"] == "FHKST01010100"
+            await client._fetch_overseas_price("AAPL", KISMarket.USA)
+            assert session.request.call_args.kwargs["headers"]["tr_id"] == "HHDFS00000300"
+
+    async def test_overseas_exchange_codes(self):
+        client, session = _client_with_response(_FakeResponse(data={"rt_cd": "0", "output1": {}}))
+
+        await client._fetch_overseas_price("7203", KISMarket.JAPAN)
+        assert session.request.call_args.kwargs["params"]["EXCD"] == "TSE"
+
+        await client.place_overseas_order("0700", OrderSide.BUY, 1, 300.0, KISMarket.HONGKONG)
+        assert session.request.call_args.kwargs["json"]["OVRS_EXCG_CD"] == "SEHK"
+
+    async def test_balance_parses_positions(self):
+        data = {
+            "rt_cd": "0",
+            "output1": [
+                {
+                    "pdno": "005930",
+                    "prdt_name": "삼성전자",
+                    "hldg_qty": "10",
+                    "pchs_avg_pric": "70000",
+                    "prpr": "71000",
+                },
+                {"pdno": "000660", "hldg_qty": "0"},
+            ],
+            "output2": [{"tot_evlu_amt": "1000000", "dnca_tot_amt": "500000"}],
+        }
+        client, _ = _client_with_response(_FakeResponse(data=data))
+
+        balance = await client.get_balance()
+
+        assert balance["total_equity"] == 1_000_000.0
+        assert balance["cash"] == 500_000.0
+        assert [p["symbol"] for p in balance["positions"]] == ["005930"]
+        assert balance["positions"][0]["quantity"] == 10
+
+    async def test_balance_columnar_output(self):
+        data = {
+            "rt_cd": "0",
+            "output1": [
+                {"pdno": "005930", "hldg_qty": "10", "pchs_avg_pric": "70000", "prpr": "71000"},
+                {"pdno": "000660", "hldg_qty": "0"},
+                {"pdno": "035420", "hldg_qty": "3", "pchs_avg_pric": "200000", "prpr": "190000"},
+            ],
+            "output2": [{"tot_evlu_amt": "1000000", "dnca_tot_amt": "500000"}],
+        }
+        client, _ = _client_with_response(_FakeResponse(data=data))
+
+        balance = await client.get_balance(columnar=True)
+
+        assert "positions" not in balance
+        assert balance["symbols"] == ["005930", "035420"]
+        assert balance["quantities"].dtype == np.int64
+        assert balance["quantities"].tolist() == [10, 3]
+        assert balance["avg_prices"].tolist() == [70000.0, 200000.0]
+        assert balance["current_prices"].tolist() == [71000.0, 190000.0]
+
+    async def test_daily_ccld_params_use_single_date(self):
+        client = _make_client()
+        params = client._daily_ccld_params("0001")
+        assert params["INQR_STRT_DT"] == params["INQR_END_DT"]
+        assert len(params["INQR_STRT_DT"]) == 8
+        assert params["ODNO"] == "0001"
+        assert params["CANO"] == client.config.account_no
+        assert client._daily_ccld_params()["ODNO"] == ""
+        assert "ODNO" not in client._daily_ccld_base
+
+    async def test_order_status_picks_matching_order(self):
+        data = {
+            "rt_cd": "0",
+            "output1": [
+                {"odno": "0002", "tot_ccld_qty": "0"},
+                {"odno": "0001", "pdno": "005930", "sll_buy_dvsn_cd": "02", "ord_qty": "5", "tot_ccld_qty": "5"},
+            ],
+        }
+        client, session = _client_with_response(_FakeResponse(data=data))
+
+        status = await client.get_order_status("0001")
+
+        assert session.request.call_args.kwargs["params"]["ODNO"] == "0001"
+        assert status["status"] == "filled"
+        assert status["side"] == "buy"
+        assert status["filled_qty"] == 5
+
+    async def test_order_status_not_found(self):
+        client, _ = _client_with_response(_FakeResponse(data={"rt_cd": "0", "output1": [{"odno": "0002"}]}))
+        assert (await client.get_order_status("0001"))["status"] == "not_found"
+
+    async def test_balance_failure_returns_empty(self):
+        client, _ = _client_with_response(_FakeResponse(data={"rt_cd": "1", "msg1": "x"}))
+        assert await client.get_balance() == {}
@@ -1,15 +1,38 @@
 """tests/test_market_calendar.py - 마켓 캘린더 테스트"""
 
-from datetime import datetime, time
+import logging
+from datetime import date, datetime, time, timedelta
+from unittest.mock import patch
+
+import numpy as np
+import pytest
 
 from src.market_calendar import (
+    EST,
+    HOLIDAYS_BY_YEAR,
     KR_HOLIDAYS_2026,
+    KST,
     MARKET_HOURS,
     US_HOLIDAYS_2026,
+    UTC,
+    MarketState,
+    _is_nonbiz,
+    _signals_cache,
+    _snapshot,
+    _to_market_time,
+    _tz_offset_cache,
+    classify_market,
+    dst_end,
+    dst_start,
     get_market_status,
+    get_market_time,
     infer_market,
+    is_dst,
     is_holiday,
+    is_holiday_vec,
+    is_market_open,
     is_weekend,
+    should_check_signals,
 )
 
 
@@ -32,6 +55,15 @@ class TestInferMarket:
     def test_crypto_eth(self):
         assert infer_market("ETH-USD") == "CRYPTO"
 
+    def test_crypto_usdt_pair(self):
+        assert infer_market("BTCUSDT") == "CRYPTO"
+
+    def test_repeated_lookup_is_cached(self):
+        infer_market.cache_clear()
+        infer_market("000660.KS")
+        infer_market("000660.KS")
+        assert infer_market.cache_info().hits == 1
+
 
 class TestWeekend:
     def test_saturday(self):
@@ -82,15 +114,36 @@ class TestHoliday:
             dt = datetime(2026, 11, 26, 12, 0, tzinfo=EST)
         assert is_holiday(dt, "US") is True
 
+    def test_date_object_uses_year_index(self):
+        assert is_holiday(date(2028, 10, 11), "KR") is True
+        assert is_holiday(date(2028, 10, 11), "US") is False
+        assert isinstance(HOLIDAYS_BY_YEAR["KR"][2028], frozenset)
+
+    def test_out_of_range_year_warns_once(self, caplog):
+        with caplog.at_level(logging.WARNING, logger="src.market_calendar"):
+            assert is_holiday(date(2041, 1, 1), "KR") is False
+            assert is_holiday(date(2041, 1, 2), "KR") is False
+        assert sum("2041" in r.message for r in caplog.records) == 1
+        assert any("2026-2030" in r.message for r in caplog.records)
+
 
 class TestMarketHours:
     def test_kr_has_correct_hours(self):
-        assert MARKET_HOURS["KR"]["open"] == time(9, 0)
-        assert MARKET_HOURS["KR"]["close"] == time(15, 30)
+        assert MARKET_HOURS["KR"].open == time(9, 0)
+        assert MARKET_HOURS["KR"].close == time(15, 30)
+
+    def test_minute_fields_match_times(self):
+        for config in MARKET_HOURS.values():
+            assert config.open_min == config.open.hour * 60 + config.open.minute
+            assert config.close_min == config.close.hour * 60 + config.close.minute
+
+    def test_config_is_immutable(self):
+        with pytest.raises(AttributeError):
+            MARKET_HOURS["KR"].open = time(10, 0)  # type: ignore[misc]
 
     def test_us_has_correct_hours(self):
-        assert MARKET_HOURS["US"]["open"] == time(9, 30)
-        assert MARKET_HOURS["US"]["close"] == time(16, 0)
+        assert MARKET_HOURS["US"].open == time(9, 30)
+        assert MARKET_HOURS["US"].close == time(16, 0)
 
 
 class TestMarketStatus:
@@ -105,6 +158,114 @@ class TestMarketStatus:
         assert "NYSE" in status
 
 
+class TestSingleClockRead:
+    def test_status_reads_clock_once(self):
+        now = datetime(2026, 3, 3, 10, 0, tzinfo=KST)  # 화요일 장중
+        with patch("src.market_calendar.get_market_time", return_value=now) as mock_time:
+            status = get_market_status("KR")
+        assert "장중 (10:00)" in status
+        mock_time.assert_called_once_with("KR")
+
+    def test_market_open_reads_clock_once(self):
+        now = datetime(2026, 3, 3, 16, 0, tzinfo=KST)
+        with patch("src.market_calendar.get_market_time", return_value=now) as mock_time:
+            assert is_market_open("KR") is False
+        mock_time.assert_called_once()
+
+
+class TestMinuteBoundaries:
+    def test_status_boundaries(self):
+        cases = [((8, 59), "장전"), ((9, 0), "장중"), ((15, 30), "장중"), ((15, 31), "장후")]
+        for (hour, minute), expected in cases:
+            now = datetime(2026, 3, 3, hour, minute, tzinfo=KST)
+            with patch("src.market_calendar.get_market_time", return_value=now):
+                assert expected in get_market_status("KR"), (hour, minute)
+
+
+class TestDst:
+    def test_known_transition_dates(self):
+        assert dst_start(2026) == date(2026, 3, 8)
+        assert dst_end(2026) == date(2026, 11, 1)
+        assert dst_start(2027) == date(2027, 3, 14)
+        assert dst_end(2027) == date(2027, 11, 7)
+
+    def test_matches_zoneinfo_offsets(self):
+        for year in (2026, 2027, 2028, 2029, 2030):
+            day = date(year, 1, 1)
+            while day.year == year:
+                noon = datetime(day.year, day.month, day.day, 12, tzinfo=EST)
+                assert is_dst(day) is (noon.utcoffset() == timedelta(hours=-4)), day
+                day += timedelta(days=1)
+
+
+class TestMarketTimeOffsetCache:
+    def test_matches_astimezone_across_dst_transitions(self):
+        _tz_offset_cache.clear()
+        # 2026 봄 전환(3/8 07:00 UTC), 가을 전환(11/1 06:00 UTC) 전후를 10분 간격으로 확인
+        for start in (datetime(2026, 3, 8, 5, tzinfo=UTC), datetime(2026, 11, 1, 4, tzinfo=UTC)):
+            for step in range(24):
+                utc_now = start + timedelta(minutes=10 * step)
+                local = _to_market_time("US", EST, utc_now)
+                expected = utc_now.astimezone(EST)
+                assert local == expected
+                assert local.replace(tzinfo=None) == expected.replace(tzinfo=None)
+                assert local.utcoffset() == expected.utcoffset()
+
+    def test_get_market_time_is_aware_local_time(self):
+        now = get_market_time("KR")
+        assert now.tzinfo is KST
+        assert abs(now - datetime.now(UTC)) < timedelta(seconds=5)
+
+
+class TestClassifyMarket:
+    @pytest.mark.parametrize(
+        "now,expected",
+        [
+            (datetime(2026, 3, 7, 10, 0, tzinfo=KST), MarketState.WEEKEND),
+            (datetime(2026, 3, 2, 10, 0, tzinfo=KST), MarketState.HOLIDAY),
+            (datetime(2026, 3, 3, 8, 59, tzinfo=KST), MarketState.PRE_OPEN),
+            (datetime(2026, 3, 3, 9, 0, tzinfo=KST), MarketState.OPEN),
+            (datetime(2026, 3, 3, 15, 31, tzinfo=KST), MarketState.POST_CLOSE),
+        ],
+    )
+    def test_states(self, now, expected):
+        with patch("src.market_calendar.get_market_time", return_value=now):
+            state, at = classify_market("KR")
+        assert state is expected
+        assert at is now
+
+    def test_unknown_market_raises(self):
+        with pytest.raises(ValueError):
+            classify_market("XX")
+
+    def test_should_check_signals_after_close_only(self):
+        _signals_cache.clear()
+        after_close = datetime(2026, 3, 3, 16, 0, tzinfo=KST)
+        with patch("src.market_calendar.get_market_time", return_value=after_close):
+            assert should_check_signals("005930.KS") is True
+        _signals_cache.clear()
+        during = datetime(2026, 3, 3, 11, 0, tzinfo=KST)
+        with patch("src.market_calendar.get_market_time", return_value=during):
+            assert should_check_signals("005930.KS") is False
+        assert should_check_signals("BTC-USD") is True
+
+    def test_should_check_signals_classifies_once_per_market_minute(self):
+        _signals_cache.clear()
+        after_close = datetime(2026, 3, 3, 16, 0, tzinfo=KST)
+        with (
+            patch("src.market_calendar._time.time", return_value=1_800_000_000.0),
+            patch("src.market_calendar.get_market_time", return_value=after_close) as clock,
+        ):
+            assert all(should_check_signals(s) for s in ("005930.KS", "000660.KS", "035720.KQ"))
+            assert clock.call_count == 1
+        with (
+            patch("src.market_calendar._time.time", return_value=1_800_000_060.0),
+            patch("src.market_calendar.get_market_time", return_value=after_close) as clock,
+        ):
+            assert should_check_signals("005930.KS") is True
+            assert clock.call_count == 1
+
+
 class TestHolidayCompleteness:
     def test_kr_holidays_count(self):
         assert len(KR_HOLIDAYS_2026) >= 15  # Updated: includes 대체공휴일
@@ -112,6 +273,11 @@ class TestHolidayCompleteness:
     def test_us_holidays_count(self):
         assert len(US_HOLIDAYS_2026) >= 8
 
+    def test_holiday_sets_are_shared_frozensets(self):
+        assert isinstance(KR_HOLIDAYS_2026, frozenset)
+        assert HOLIDAYS_BY_YEAR["KR"][2026] is KR_HOLIDAYS_2026
+        assert HOLIDAYS_BY_YEAR["US"][2026] is US_HOLIDAYS_2026
+
     def test_kr_substitute_holiday(self):
         """대체공휴일 확인 - 삼일절 2026/3/1 일요일 → 3/2 월요일"""
         from src.market_calendar import KST
@@ -121,3 +287,40 @@ class TestHolidayCompleteness:
         else:
             dt = datetime(2026, 3, 2, 12, 0, tzinfo=KST)
         assert is_holiday(dt, "KR") is True
+
+
+class TestIsHolidayVec:
+    def test_matches_scalar_for_every_day(self):
+        days = [date(2026, 1, 1) + timedelta(days=i) for i in range(5 * 365)]
+        for market in ("KR", "US"):
+            expected = [is_holiday(d, market) for d in days]
+            assert is_holiday_vec(days, market).tolist() == expected
+            as_dt64 = np.array(days, dtype="datetime64[D]")
+            assert is_holiday_vec(as_dt64, market).tolist() == expected
+
+    def test_datetime64_is_floored_to_day(self):
+        stamps = np.array(["2026-12-25T10:30", "2026-12-24T23:59"], dtype="datetime64[m]")
+        assert is_holiday_vec(stamps, "US").tolist() == [True, False]
+
+    def test_crypto_never_holiday(self):
+        assert not is_holiday_vec([date(2026, 1, 1)], "CRYPTO").any()
+
+
+class TestNonBusinessBitmap:
+    def test_bitmap_matches_weekend_and_holiday_checks(self):
+        for market in ("KR", "US"):
+            day = date(2026, 1, 1)
+            while day.year <= 2030:
+                expected = is_weekend(day, market) or is_holiday(day, market)
+                assert _is_nonbiz(market, day) is expected, (market, day)
+                day += timedelta(days=1)
+
+    def test_year_without_bitmap_falls_back_to_weekday(self):
+        assert _is_nonbiz("KR", date(2031, 1, 4)) is True  # 토요일
+        assert _is_nonbiz("KR", date(2031, 1, 6)) is False  # 월요일
+
+    def test_snapshot_primitives(self):
+        day, weekday, minute = _snapshot(datetime(2026, 3, 7, 15, 30, tzinfo=KST))
+        assert day == date(2026, 3, 7)
+        assert weekday == 5
+        assert minute == 15 * 60 + 30
@@ -4,29 +4,39 @@ notifier.py 단위 테스트
 - TelegramChannel, DiscordChannel 포매팅
 - EmailChannel HTML 포매팅
 - NotificationManager 채널 관리
+- HTTP 채널 세션 재사용
 """
 
+import asyncio
 import smtplib
+import threading
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
 from src.notifier import (
+    _DISCORD_COLOR,
+    _TELEGRAM_EMOJI,
     DiscordChannel,
     EmailChannel,
+    NotificationChannel,
     NotificationLevel,
     NotificationManager,
     NotificationMessage,
+    NotificationSendError,
     TelegramChannel,
+    _retry_after_of,
 )
+from src.utils import json_dumps
 
 
 class TestNotificationLevel:
     def test_all_levels(self):
-        assert NotificationLevel.INFO.value == "info"
-        assert NotificationLevel.WARNING.value == "warning"
-        assert NotificationLevel.SIGNAL.value == "signal"
-        assert NotificationLevel.ERROR.value == "error"
+        assert NotificationLevel.INFO.value == 0
+        assert NotificationLevel.WARNING.value == 1
+        assert NotificationLevel.SIGNAL.value == 2
+        assert NotificationLevel.ERROR.value == 3
+        assert NotificationLevel.ERROR.name == "ERROR"
 
 
 class TestNotificationMessage:
@@ -130,6 +140,10 @@ class TestDiscordChannelFormatting:
         error_embed = ch._format_embed(NotificationMessage(title="", body="", level=NotificationLevel.ERROR))
         assert info_embed["color"] != error_embed["color"]
 
+    def test_level_tables_cover_every_level(self):
+        assert len(_DISCORD_COLOR) == len(NotificationLevel)
+        assert len(_TELEGRAM_EMOJI) == len(NotificationLevel)
+
 
 class TestEmailChannelFormatting:
     def test_format_html_basic(self):
@@ -370,6 +384,28 @@ class TestNotificationManager:
         results = await manager.send_with_escalation(msg)
         assert results == {}
 
+    async def test_send_all_runs_channels_concurrently(self):
+        """한 채널이 다른 채널의 전송 시작을 기다려도 교착 없이 완료된다 (직렬 await 회귀 방지)."""
+        started = asyncio.Event()
+
+        class WaitingChannel(NotificationChannel):
+            async def send(self, message):
+                await started.wait()
+                return True
+
+        class SignallingChannel(NotificationChannel):
+            async def send(self, message):
+                started.set()
+                return True
+
+        manager = NotificationManager()
+        manager.add_channel(WaitingChannel())
+        manager.add_channel(SignallingChannel())
+
+        msg = NotificationMessage(title="Signal", body="Buy", level=NotificationLevel.SIGNAL)
+        results = await asyncio.wait_for(manager.send_all(msg), timeout=1.0)
+        assert results == {"WaitingChannel": True, "SignallingChannel": True}
+
 
 def _make_email_channel() -> EmailChannel:
     return EmailChannel(
@@ -442,6 +478,264 @@ class TestEmailChannelRetry:
 
         mock_smtp_cls.assert_called_once_with("localhost", 587, timeout=10)
 
+    async def test_email_reuses_smtp_connection(self):
+        """NOOP이 정상이면 연결·STARTTLS·로그인 없이 기존 SMTP 연결을 재사용한다."""
+        ch = _make_email_channel()
+        with patch("smtplib.SMTP") as mock_smtp_cls:
+            server = mock_smtp_cls.return_value
+            server.noop.return_value = (250, b"OK")
+            for i in range(3):
+                assert await ch.send(NotificationMessage(title=f"T{i}", body="Hello")) is True
+
+            mock_smtp_cls.assert_called_once()
+            server.login.assert_called_once()
+            assert server.send_message.call_count == 3
+
+            await ch.close()
+            server.quit.assert_called_once()
+        assert ch._smtp is None
+
+    async def test_email_reconnects_when_noop_fails(self):
+        ch = _make_email_channel()
+        with patch("smtplib.SMTP") as mock_smtp_cls:
+            stale, fresh = MagicMock(), MagicMock()
+            stale.noop.side_effect = smtplib.SMTPServerDisconnected("gone")
+            mock_smtp_cls.side_effect = [stale, fresh]
+
+            await ch.send(NotificationMessage(title="T1", body="Hello"))
+            await ch.send(NotificationMessage(title="T2", body="Hello"))
+
+        assert mock_smtp_cls.call_count == 2
+        stale.quit.assert_called_once()
+        fresh.send_message.assert_called_once()
+        await ch.close()
+
+    async def test_email_recycles_connection_after_limit(self):
+        ch = _make_email_channel()
+        with (
+            patch("smtplib.SMTP") as mock_smtp_cls,
+            patch("src.notifier._SMTP_MAX_SENDS_PER_CONNECTION", 2),
+        ):
+            mock_smtp_cls.return_value.noop.return_value = (250, b"OK")
+            for i in range(3):
+                await ch.send(NotificationMessage(title=f"T{i}", body="Hello"))
+
+        assert mock_smtp_cls.call_count == 2
+        await ch.close()
+
+    async def test_email_sends_on_dedicated_executor(self):
+        """SMTP 전송은 기본 executor가 아닌 email 전용 스레드에서 실행된다."""
+        ch = _make_email_channel()
+        thread_names = []
+
+        with patch.object(
+            ch, "_send_email", side_effect=lambda msg: thread_names.append(threading.current_thread().name)
+        ):
+            await ch.send(NotificationMessage(title="T1", body="B"))
+            executor = ch._executor
+            await ch.send(NotificationMessage(title="T2", body="B"))
+
+        assert ch._executor is executor
+        assert all(name.startswith("email") for name in thread_names)
+        await ch.close()
+        assert ch._executor is None
+
+
+def _mock_http_session(status: int = 200) -> MagicMock:
+    resp = MagicMock(status=status)
+    session = MagicMock(closed=False)
+    session.post.return_value.__aenter__ = AsyncMock(return_value=resp)
+    session.post.return_value.__aexit__ = AsyncMock(return_value=False)
+    session.close = AsyncMock()
+    return session
+
+
+class TestHTTPSessionReuse:
+    @pytest.mark.parametrize(
+        "channel",
+        [
+            TelegramChannel(bot_token="fake_token", chat_id="fake_chat"),
+            DiscordChannel(webhook_url="https://discord.com/api/webhooks/123/abc"),
+        ],
+        ids=["telegram", "discord"],
+    )
+    async def test_session_created_once_across_sends(self, channel):
+        session = _mock_http_session()
+        with (
+            patch("src.notifier.aiohttp.TCPConnector") as mock_connector,
+            patch("src.notifier.aiohttp.ClientSession", return_value=session) as mock_session_cls,
+        ):
+            for i in range(3):
+                assert await channel.send(NotificationMessage(title=f"T{i}", body="B")) is True
+
+        mock_session_cls.assert_called_once()
+        assert mock_session_cls.call_args.kwargs["json_serialize"] is json_dumps
+        assert mock_session_cls.call_args.kwargs["timeout"].connect == 3
+        assert mock_connector.call_args.kwargs["keepalive_timeout"] == 60
+        assert session.post.call_count == 3
+
+        await channel.close()
+        session.close.assert_awaited_once()
+        assert channel._session is None
+
+    async def test_closed_session_is_recreated(self):
+        ch = TelegramChannel(bot_token="fake_token", chat_id="fake_chat")
+        first, second = _mock_http_session(), _mock_http_session()
+        with (
+            patch("src.notifier.aiohttp.TCPConnector"),
+            patch("src.notifier.aiohttp.ClientSession", side_effect=[first, second]),
+        ):
+            assert await ch._get_session() is first
+            first.closed = True
+            assert await ch._get_session() is second
+
+    async def test_manager_close_closes_all_channels(self):
+        manager = NotificationManager()
+        channels = [MagicMock(send=AsyncMock(), close=AsyncMock()) for _ in range(2)]
+        for ch in channels:
+            manager.add_channel(ch)
+
+        async with manager:
+            pass
+
+        for ch in channels:
+            ch.close.assert_awaited_once()
+
+    async def test_email_close_without_send(self):
+        await _make_email_channel().close()
+
+
+def _mock_response(status: int, headers=None, body=None) -> MagicMock:
+    resp = MagicMock(status=status, headers=headers or {})
+    resp.json = AsyncMock(return_value=body)
+    return resp
+
+
+class TestHTTPRateLimitRetry:
+    @pytest.mark.parametrize(
+        "resp,expected",
+        [
+            (_mock_response(429, headers={"Retry-After": "7"}), 7.0),
+            (_mock_response(429, body={"retry_after": 1.5}), 1.5),
+            (_mock_response(429, body={"ok": False, "parameters": {"retry_after": 3}}), 3.0),
+            (_mock_response(429, body=None), None),
+        ],
+        ids=["header", "discord-body", "telegram-body", "missing"],
+    )
+    async def test_retry_after_parsing(self, resp, expected):
+        assert await _retry_after_of(resp) == expected
+
+    async def test_telegram_429_waits_retry_after_then_succeeds(self):
+        ch = TelegramChannel(bot_token="fake_token", chat_id="fake_chat")
+        session = _mock_http_session()
+        session.post.return_value.__aenter__.side_effect = [
+            _mock_response(429, body={"ok": False, "parameters": {"retry_after": 4}}),
+            _mock_response(200),
+        ]
+        with (
+            patch("src.notifier.aiohttp.TCPConnector"),
+            patch("src.notifier.aiohttp.ClientSession", return_value=session),
+            patch("src.utils.asyncio.sleep", new_callable=AsyncMock) as mock_sleep,
+        ):
+            assert await ch.send(NotificationMessage(title="T", body="B")) is True
+
+        mock_sleep.assert_awaited_once_with(4.0)
+
+    async def test_non_429_error_carries_no_retry_after(self):
+        ch = DiscordChannel(webhook_url="https://discord.com/api/webhooks/123/abc")
+        session = _mock_http_session(status=500)
+        with (
+            patch("src.notifier.aiohttp.TCPConnector"),
+            patch("src.notifier.aiohttp.ClientSession", return_value=session),
+            patch("src.utils.asyncio.sleep", new_callable=AsyncMock),
+        ):
+            with pytest.raises(NotificationSendError) as exc_info:
+                await ch._send_with_retry(NotificationMessage(title="T", body="B"))
+
+        assert exc_info.value.retry_after is None
+        assert session.post.call_count == 4  # 최초 1회 + 재시도 3회
+
+    @pytest.mark.parametrize(
+        "channel,rate",
+        [
+            (TelegramChannel(bot_token="fake_token", chat_id="fake_chat"), 1.0),
+            (DiscordChannel(webhook_url="https://discord.com/api/webhooks/123/abc"), 2.0),
+        ],
+        ids=["telegram", "discord"],
+    )
+    async def test_every_attempt_takes_a_rate_limit_token(self, channel, rate):
+        assert channel._bucket.rate == rate
+        session = _mock_http_session()
+        session.post.return_value.__aenter__.side_effect = [_mock_response(503), _mock_response(200)]
+        with (
+            patch("src.notifier.aiohttp.TCPConnector"),
+            patch("src.notifier.aiohttp.ClientSession", return_value=session),
+            patch("src.utils.asyncio.sleep", new_callable=AsyncMock),
+            patch.object(channel._bucket, "acquire", new_callable=AsyncMock) as mock_acquire,
+        ):
+            assert await channel.send(NotificationMessage(title="T", body="B")) is True
+
+        assert mock_acquire.await_count == 2
+        await channel.close()
+
+    async def test_message_formatted_once_across_retries(self):
+        ch = TelegramChannel(bot_token="fake_token", chat_id="fake_chat")
+        session = _mock_http_session()
+        session.post.return_value.__aenter__.side_effect = [
+            _mock_response(503),
+            _mock_response(503),
+            _mock_response(200),
+        ]
+        with (
+            patch("src.notifier.aiohttp.TCPConnector"),
+            patch("src.notifier.aiohttp.ClientSession", return_value=session),
+            patch("src.utils.asyncio.sleep", new_callable=AsyncMock),
+            patch.object(ch, "_format_message", wraps=ch._format_message) as spy,
+        ):
+            assert await ch.send(NotificationMessage(title="T", body="B", data={"k": "v"})) is True
+
+        assert spy.call_count == 1
+        assert session.post.call_count == 3
+        first, last = session.post.call_args_list[0], session.post.call_args_list[-1]
+        assert first.kwargs["json"] is last.kwargs["json"]
+        await ch.close()
+
+
+class TestChannelMetrics:
+    async def test_retries_counted_separately_from_terminal_outcome(self):
+        manager = NotificationManager()
+        ch = TelegramChannel(bot_token="fake_token", chat_id="fake_chat")
+        manager.add_channel(ch)
+        session = _mock_http_session()
+        session.post.return_value.__aenter__.side_effect = [
+            _mock_response(503),
+            _mock_response(200),
+            *[_mock_response(500)] * 4,
+        ]
+        msg = NotificationMessage(title="T", body="B", level=NotificationLevel.SIGNAL)
+        with (
+            patch("src.notifier.aiohttp.TCPConnector"),
+            patch("src.notifier.aiohttp.ClientSession", return_value=session),
+            patch("src.utils.asyncio.sleep", new_callable=AsyncMock),
+        ):
+            assert await manager.send_all(msg) == {"TelegramChannel": True}
+            assert await manager.send_all(msg) == {"TelegramChannel": False}
+
+        metrics = manager.get_channel_metrics()["TelegramChannel"]
+        assert metrics["success"] == 1
+        assert metrics["failure"] == 1
+        assert metrics["retries"] == 1 + 3
+        assert metrics["max_latency"] >= metrics["avg_latency"] > 0
+        assert manager.get_channel_health()["TelegramChannel"] == {"success": 1, "failure": 1}
+        await manager.close()
+
+    async def test_metrics_without_sends(self):
+        manager = NotificationManager()
+        manager.add_channel(TelegramChannel(bot_token="fake", chat_id="fake"))
+        assert manager.get_channel_metrics() == {
+            "TelegramChannel": {"success": 0, "failure": 0, "retries": 0, "avg_latency": 0.0, "max_latency": 0.0}
+        }
+
 
 class TestSecurityFixes:
     """보안 수정 검증 테스트"""
@@ -452,9 +746,7 @@ class TestSecurityFixes:
         ch = _make_email_channel()
 
         with patch("smtplib.SMTP") as mock_smtp_cls:
-            mock_server = MagicMock()
-            mock_smtp_cls.return_value.__enter__ = MagicMock(return_value=mock_server)
-            mock_smtp_cls.return_value.__exit__ = MagicMock(return_value=False)
+            mock_server = mock_smtp_cls.return_value
 
             with patch("src.notifier.ssl.create_default_context") as mock_ssl:
                 mock_context = MagicMock()
@@ -268,6 +268,27 @@ class TestAccountState:
         assert account.current_equity == 100100.0
         assert pos.current_price == 110.0
 
+    def test_update_equity_partial_prices(self):
+        """가격이 없는 종목은 기존 current_price 유지, 보유하지 않은 종목 가격은 무시"""
+        account = AccountState(initial_capital=100000.0)
+        for symbol, price in (("SPY", 100.0), ("QQQ", 50.0)):
+            account.positions[symbol] = LivePosition(
+                symbol=symbol,
+                direction=Direction.LONG,
+                entry_date=datetime(2025, 1, 1),
+                entry_price=price,
+                quantity=10,
+                n_at_entry=2.5,
+                stop_price=price * 0.95,
+                current_price=price,
+            )
+        account.cash = 98500.0
+        account.update_equity(prices={"SPY": 110.0, "TLT": 90.0})
+        # equity = 98500 + 10*110 + 10*50 = 100100
+        assert account.current_equity == 100100.0
+        assert account.positions["QQQ"].current_price == 50.0
+        assert "TLT" not in account.positions
+
     def test_empty_positions_dict(self):
         account = AccountState(initial_capital=100000.0)
         assert len(account.positions) == 0
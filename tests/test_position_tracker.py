@@ -12,6 +12,7 @@ import pytest
 
 from src.position_tracker import Position, PositionTracker
 from src.types import Direction
+from src.utils import safe_load_json
 
 
 @pytest.fixture
@@ -28,6 +29,15 @@ class TestPositionLifecycle:
         assert pos.total_shares == 40
         assert pos.stop_loss == 95.0  # 100 - 2*2.5
 
+    def test_open_position_timestamps_consistent(self, tracker):
+        """position_id, entry_date, last_update가 같은 시각에서 파생"""
+        from datetime import datetime
+
+        pos = tracker.open_position("SPY", 1, "LONG", 100.0, 2.5, 40)
+        updated = datetime.fromisoformat(pos.last_update)
+        assert pos.position_id.endswith(updated.strftime("%Y%m%d_%H%M%S"))
+        assert pos.entry_date == updated.strftime("%Y-%m-%d")
+
     def test_open_position_stores_entry_reason(self, tracker):
         """open_position에 entry_reason을 전달하면 Position에 저장되고 persistence round-trip 후에도 유지된다"""
         pos = tracker.open_position(
@@ -108,6 +118,29 @@ class TestPyramiding:
         assert tracker.should_pyramid(pos, 101.0) is False  # Not enough
         assert tracker.should_pyramid(pos, 101.25) is True  # Exactly 0.5N
 
+    def test_should_pyramid_uses_last_entry_price(self, tracker):
+        """피라미딩 후에는 마지막 진입가 기준으로 판단 (진입 기록 조회 없음)"""
+        from unittest.mock import patch
+
+        pos = tracker.open_position("SPY", 1, "LONG", 100.0, 2.5, 40)
+        pos = tracker.add_pyramid(pos.position_id, 101.25, 2.5, 40)
+        assert pos.last_entry_price == 101.25
+        assert pos.last_entry_n == 2.5
+
+        with patch.object(tracker, "get_entries") as get_entries:
+            assert tracker.should_pyramid(pos, 102.0) is False
+            assert tracker.should_pyramid(pos, 102.5) is True
+            get_entries.assert_not_called()
+
+    def test_should_pyramid_legacy_position_falls_back_to_entries(self, tracker):
+        """last_entry_price가 없는 구버전 포지션은 진입 기록으로 판단"""
+        pos = tracker.open_position("SPY", 1, "LONG", 100.0, 2.5, 40)
+        pos = tracker.add_pyramid(pos.position_id, 101.25, 2.5, 40)
+        pos.last_entry_price = None
+
+        assert tracker.should_pyramid(pos, 102.0) is False
+        assert tracker.should_pyramid(pos, 102.5) is True
+
 
 class TestRMultiple:
     def test_positive_r(self, tracker):
@@ -181,6 +214,23 @@ class TestCheckStopLoss:
         triggered = tracker.check_stop_loss({"QQQ": 50.0})
         assert len(triggered) == 0
 
+    def test_batch_mixed_directions_preserves_order(self, tracker):
+        """여러 포지션을 한 번에 평가: 경계값 포함, 청산 포지션 제외, 입력 순서 유지"""
+        a = tracker.open_position("AAA", 1, "LONG", 100.0, 2.5, 10)  # stop=95
+        tracker.open_position("BBB", 1, "LONG", 50.0, 1.0, 10)  # stop=48
+        c = tracker.open_position("CCC", 1, "SHORT", 200.0, 5.0, 10)  # stop=210
+        d = tracker.open_position("DDD", 1, "LONG", 30.0, 1.0, 10)  # stop=28
+        tracker.close_position(d.position_id, 29.0)
+
+        triggered = tracker.check_stop_loss({"AAA": 95.0, "BBB": 49.0, "CCC": 210.0, "DDD": 1.0})
+        assert [p.position_id for p in triggered] == [a.position_id, c.position_id]
+
+        triggered[0].stop_loss = 0.0
+        assert tracker.get_position(a.position_id).stop_loss == 95.0
+
+    def test_no_open_positions(self, tracker):
+        assert tracker.check_stop_loss({"SPY": 1.0}) == []
+
 
 class TestPnLCalculation:
     def test_pnl_with_pyramid_weighted_average(self, tracker):
@@ -258,6 +308,35 @@ class TestDirectionEnum:
         assert d["direction"] == "LONG"
         assert isinstance(d["direction"], str)
 
+    def test_to_dict_matches_asdict_and_is_copy(self, tracker):
+        """to_dict()는 asdict()와 같은 키/값을 반환하고 인스턴스와 분리된 사본"""
+        from dataclasses import asdict
+
+        pos = tracker.open_position("SPY", 1, "LONG", 100.0, 2.5, 40)
+        d = pos.to_dict()
+        expected = asdict(pos)
+        expected["direction"] = "LONG"
+        assert d == expected
+
+        d["symbol"] = "QQQ"
+        assert pos.symbol == "SPY"
+
+    def test_slotted_records_persist_all_fields(self, tracker):
+        """slots 데이터클래스: __dict__ 없음, 저장 파일에 모든 필드 기록"""
+        from dataclasses import fields
+
+        from src.position_tracker import PositionEntry
+
+        pos = tracker.open_position("SPY", 1, "LONG", 100.0, 2.5, 40)
+        assert not hasattr(pos, "__dict__")
+        with pytest.raises(AttributeError):
+            pos.unknown_attr = 1
+
+        saved_pos = json.loads(tracker.positions_file.read_text())[0]
+        saved_entry = json.loads(tracker.entries_file.read_text())[0]
+        assert list(saved_pos) == [f.name for f in fields(Position)]
+        assert list(saved_entry) == [f.name for f in fields(PositionEntry)]
+
     def test_from_dict_round_trip(self, tracker):
         """to_dict() → from_dict() 왕복 시 데이터 무결성 유지"""
         original = tracker.open_position("SPY", 1, "SHORT", 100.0, 2.5, 40)
@@ -349,6 +428,89 @@ class TestPersistence:
         assert summary["open_positions"] == 1
         assert summary["closed_positions"] == 1
 
+    def test_summary_aggregates(self, tracker):
+        """승률·총손익·평균 R 집계 (오픈 포지션은 손익 집계 제외)"""
+        win = tracker.open_position("SPY", 1, "LONG", 100.0, 2.5, 10)
+        loss = tracker.open_position("QQQ", 1, "LONG", 200.0, 5.0, 10)
+        tracker.open_position("IWM", 1, "LONG", 50.0, 1.0, 10)
+        tracker.close_position(win.position_id, 110.0)  # +100, +2R
+        tracker.close_position(loss.position_id, 190.0)  # -100, -1R
+
+        summary = tracker.get_summary()
+        assert summary["total_positions"] == 3
+        assert summary["open_positions"] == 1
+        assert summary["closed_positions"] == 2
+        assert summary["total_pnl"] == 0.0
+        assert summary["winning_trades"] == 1
+        assert summary["win_rate"] == 0.5
+        assert summary["avg_r_multiple"] == 0.5
+
+    def test_summary_empty(self, tracker):
+        summary = tracker.get_summary()
+        assert summary["total_positions"] == 0
+        assert summary["win_rate"] == 0
+        assert summary["avg_r_multiple"] == 0
+
+    def test_load_reuses_cache_until_file_changes(self, tracker):
+        """파일이 바뀌지 않으면 재파싱하지 않고, 다른 인스턴스가 쓰면 다시 읽음"""
+        from unittest.mock import patch
+
+        tracker.open_position("SPY", 1, "LONG", 100.0, 2.5, 40)
+        with patch("src.position_tracker.safe_load_json", wraps=safe_load_json) as spy:
+            tracker.get_open_positions()
+            tracker.get_open_positions()
+            assert spy.call_count == 0
+
+            other = PositionTracker(base_dir=str(tracker.base_dir))
+            other.open_position("QQQ", 1, "LONG", 200.0, 3.0, 30)
+            assert {p.symbol for p in tracker.get_open_positions()} == {"SPY", "QQQ"}
+            assert spy.call_count > 0
+
+    def test_id_lookups_use_index(self, tracker):
+        """get_position/get_entries/add_pyramid/close_position는 id 인덱스로 조회"""
+        spy = tracker.open_position("SPY", 1, "LONG", 100.0, 2.5, 40)
+        qqq = tracker.open_position("QQQ", 2, "SHORT", 200.0, 3.0, 30)
+        tracker.add_pyramid(spy.position_id, 101.25, 2.5, 40)
+
+        assert tracker.get_position(qqq.position_id).symbol == "QQQ"
+        assert tracker.get_position("missing") is None
+        assert [e.pyramid_level for e in tracker.get_entries(spy.position_id)] == [0, 1]
+        assert tracker.get_entries("missing") == []
+        assert tracker.add_pyramid("missing", 1.0, 1.0, 1) is None
+
+        closed = tracker.close_position(qqq.position_id, 190.0)
+        assert closed.status == "closed"
+        assert tracker.close_position(qqq.position_id, 190.0) is None
+        assert tracker.add_pyramid(qqq.position_id, 180.0, 3.0, 30) is None
+
+    def test_cached_positions_are_copies(self, tracker):
+        """반환된 포지션을 수정해도 캐시에 반영되지 않음"""
+        pos = tracker.open_position("SPY", 1, "LONG", 100.0, 2.5, 40)
+        pos.stop_loss = 0.0
+        loaded = tracker.get_position(pos.position_id)
+        loaded.units = 99
+        again = tracker.get_position(pos.position_id)
+        assert again.stop_loss == 95.0
+        assert again.units == 1
+
+
+class TestImportCost:
+    def test_module_import_does_not_load_pandas_or_numpy(self):
+        """모듈 로드만으로 pandas/numpy를 import하지 않음 (numpy는 check_stop_loss에서 지연 import)"""
+        import subprocess
+        import sys
+        from pathlib import Path
+
+        code = "import sys, src.position_tracker; print('pandas' in sys.modules, 'numpy' in sys.modules)"
+        out = subprocess.run(
+            [sys.executable, "-c", code],
+            cwd=Path(__file__).resolve().parent.parent,
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.split()
+        assert out == ["False", "False"]
+
 
 class TestEntryReason:
     def test_entry_reason_serialization(self, tracker):
@@ -8,6 +8,8 @@ pyramid_manager.py 단위 테스트
 
 from datetime import datetime
 
+import pytest
+
 from src.pyramid_manager import PyramidEntry, PyramidManager, PyramidPosition
 from src.types import Direction
 
@@ -39,6 +41,22 @@ class TestPyramidPosition:
         assert entry.entry_number == 1
         assert entry.stop_price == 95.0  # 100 - 2*2.5
 
+    def test_cached_aggregates_match_entries(self):
+        """증분 갱신한 total_units/average_entry_price가 entries 재계산 값과 일치"""
+        pos = PyramidPosition(symbol="SPY", direction=Direction.LONG)
+        for price, units in [(100.0, 2), (101.25, 3), (102.5, 1)]:
+            pos.add_entry(datetime.now(), price, units, 2.5)
+
+        assert pos.total_units == sum(e.units for e in pos.entries)
+        expected = sum(e.entry_price * e.units for e in pos.entries) / pos.total_units
+        assert pos.average_entry_price == expected
+
+        # entries를 직접 넘겨 생성해도 집계가 초기화됨
+        clone = PyramidPosition(symbol="SPY", direction=Direction.LONG, entries=list(pos.entries))
+        assert clone.total_units == pos.total_units
+        assert clone.average_entry_price == pos.average_entry_price
+        assert clone == pos
+
     def test_max_units_default(self):
         pos = PyramidPosition(symbol="SPY", direction=Direction.LONG)
         assert pos.max_units == 4
@@ -131,6 +149,18 @@ class TestPyramidPosition:
         can, msg = pos.can_pyramid(98.75, 2.5)  # Exactly 0.5N down
         assert can
 
+    @pytest.mark.parametrize("direction", [Direction.LONG, Direction.SHORT])
+    @pytest.mark.parametrize("offset", [-1.0, -0.75, 0.0, 1.25, 2.0])
+    def test_pyramid_ready_matches_can_pyramid(self, direction, offset):
+        """사유 문자열 없는 판정이 can_pyramid와 동일 (경계값 포함)"""
+        pos = PyramidPosition(symbol="SPY", direction=direction, max_units=3)
+        assert pos.pyramid_ready(100.0, 2.5) is pos.can_pyramid(100.0, 2.5)[0]
+        for i in range(3):
+            price = 100.0 + offset if direction == Direction.LONG else 100.0 - offset
+            assert pos.pyramid_ready(price, 2.5) is pos.can_pyramid(price, 2.5)[0]
+            pos.add_entry(datetime.now(), 100.0 + i, 1, 2.5)
+        assert pos.pyramid_ready(1e9, 2.5) is False
+
     def test_can_pyramid_when_full(self):
         pos = PyramidPosition(symbol="SPY", direction=Direction.LONG, max_units=2)
         pos.add_entry(datetime.now(), 100.0, 1, 2.5)
@@ -2,6 +2,7 @@
 에러 처리 & 복원력 테스트
 - retry_async / retry_sync 데코레이터
 - NotificationManager 에스컬레이션 및 병렬 전송
+- CircuitBreaker 및 채널별 서킷 차단
 - setup_structured_logging 구조화 로깅
 """
 
@@ -18,7 +19,7 @@ from src.notifier import (
     NotificationManager,
     NotificationMessage,
 )
-from src.utils import retry_async, retry_sync, setup_structured_logging
+from src.utils import CircuitBreaker, backoff_schedule, retry_async, retry_sync, setup_structured_logging
 
 # ---------------------------------------------------------------------------
 # Helpers
@@ -66,6 +67,18 @@ class TestRetryAsync:
         assert result == "recovered"
         assert call_count == 3
 
+    def test_on_retry_called_only_before_each_retry(self):
+        """on_retry는 재시도 직전에만 호출 (최종 실패에는 호출되지 않음)"""
+        seen = []
+
+        @retry_async(max_retries=2, base_delay=0.0, on_retry=lambda args, e: seen.append((args, str(e))))
+        async def always_fails(x):
+            raise RuntimeError(f"fail-{x}")
+
+        with pytest.raises(RuntimeError):
+            run_async(always_fails(7))
+        assert seen == [((7,), "fail-7"), ((7,), "fail-7")]
+
     def test_raises_after_max_retries(self):
         """최대 재시도 소진 후 예외 발생"""
         call_count = 0
@@ -98,6 +111,65 @@ class TestRetryAsync:
         # 지연: 1.0, 2.0, 4.0
         assert delays == [1.0, 2.0, 4.0]
 
+    def test_jitter_spreads_delay_within_bounds(self):
+        """jitter=0.5 → 각 지연이 기본 백오프의 ±50% 범위 내"""
+
+        @retry_async(max_retries=3, base_delay=1.0, max_delay=30.0, jitter=0.5)
+        async def always_fails():
+            raise RuntimeError("오류")
+
+        async def run():
+            with patch("asyncio.sleep", new_callable=AsyncMock) as mock_sleep:
+                with pytest.raises(RuntimeError):
+                    await always_fails()
+                return [c.args[0] for c in mock_sleep.call_args_list]
+
+        delays = run_async(run())
+        for delay, base in zip(delays, [1.0, 2.0, 4.0]):
+            assert base * 0.5 <= delay <= base * 1.5
+
+    def test_full_jitter_draws_from_zero_to_capped_backoff(self):
+        """full_jitter=True → 지연이 0 ~ min(max_delay, base * 2^attempt) 구간에서 추출"""
+
+        @retry_async(max_retries=4, base_delay=1.0, max_delay=5.0, full_jitter=True)
+        async def always_fails():
+            raise RuntimeError("오류")
+
+        async def run():
+            with (
+                patch("asyncio.sleep", new_callable=AsyncMock) as mock_sleep,
+                patch("src.utils.random.uniform", side_effect=lambda lo, hi: hi) as mock_uniform,
+            ):
+                with pytest.raises(RuntimeError):
+                    await always_fails()
+                return [c.args[0] for c in mock_sleep.call_args_list], mock_uniform.call_args_list
+
+        delays, uniform_calls = run_async(run())
+        assert delays == [1.0, 2.0, 4.0, 5.0]
+        assert all(c.args[0] == 0 for c in uniform_calls)
+
+    def test_retry_after_overrides_backoff(self):
+        """예외의 retry_after 값이 지수 백오프 대신 사용됨 (max_delay 상한)"""
+
+        class ThrottledError(Exception):
+            def __init__(self, retry_after):
+                super().__init__("throttled")
+                self.retry_after = retry_after
+
+        errors = iter([ThrottledError(5.0), ThrottledError(120.0), ThrottledError(1.0)])
+
+        @retry_async(max_retries=2, base_delay=1.0, max_delay=30.0)
+        async def throttled():
+            raise next(errors)
+
+        async def run():
+            with patch("asyncio.sleep", new_callable=AsyncMock) as mock_sleep:
+                with pytest.raises(ThrottledError):
+                    await throttled()
+                return [c.args[0] for c in mock_sleep.call_args_list]
+
+        assert run_async(run()) == [5.0, 30.0]
+
     def test_specific_exception_filter(self):
         """지정된 예외 타입만 재시도, 나머지는 즉시 전파"""
         call_count = 0
@@ -296,6 +368,201 @@ class TestNotificationEscalation:
         assert ChannelFirst.call_count == 1
         assert ChannelSecond.call_count == 0
 
+    def test_info_hedges_to_next_channel_when_first_is_slow(self):
+        """앞 채널이 지연되면 다음 채널을 병행 시도하고, 성공 시 느린 채널은 취소 (건강 지표 미반영)"""
+        cancelled = asyncio.Event()
+
+        class SlowChannel(NotificationChannel):
+            async def send(self, message):
+                try:
+                    await asyncio.sleep(30)
+                except asyncio.CancelledError:
+                    cancelled.set()
+                    raise
+                return True
+
+        class FastChannel(NotificationChannel):
+            async def send(self, message):
+                return True
+
+        manager = self._make_manager([SlowChannel(), FastChannel()])
+        msg = NotificationMessage(title="정보", body="body", level=NotificationLevel.INFO)
+
+        with patch("src.notifier._ESCALATION_HEDGE_DELAY", 0.01):
+            results = run_async(asyncio.wait_for(manager.send_with_escalation(msg), timeout=2))
+
+        assert results == {"FastChannel": True}
+        assert cancelled.is_set()
+        assert manager.get_channel_health()["SlowChannel"] == {"success": 0, "failure": 0}
+        assert manager.get_channel_health()["FastChannel"]["success"] == 1
+
+    def test_info_falls_back_immediately_on_failure_or_exception(self):
+        """앞 채널이 실패/예외면 지연 대기 없이 다음 채널로 넘어감"""
+
+        class BrokenChannel(NotificationChannel):
+            async def send(self, message):
+                raise RuntimeError("boom")
+
+        failing = FakeChannel("fail", should_succeed=False)
+        ok = FakeChannel("ok", should_succeed=True)
+        manager = self._make_manager([BrokenChannel(), failing, ok])
+        msg = NotificationMessage(title="경고", body="body", level=NotificationLevel.WARNING)
+
+        with patch("src.notifier._ESCALATION_HEDGE_DELAY", 60):
+            results = run_async(asyncio.wait_for(manager.send_with_escalation(msg), timeout=2))
+
+        assert results == {"FakeChannel": True}
+        assert failing.call_count == 1
+        assert ok.call_count == 1
+        assert manager.get_channel_health()["BrokenChannel"]["failure"] == 1
+
+
+# ---------------------------------------------------------------------------
+# TestCircuitBreaker
+# ---------------------------------------------------------------------------
+
+
+class TestCircuitBreaker:
+    def test_opens_after_consecutive_failures(self):
+        breaker = CircuitBreaker(name="ch", failure_threshold=3, open_duration=60.0)
+        for _ in range(2):
+            breaker.record_failure()
+        assert breaker.state == CircuitBreaker.CLOSED
+        breaker.record_success()  # 성공 시 연속 실패 카운트 리셋
+        for _ in range(3):
+            assert breaker.allow() is True
+            breaker.record_failure()
+        assert breaker.state == CircuitBreaker.OPEN
+        assert breaker.allow() is False
+
+    def test_half_open_probe_closes_or_reopens(self):
+        breaker = CircuitBreaker(name="ch", failure_threshold=1, open_duration=60.0, half_open_probes=1)
+        with patch("src.utils.time.monotonic", return_value=1000.0):
+            breaker.record_failure()
+        with patch("src.utils.time.monotonic", return_value=1061.0):
+            assert breaker.state == CircuitBreaker.HALF_OPEN
+            assert breaker.allow() is True
+            assert breaker.allow() is False  # 시험 호출은 1개만
+            breaker.record_failure()
+            assert breaker.state == CircuitBreaker.OPEN
+        with patch("src.utils.time.monotonic", return_value=1122.0):
+            assert breaker.allow() is True
+            breaker.record_success()
+        assert breaker.state == CircuitBreaker.CLOSED
+
+    def test_release_probe_frees_half_open_slot(self):
+        breaker = CircuitBreaker(name="ch", failure_threshold=1, open_duration=60.0, half_open_probes=1)
+        with patch("src.utils.time.monotonic", return_value=1000.0):
+            breaker.record_failure()
+        with patch("src.utils.time.monotonic", return_value=1061.0):
+            assert breaker.allow() is True
+            breaker.release_probe()
+            assert breaker.state == CircuitBreaker.HALF_OPEN
+            assert breaker.allow() is True
+
+    def test_cancelled_half_open_probe_does_not_wedge_breaker(self):
+        """헤지에서 진 half-open 시험 호출이 취소돼도 이후 전송은 채널에 도달"""
+        calls = 0
+        slow = True
+
+        class RecoveringChannel(NotificationChannel):
+            async def send(self, message):
+                nonlocal calls
+                calls += 1
+                if slow:
+                    await asyncio.sleep(30)
+                return True
+
+        class FastChannel(NotificationChannel):
+            async def send(self, message):
+                return True
+
+        recovering = RecoveringChannel()
+        manager = NotificationManager()
+        manager.add_channel(recovering)
+        manager.add_channel(FastChannel())
+        # open_duration=0: 실패 직후 바로 HALF_OPEN (이벤트 루프 시계를 패치하지 않기 위함)
+        breaker = CircuitBreaker(name="RecoveringChannel", failure_threshold=1, open_duration=0.0)
+        manager._breakers[recovering] = breaker
+        breaker.record_failure()
+        assert breaker.state == CircuitBreaker.HALF_OPEN
+
+        info = NotificationMessage(title="정보", body="body", level=NotificationLevel.INFO)
+        with patch("src.notifier._ESCALATION_HEDGE_DELAY", 0.01):
+            results = run_async(asyncio.wait_for(manager.send_with_escalation(info), timeout=2))
+        assert results == {"FastChannel": True}
+        assert calls == 1
+        assert breaker.state == CircuitBreaker.HALF_OPEN
+
+        slow = False
+        signal = NotificationMessage(title="시그널", body="본문", level=NotificationLevel.SIGNAL)
+        results = run_async(asyncio.wait_for(manager.send_all(signal), timeout=2))
+
+        assert calls == 2
+        assert results["RecoveringChannel"] is True
+        assert breaker.state == CircuitBreaker.CLOSED
+
+    def test_manager_skips_channel_with_open_circuit(self):
+        failing = FakeChannel("down", should_succeed=False)
+        manager = NotificationManager()
+        manager.add_channel(failing)
+        msg = NotificationMessage(title="시그널", body="본문", level=NotificationLevel.SIGNAL)
+
+        for _ in range(5):
+            run_async(manager.send_all(msg))
+        assert failing.call_count == 5
+
+        results = run_async(manager.send_all(msg))
+        assert failing.call_count == 5  # 서킷 OPEN — send 미호출
+        assert results == {"FakeChannel": False}
+        assert manager.get_channel_health()["FakeChannel"]["failure"] == 6
+
+    def test_manager_counts_exceptions_as_failures(self):
+        class RaisingChannel(NotificationChannel):
+            async def send(self, message):
+                raise RuntimeError("boom")
+
+        channel = RaisingChannel()
+        manager = NotificationManager()
+        manager.add_channel(channel)
+        msg = NotificationMessage(title="시그널", body="본문", level=NotificationLevel.SIGNAL)
+        for _ in range(5):
+            run_async(manager.send_all(msg))
+        assert manager._breakers[channel].state == CircuitBreaker.OPEN
+
+
+class TestDispatchConcurrency:
+    def test_concurrent_sends_are_bounded(self):
+        """동시 send_all 30건이어도 채널 전송은 상한(10)개까지만 동시에 진행"""
+        in_flight = 0
+        peak = 0
+
+        class SlowChannel(NotificationChannel):
+            async def send(self, message):
+                nonlocal in_flight, peak
+                in_flight += 1
+                peak = max(peak, in_flight)
+                await asyncio.sleep(0.01)
+                in_flight -= 1
+                return True
+
+        manager = NotificationManager()
+        manager.add_channel(SlowChannel())
+        msg = NotificationMessage(title="시그널", body="본문", level=NotificationLevel.SIGNAL)
+
+        async def burst():
+            return await asyncio.gather(*(manager.send_all(msg) for _ in range(30)))
+
+        results = run_async(burst())
+        assert all(r == {"SlowChannel": True} for r in results)
+        assert peak == 10
+
+    def test_limit_grows_with_channel_count(self):
+        manager = NotificationManager()
+        for _ in range(6):
+            manager.add_channel(FakeChannel("ch"))
+        assert manager._dispatch_limit == 12
+
 
 # ---------------------------------------------------------------------------
 # TestRetrySync
@@ -342,6 +609,10 @@ class TestRetrySync:
 
         assert delays == [1.0, 2.0, 4.0]
 
+    def test_backoff_schedule_caps_at_max_delay(self):
+        assert backoff_schedule(6, 1.5, 20.0) == (1.5, 3.0, 6.0, 12.0, 20.0, 20.0)
+        assert backoff_schedule(0, 1.0, 30.0) == ()
+
 
 # ---------------------------------------------------------------------------
 # TestStructuredLogging
@@ -396,6 +667,22 @@ class TestStructuredLogging:
             h.close()
             log.removeHandler(h)
 
+    def test_repeated_call_does_not_build_new_handlers(self, tmp_path):
+        """재호출 시 파일 핸들러를 새로 열지 않고 기존 핸들러 유지"""
+        import logging.handlers as lh
+
+        log_dir = str(tmp_path / "logs")
+        log = setup_structured_logging("test_reuse", log_dir=log_dir)
+        handlers = list(log.handlers)
+        with patch.object(lh, "TimedRotatingFileHandler") as mock_handler:
+            again = setup_structured_logging("test_reuse", log_dir=log_dir, level=logging.DEBUG)
+        mock_handler.assert_not_called()
+        assert again.handlers == handlers
+        assert again.level == logging.DEBUG
+        for h in log.handlers[:]:
+            h.close()
+            log.removeHandler(h)
+
     def test_no_duplicate_handlers_on_repeated_call(self, tmp_path):
         """같은 이름으로 두 번 호출해도 핸들러가 중복되지 않음"""
         log_dir = str(tmp_path / "logs")
@@ -29,6 +29,27 @@ def risk_manager():
     return PortfolioRiskManager(symbol_groups=symbol_groups)
 
 
+class TestUnitCounters:
+    def test_checks_do_not_create_counter_keys(self, risk_manager):
+        """can_add_position 조회는 defaultdict에 키를 만들지 않음"""
+        risk_manager.can_add_position("SPY", 1, 1.0, Direction.LONG)
+        assert dict(risk_manager.state.units_by_symbol) == {}
+        assert dict(risk_manager.state.units_by_group) == {}
+
+    def test_add_accumulates_per_symbol_and_group(self, risk_manager):
+        risk_manager.add_position("SPY", 1, 1.0, Direction.LONG)
+        risk_manager.add_position("QQQ", 2, 1.0, Direction.LONG)
+        risk_manager.add_position("SPY", 1, 1.0, Direction.LONG)
+        assert dict(risk_manager.state.units_by_symbol) == {"SPY": 2, "QQQ": 2}
+        assert dict(risk_manager.state.units_by_group) == {AssetGroup.US_EQUITY: 4}
+
+    def test_unmapped_symbol_counts_toward_default_group(self, risk_manager):
+        risk_manager.add_position("UNKNOWN", 2, 1.0, Direction.LONG)
+        assert risk_manager.state.units_by_group[AssetGroup.US_EQUITY] == 2
+        risk_manager.remove_position("UNKNOWN", 2, Direction.LONG, 1.0)
+        assert risk_manager.state.units_by_group[AssetGroup.US_EQUITY] == 0
+
+
 class TestSingleMarketLimit:
     """단일 종목: 4 Units"""
 
@@ -71,6 +71,11 @@ class TestDryRunEnforcement:
             result = enforce_dry_run(is_live=True, env_var="CUSTOM_VAR")
             assert result is False
 
+    def test_explicit_env_mapping(self):
+        """전달된 env 매핑을 os.environ 대신 사용"""
+        with patch.dict(os.environ, {"TURTLE_ALLOW_LIVE": "false"}):
+            assert enforce_dry_run(is_live=True, env={"TURTLE_ALLOW_LIVE": "true"}) is True
+
 
 class TestEnvFilePermissions:
     """환경파일 권한 검사 테스트"""
@@ -213,6 +218,13 @@ class TestCredentialValidation:
             assert all_valid is True
             assert missing == []
 
+    def test_explicit_env_mapping(self):
+        """전달된 env 매핑을 os.environ 대신 사용"""
+        with patch.dict(os.environ, {}, clear=True):
+            all_valid, missing = validate_credentials(["API_KEY", "SECRET"], env={"API_KEY": "k"})
+            assert all_valid is False
+            assert missing == ["SECRET"]
+
 
 class TestMaskCredential:
     """자격증명 마스킹 테스트"""
@@ -258,6 +270,11 @@ class TestMaskCredential:
         result = mask_credential(long_cred, visible_chars=4)
         assert result == "aaaa" + "*" * 96
 
+    def test_longer_than_any_fixed_buffer(self):
+        """길이 제한 없이 마스킹"""
+        result = mask_credential("k" * 1000, visible_chars=4)
+        assert result == "kkkk" + "*" * 996
+
     def test_special_characters(self):
         """특수 문자 포함"""
         result = mask_credential("abc$%^&secret")
@@ -60,6 +60,13 @@ class TestSerializableEnum:
             assert issubclass(enum_cls, SerializableEnum)
             assert issubclass(enum_cls, str)
 
+    def test_eq_and_hash_use_str_implementation(self):
+        """비교/해시는 Python 레벨 Enum 메서드가 아닌 str 구현 사용."""
+        for enum_cls in [Direction, SignalType, AssetGroup, OrderStatus, MarketRegime]:
+            assert enum_cls.__eq__ is str.__eq__
+            assert enum_cls.__hash__ is str.__hash__
+        assert {AssetGroup.CRYPTO: 1}["crypto"] == 1
+
 
 class TestDirection:
     def test_values(self):
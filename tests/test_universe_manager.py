@@ -11,6 +11,7 @@ import os
 import tempfile
 from pathlib import Path
 
+import src.universe_manager as universe_manager
 from src.types import AssetGroup
 from src.universe_manager import Asset, UniverseManager
 
@@ -46,6 +47,10 @@ class TestAsset:
         asset = Asset("SPY", "S&P 500", "US", "ETF", AssetGroup.US_EQUITY, enabled=False)
         assert not asset.enabled
 
+    def test_asset_uses_slots(self):
+        asset = Asset("SPY", "S&P 500", "US", "ETF", AssetGroup.US_EQUITY)
+        assert not hasattr(asset, "__dict__")
+
 
 class TestDefaultLoading:
     def test_loads_defaults_no_file(self):
@@ -199,6 +204,39 @@ other_key: value
             assert len(symbols) > 5
 
 
+class TestYAMLCache:
+    """파싱된 YAML 프로세스 내 캐시"""
+
+    def _write(self, path, symbols):
+        lines = ["symbols:", "  us_equity:"]
+        lines += [f"    - {{symbol: {sym}, group: us_equity}}" for sym in symbols]
+        path.write_text("\n".join(lines) + "\n")
+
+    def test_unchanged_file_parsed_once(self, tmp_path, monkeypatch):
+        path = tmp_path / "universe.yaml"
+        self._write(path, ["SPY", "QQQ"])
+        calls = []
+        real_load = universe_manager.yaml.load
+
+        def counting_load(*args, **kwargs):
+            calls.append(1)
+            return real_load(*args, **kwargs)
+
+        monkeypatch.setattr(universe_manager.yaml, "load", counting_load)
+        first = UniverseManager(yaml_path=str(path))
+        second = UniverseManager(yaml_path=str(path))
+        assert len(calls) == 1
+        assert first.get_enabled_symbols() == second.get_enabled_symbols() == ["SPY", "QQQ"]
+        assert first.assets["SPY"] is not second.assets["SPY"]
+
+    def test_modified_file_reparsed(self, tmp_path):
+        path = tmp_path / "universe.yaml"
+        self._write(path, ["SPY"])
+        assert UniverseManager(yaml_path=str(path)).get_enabled_symbols() == ["SPY"]
+        self._write(path, ["SPY", "TLT"])
+        assert UniverseManager(yaml_path=str(path)).get_enabled_symbols() == ["SPY", "TLT"]
+
+
 class TestCSVLoading:
     def test_load_from_csv(self):
         csv_content = "Ticker,Name,Country,Type\nAAPL,Apple,US,Stock\nMSFT,Microsoft,US,Stock\n"
@@ -225,6 +263,16 @@ class TestCSVLoading:
             finally:
                 os.unlink(f.name)
 
+    def test_csv_fields_stripped_and_defaulted(self, tmp_path):
+        path = tmp_path / "universe.csv"
+        path.write_text("\ufeffTicker,Name\n 005930.KS , Samsung \n", encoding="utf-8")
+        um = UniverseManager(csv_path=str(path))
+        asset = um.assets["005930.KS"]
+        assert asset.name == "Samsung"
+        assert asset.country == "US"
+        assert asset.asset_type == ""
+        assert asset.currency == "KRW"
+
 
 class TestGetEnabledSymbols:
     def test_all_defaults_enabled(self):
@@ -556,6 +604,39 @@ class TestUniverseExpansion:
         assert actual_us_tech == expected_us_tech, f"Unexpected US_TECH symbols: {actual_us_tech - expected_us_tech}"
 
 
+class TestLookupCache:
+    """조회 인덱스 캐시"""
+
+    def test_cached_results_match_assets(self):
+        um = UniverseManager()
+        assert um.get_enabled_symbols() == [s for s, a in um.assets.items() if a.enabled]
+        assert um.get_symbols_by_group(AssetGroup.US_EQUITY) == [
+            s for s, a in um.assets.items() if a.group == AssetGroup.US_EQUITY and a.enabled
+        ]
+        assert um.get_group_mapping() == {s: a.group for s, a in um.assets.items()}
+
+    def test_returned_lists_are_copies(self):
+        um = UniverseManager()
+        symbols = um.get_enabled_symbols()
+        symbols.append("ZZZ")
+        um.get_group_mapping()["ZZZ"] = AssetGroup.US_EQUITY
+        assert "ZZZ" not in um.get_enabled_symbols()
+        assert "ZZZ" not in um.get_group_mapping()
+
+    def test_invalidate_cache_reflects_changes(self):
+        um = UniverseManager()
+        um.assets["SPY"].enabled = False
+        um._invalidate_cache()
+        assert "SPY" not in um.get_enabled_symbols()
+        assert "SPY" not in um.get_symbols_by_group(AssetGroup.US_EQUITY)
+
+    def test_unknown_group_returns_empty(self):
+        um = UniverseManager()
+        um.assets = {}
+        um._invalidate_cache()
+        assert um.get_symbols_by_group(AssetGroup.US_EQUITY) == []
+
+
 class TestCurrencyField:
     """currency 필드 및 통화별 필터링 테스트"""
 
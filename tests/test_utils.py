@@ -5,18 +5,27 @@ utils.py 단위 테스트
 - 스키마 검증
 - safe_load_json (corrupt 파일 대응)
 - 심볼 입력 검증
+- AsyncTokenBucket 레이트 리미터
+- json_loads / json_dumps (orjson 선택 사용)
 """
 
+import asyncio
 import json
+import os
 import shutil
 import tempfile
 from pathlib import Path
+from unittest.mock import AsyncMock, patch
 
 import pytest
 
 from src.utils import (
+    AsyncTokenBucket,
     atomic_write_json,
     backup_file,
+    json_dumps,
+    json_loads,
+    prune_backups,
     safe_load_json,
     validate_position_schema,
     validate_symbol,
@@ -30,7 +39,61 @@ def temp_dir():
     shutil.rmtree(tmpdir)
 
 
+@pytest.fixture(params=["orjson", "stdlib"])
+def json_backend(request):
+    """orjson 설치/미설치 두 경우 모두에서 동일 동작 검증"""
+    if request.param == "orjson":
+        module = pytest.importorskip("orjson")
+    else:
+        module = None
+    with patch("src.utils.orjson", module):
+        yield request.param
+
+
+@pytest.mark.usefixtures("json_backend")
 class TestAtomicWriteJson:
+    def test_non_finite_floats_round_trip(self, temp_dir):
+        """NaN/Inf는 백엔드와 무관하게 null이 아닌 값 그대로 복원"""
+        import math
+
+        filepath = temp_dir / "nan.json"
+        atomic_write_json(filepath, [{"pnl": float("nan"), "stop_loss": float("inf")}])
+        loaded = safe_load_json(filepath)
+        assert math.isnan(loaded[0]["pnl"])
+        assert loaded[0]["stop_loss"] == float("inf")
+
+    def test_datetime_rejected(self, temp_dir):
+        """datetime은 백엔드와 무관하게 TypeError (호출자가 isoformat 변환)"""
+        from datetime import datetime
+
+        filepath = temp_dir / "dt.json"
+        with pytest.raises(TypeError):
+            atomic_write_json(filepath, {"at": datetime(2025, 1, 1)})
+        assert not filepath.exists()
+
+    def test_fsync_before_replace(self, temp_dir):
+        """교체 전에 임시 파일 내용을 디스크에 동기화"""
+        filepath = temp_dir / "durable.json"
+        calls = []
+        real_fsync, real_replace = os.fsync, os.replace
+        with (
+            patch("src.utils.os.fsync", side_effect=lambda fd: (calls.append("fsync"), real_fsync(fd))),
+            patch("src.utils.os.replace", side_effect=lambda a, b: (calls.append("replace"), real_replace(a, b))),
+        ):
+            atomic_write_json(filepath, {"a": 1})
+        assert calls == ["fsync", "replace"]
+        assert json.loads(filepath.read_text()) == {"a": 1}
+        assert list(temp_dir.glob("*.tmp")) == []
+
+    def test_unserializable_data_leaves_target_untouched(self, temp_dir):
+        """직렬화 실패 시 기존 파일 유지, 임시 파일 없음"""
+        filepath = temp_dir / "keep.json"
+        atomic_write_json(filepath, {"a": 1})
+        with pytest.raises(TypeError):
+            atomic_write_json(filepath, {"a": object()})
+        assert json.loads(filepath.read_text()) == {"a": 1}
+        assert list(temp_dir.glob("*.tmp")) == []
+
     def test_basic_write(self, temp_dir):
         filepath = temp_dir / "test.json"
         data = {"key": "value", "number": 42}
@@ -78,6 +141,13 @@ class TestAtomicWriteJson:
         atomic_write_json(filepath, {"key": "value"})
         assert Path(filepath).exists()
 
+    def test_output_format_matches_stdlib(self, temp_dir):
+        """백엔드와 무관하게 indent=2, 비ASCII 그대로"""
+        filepath = temp_dir / "fmt.json"
+        data = [{"symbol": "005930", "name": "삼성전자", "units": 2, "pnl": None}]
+        atomic_write_json(filepath, data)
+        assert filepath.read_text(encoding="utf-8") == json.dumps(data, ensure_ascii=False, indent=2)
+
 
 class TestBackupFile:
     def test_backup_creates_file(self, temp_dir):
@@ -125,6 +195,56 @@ class TestBackupFile:
         backups = list(backup_dir.glob("data_*.json"))
         assert len(backups) <= 3
 
+    def test_existing_daily_backup_not_recopied(self, temp_dir):
+        """당일 백업이 이미 있으면 재복사하지 않음"""
+        source = temp_dir / "data.json"
+        source.write_text('{"key": "first"}')
+        backup_file(source)
+        source.write_text('{"key": "second"}')
+
+        backup_file(source)
+
+        backups = list((temp_dir / "backups").glob("data_*.json"))
+        assert [b.read_text() for b in backups] == ['{"key": "first"}']
+
+    def test_prunes_when_max_backups_shrinks_with_existing_daily_backup(self, temp_dir):
+        """당일 백업이 이미 있어도 줄어든 max_backups에 맞게 정리"""
+        source = temp_dir / "data.json"
+        source.write_text("{}")
+        backup_dir = temp_dir / "backups"
+        backup_dir.mkdir()
+        for day in range(1, 6):
+            (backup_dir / f"data_2000010{day}.json").write_text("{}")
+        backup_file(source, max_backups=7)
+        assert len(list(backup_dir.glob("data_*.json"))) == 6
+
+        backup_file(source, max_backups=2)
+
+        remaining = sorted(p.name for p in backup_dir.glob("data_*.json"))
+        assert len(remaining) == 2
+        assert remaining[0] == "data_20000105.json"
+
+    def test_prune_backups_keeps_newest_matching(self, temp_dir):
+        backup_dir = temp_dir / "backups"
+        backup_dir.mkdir()
+        for day in range(1, 6):
+            (backup_dir / f"data_2025010{day}.json").write_text("{}")
+        (backup_dir / "other_20250101.json").write_text("{}")
+
+        prune_backups(backup_dir, "data", ".json", max_backups=2)
+
+        remaining = sorted(p.name for p in backup_dir.iterdir())
+        assert remaining == ["data_20250104.json", "data_20250105.json", "other_20250101.json"]
+
+    def test_accepts_str_path(self, temp_dir):
+        source = temp_dir / "data.json"
+        source.write_text("{}")
+        backup_file(str(source))
+        assert len(list((temp_dir / "backups").glob("data_*.json"))) == 1
+
+    def test_prune_backups_missing_dir(self, temp_dir):
+        prune_backups(temp_dir / "missing", "data", ".json", max_backups=2)  # Should not raise
+
 
 class TestValidatePositionSchema:
     def test_valid_position(self):
@@ -162,6 +282,7 @@ class TestValidatePositionSchema:
         assert validate_position_schema({}, required_fields=[]) is True
 
 
+@pytest.mark.usefixtures("json_backend")
 class TestSafeLoadJson:
     def test_load_valid_json(self, temp_dir):
         filepath = temp_dir / "valid.json"
@@ -210,6 +331,30 @@ class TestSafeLoadJson:
         result = safe_load_json(filepath)
         assert result == backup_data
 
+    def test_restore_prefers_newest_valid_backup(self, temp_dir):
+        """최신 백업이 손상되었으면 그 다음 최신 백업으로 복원"""
+        filepath = temp_dir / "positions.json"
+        filepath.write_text("corrupted content")
+        backup_dir = temp_dir / "backups"
+        backup_dir.mkdir()
+        (backup_dir / "positions_20250101.json").write_text(json.dumps([{"day": 1}]))
+        (backup_dir / "positions_20250102.json").write_text(json.dumps([{"day": 2}]))
+        (backup_dir / "positions_20250103.json").write_text("also corrupted")
+
+        assert safe_load_json(filepath) == [{"day": 2}]
+        assert json.loads(filepath.read_text()) == [{"day": 2}]
+
+    def test_nan_literal_is_not_treated_as_corrupt(self, temp_dir):
+        """표준 json이 쓴 NaN은 orjson이 거부해도 표준 json으로 다시 읽음"""
+        import math
+
+        filepath = temp_dir / "nan.json"
+        filepath.write_text('[{"pnl": NaN}]')
+
+        result = safe_load_json(filepath)
+        assert math.isnan(result[0]["pnl"])
+        assert filepath.read_text() == '[{"pnl": NaN}]'
+
     def test_string_path(self, temp_dir):
         filepath = temp_dir / "test.json"
         filepath.write_text('{"key": "value"}')
@@ -364,3 +509,51 @@ class TestValidateSymbol:
     def test_backtick(self):
         with pytest.raises(ValueError, match="유효하지 않은 심볼"):
             validate_symbol("`ls`")
+
+
+class TestAsyncTokenBucket:
+    async def test_burst_up_to_capacity_without_wait(self):
+        bucket = AsyncTokenBucket(rate=5.0)
+        with patch("src.utils.asyncio.sleep", new_callable=AsyncMock) as mock_sleep:
+            for _ in range(5):
+                await bucket.acquire()
+        mock_sleep.assert_not_awaited()
+
+    async def test_waits_for_refill_when_empty(self):
+        bucket = AsyncTokenBucket(rate=10.0, capacity=1)
+        await bucket.acquire()
+
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        await bucket.acquire()
+        # 1 토큰 보충 = 1/rate = 0.1초
+        assert loop.time() - start >= 0.08
+
+    def test_rejects_non_positive_rate(self):
+        with pytest.raises(ValueError):
+            AsyncTokenBucket(rate=0)
+
+
+class TestJsonHelpers:
+    @pytest.mark.parametrize("use_stdlib", [True, False])
+    def test_round_trip(self, use_stdlib):
+        data = {"rt_cd": "0", "output": {"stck_prpr": "70000", "name": "삼성전자"}, "items": [1, 2.5, None]}
+        if use_stdlib:
+            with patch("src.utils.orjson", None):
+                assert json_loads(json_dumps(data)) == data
+        else:
+            assert json_loads(json_dumps(data)) == data
+
+    def test_loads_accepts_bytes_and_str(self):
+        assert json_loads(b'{"a": 1}') == {"a": 1}
+        assert json_loads('{"a": 1}') == {"a": 1}
+
+    def test_dumps_is_compact_and_keeps_non_ascii(self):
+        with patch("src.utils.orjson", None):
+            out = json_dumps({"a": "한글", "b": [1, 2]})
+        assert out == '{"a":"한글","b":[1,2]}'
+
+    def test_loads_invalid_raises_value_error(self):
+        # aiohttp resp.json() 실패 처리 (ValueError) 와 호환되어야 함
+        with pytest.raises(ValueError):
+            json_loads("{not json")